@@ -20,7 +20,7 @@ from pydantic import BaseModel, Field
 from langchain_core.messages import HumanMessage
 
 from ...database.repositories import Neo4jRepository, get_neo4j_repository
-from ...services.sparky_service import get_sparky_service, SparkyService
+from ...services.sparky_service import get_sparky_service, SparkyService, format_history_timestamp
 from ...core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -154,7 +154,7 @@ async def chat_with_sparky(
         session_id = request.session_id or str(uuid4())
         
         # Get Sparky service
-        sparky_service = get_sparky_service(neo4j_repo)
+        sparky_service = await get_sparky_service(neo4j_repo)
         
         # Process conversation with LLM
         result = await sparky_service.process_conversation(
@@ -241,7 +241,7 @@ async def get_conversation_context(
     - Conversation recovery after interruption
     """
     try:
-        sparky_service = get_sparky_service(neo4j_repo)
+        sparky_service = await get_sparky_service(neo4j_repo)
         context = await sparky_service.get_conversation_context(user_id, session_id)
         
         # Convert conversation history
@@ -250,7 +250,7 @@ async def get_conversation_context(
             history.append(ConversationHistory(
                 sender=msg["sender"],
                 content=msg["content"],
-                timestamp=msg["timestamp"]
+                timestamp=format_history_timestamp(msg["ts"])
             ))
         
         # Convert active requirements
@@ -311,11 +311,12 @@ async def update_user_preferences(
     ```
     """
     try:
-        sparky_service = get_sparky_service(neo4j_repo)
+        sparky_service = await get_sparky_service(neo4j_repo)
         context = await sparky_service.get_conversation_context(user_id, session_id)
         
         if request.preferences:
             context.user_preferences.update(request.preferences)
+            await sparky_service.save_conversation_context(context)
             logger.info(f"Updated preferences for user {user_id}, session {session_id}")
         
         return {"status": "success", "message": "Preferences updated successfully"}
@@ -346,11 +347,8 @@ async def clear_conversation_context(
     - Debugging and testing
     """
     try:
-        sparky_service = get_sparky_service(neo4j_repo)
-        context_key = f"{user_id}:{session_id}"
-        
-        if context_key in sparky_service.conversations:
-            del sparky_service.conversations[context_key]
+        sparky_service = await get_sparky_service(neo4j_repo)
+        if await sparky_service.clear_conversation_context(user_id, session_id):
             logger.info(f"Cleared conversation context for user {user_id}, session {session_id}")
         
         return {"status": "success", "message": "Conversation context cleared"}
@@ -396,7 +394,7 @@ async def get_sparky_status(
     Includes LLM connectivity, Langsmith tracing, and conversation statistics.
     """
     try:
-        sparky_service = get_sparky_service(neo4j_repo)
+        sparky_service = await get_sparky_service(neo4j_repo)
         
         # Check LLM connectivity
         llm_status = "healthy"
@@ -79,6 +79,7 @@ class Settings(BaseSettings):
     REDIS_URL: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
     ENABLE_REDIS_CACHING: bool = Field(default=True, env="ENABLE_REDIS_CACHING")
     CACHE_TTL: int = Field(default=3600, env="CACHE_TTL")
+    SPARKY_REDIS_CONTEXT: bool = Field(default=False, env="SPARKY_REDIS_CONTEXT")
     
     # =============================================================================
     # API CONFIGURATION
@@ -622,13 +622,11 @@ class Neo4jRepository:
         Returns:
             List of result records as dictionaries
         """
-        result = await self.connection.execute_query(
+        # The connection already materializes each record once via record.data()
+        return await self.connection.execute_query(
             query, 
             parameters=parameters or {}
         )
-        
-        # Convert Neo4j records to dictionaries
-        return [dict(record) for record in result]
     
     # =============================================================================
     # VECTOR SEARCH QUERIES
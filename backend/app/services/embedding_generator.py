@@ -9,6 +9,7 @@ Enhanced with domain-specific vocabulary weighting for better product name match
 import json
 import re
 import logging
+import hashlib
 import yaml
 import os
 from typing import Dict, List, Optional, Tuple
@@ -17,6 +18,7 @@ from datetime import datetime
 from html import unescape
 from bs4 import BeautifulSoup
 
+import numpy as np
 import torch
 from sentence_transformers import SentenceTransformer
 
@@ -27,10 +29,11 @@ logger = logging.getLogger(__name__)
 class ProductEmbedding:
     """Product embedding data structure"""
     gin: str
-    embedding: List[float]
+    embedding: np.ndarray  # float32, shape (dimension,); convert with .tolist() at send time
     embedding_text: str
     embedding_model: str
     embedding_created_at: str
+    embedding_text_hash: str = ""
 
 
 class ProductEmbeddingGenerator:
@@ -489,22 +492,23 @@ class ProductEmbeddingGenerator:
                 logger.warning(f"No embedding text generated for product {product.get('gin', 'unknown')}")
                 return None
             
-            # Generate embedding vector
-            embedding_vector = self.model.encode(embedding_text)
-            
-            # Convert to list of floats
-            embedding_list = embedding_vector.tolist()
+            # Generate embedding vector (kept as a dense float32 array)
+            embedding_vector = np.asarray(
+                self.model.encode(embedding_text, convert_to_numpy=True, normalize_embeddings=True),
+                dtype=np.float32
+            )
             
             # Create ProductEmbedding object
             product_embedding = ProductEmbedding(
                 gin=product.get('gin', ''),
-                embedding=embedding_list,
+                embedding=embedding_vector,
                 embedding_text=embedding_text,
                 embedding_model=self.model_name,
-                embedding_created_at=datetime.utcnow().isoformat() + 'Z'
+                embedding_created_at=datetime.utcnow().isoformat() + 'Z',
+                embedding_text_hash=self.embedding_text_hash(embedding_text)
             )
             
-            logger.debug(f"Generated embedding for {product_embedding.gin}: {len(embedding_list)} dimensions")
+            logger.debug(f"Generated embedding for {product_embedding.gin}: {embedding_vector.shape[0]} dimensions")
             
             return product_embedding
             
@@ -512,34 +516,102 @@ class ProductEmbeddingGenerator:
             logger.error(f"Failed to generate embedding for product {product.get('gin', 'unknown')}: {e}")
             return None
     
-    def generate_embeddings_batch(self, products: List[Dict]) -> List[ProductEmbedding]:
+    def embedding_text_hash(self, embedding_text: str) -> str:
         """
-        Generate embeddings for multiple products efficiently.
+        Content hash identifying an embedding by (model, text).
+        
+        Args:
+            embedding_text: Text the embedding is generated from
+            
+        Returns:
+            Hex digest that changes whenever the model or the text changes
+        """
+        return hashlib.blake2b(f"{self.model_name}|{embedding_text}".encode(), digest_size=16).hexdigest()
+    
+    def prepare_embedding_texts(self, products: List[Dict]) -> List[Tuple[str, str]]:
+        """
+        Build embedding texts for multiple products.
         
         Args:
             products: List of product data dictionaries
             
+        Returns:
+            List of (gin, embedding_text) for products that yield a text
+        """
+        items = []
+        for product in products:
+            try:
+                embedding_text = self.generate_embedding_text(product)
+            except Exception as e:
+                logger.error(f"Failed to generate embedding text for product {product.get('gin', 'unknown')}: {e}")
+                continue
+            if not embedding_text:
+                logger.warning(f"No embedding text generated for product {product.get('gin', 'unknown')}")
+                continue
+            items.append((product.get('gin', ''), embedding_text))
+        return items
+    
+    def encode_embedding_texts(self, items: List[Tuple[str, str]], batch_size: int = 64) -> List[ProductEmbedding]:
+        """
+        Encode prepared embedding texts in a single batched model call.
+        
+        Vectors are normalized so the cosine vector index can use inner products.
+        
+        Args:
+            items: List of (gin, embedding_text) from prepare_embedding_texts
+            batch_size: Encoder batch size
+            
         Returns:
             List of ProductEmbedding objects
         """
-        embeddings = []
-        successful = 0
-        failed = 0
+        if not items:
+            return []
         
-        logger.info(f"Generating embeddings for {len(products)} products")
+        try:
+            vectors = self.model.encode(
+                [embedding_text for _, embedding_text in items],
+                batch_size=batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            ).astype(np.float32, copy=False)
+        except Exception as e:
+            logger.error(f"Failed to encode embedding batch: {e}")
+            return []
+        
+        # Each record's embedding is a row view into the contiguous (N, dim) matrix
+        created_at = datetime.utcnow().isoformat() + 'Z'
+        return [
+            ProductEmbedding(
+                gin=gin,
+                embedding=vector,
+                embedding_text=embedding_text,
+                embedding_model=self.model_name,
+                embedding_created_at=created_at,
+                embedding_text_hash=self.embedding_text_hash(embedding_text)
+            )
+            for (gin, embedding_text), vector in zip(items, vectors)
+        ]
+    
+    def generate_embeddings_batch(self, products: List[Dict], batch_size: int = 64) -> List[ProductEmbedding]:
+        """
+        Generate embeddings for multiple products efficiently.
         
-        for i, product in enumerate(products):
-            if i % 10 == 0:
-                logger.info(f"Processing product {i+1}/{len(products)}")
+        Embedding texts are built first and then encoded in a single batched
+        model call.
+        
+        Args:
+            products: List of product data dictionaries
+            batch_size: Encoder batch size
             
-            embedding = self.generate_embedding(product)
-            if embedding:
-                embeddings.append(embedding)
-                successful += 1
-            else:
-                failed += 1
+        Returns:
+            List of ProductEmbedding objects
+        """
+        logger.info(f"Generating embeddings for {len(products)} products")
         
-        logger.info(f"Embedding generation complete: {successful} successful, {failed} failed")
+        embeddings = self.encode_embedding_texts(self.prepare_embedding_texts(products), batch_size)
+        
+        logger.info(f"Embedding generation complete: {len(embeddings)} successful, {len(products) - len(embeddings)} failed")
         
         return embeddings
     
@@ -553,6 +625,22 @@ class ProductEmbeddingGenerator:
         Returns:
             Query embedding vector
         """
+        return self.query_embedding_array(query_text).tolist()
+    
+    def query_embedding_array(self, query_text: str) -> np.ndarray:
+        """
+        Generate a query embedding as a contiguous float32 array.
+        
+        Callers that hand the vector to the Neo4j driver should convert it with
+        .tolist() at the call site; the array form avoids an intermediate list
+        of Python floats when the vector is only used in-process.
+        
+        Args:
+            query_text: Search query text
+            
+        Returns:
+            Query embedding vector of shape (dimension,), dtype float32
+        """
         try:
             # Clean and normalize query text
             cleaned_query = re.sub(r'\s+', ' ', query_text.strip())
@@ -563,10 +651,36 @@ class ProductEmbeddingGenerator:
             logger.debug(f"Enhanced query: '{cleaned_query}' -> '{enhanced_query}'")
             
             # Generate embedding
-            embedding_vector = self.model.encode(enhanced_query)
+            embedding_vector = self.model.encode(enhanced_query, convert_to_numpy=True, normalize_embeddings=True)
             
-            return embedding_vector.tolist()
+            return np.ascontiguousarray(embedding_vector, dtype=np.float32)
             
         except Exception as e:
             logger.error(f"Failed to generate query embedding: {e}")
-            raise
\ No newline at end of file
+            raise
+    
+    def query_embeddings_array(self, query_texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings for several search queries in one batched model call.
+        
+        Args:
+            query_texts: Search query texts
+            
+        Returns:
+            float32 matrix of shape (len(query_texts), dimension)
+        """
+        try:
+            enhanced_queries = [
+                self._enhance_with_domain_vocabulary(re.sub(r'\s+', ' ', query_text.strip()))
+                for query_text in query_texts
+            ]
+            
+            embedding_matrix = self.model.encode(
+                enhanced_queries, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False
+            )
+            
+            return np.ascontiguousarray(embedding_matrix, dtype=np.float32)
+            
+        except Exception as e:
+            logger.error(f"Failed to generate query embeddings: {e}")
+            raise
@@ -11,24 +11,81 @@ This service provides the core AI intelligence for Sparky chatbot:
 """
 
 import os
+import re
 import json
+import time
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from functools import lru_cache
+from typing import Dict, Final, List, Literal, Optional, Any, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
 
+from pydantic import BaseModel, Field
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
 from langsmith import Client
 import openai
 
+try:
+    import msgpack
+    import redis.asyncio as aioredis
+    REDIS_CONTEXT_AVAILABLE = True
+except ImportError:
+    REDIS_CONTEXT_AVAILABLE = False
+
 from ..core.config import settings
 from ..database.repositories import Neo4jRepository
 from ..agents.agent_state import safe_enum_value
 
 logger = logging.getLogger(__name__)
 
+# Fallback responses used when the LLM call or response parsing fails
+_FALLBACK_RESPONSES: Final[Dict[str, str]] = {
+    "en": "I'd be happy to help you with welding equipment recommendations! Please let me know what welding process you need (MIG, TIG, or Stick) and what material you're working with.",
+    "es": "¡Estaré encantado de ayudarte con recomendaciones de equipos de soldadura! Por favor, dime qué proceso de soldadura necesitas (MIG, TIG o Electrodo) y con qué material estás trabajando.",
+    "fr": "Je serais ravi de vous aider avec des recommandations d'équipement de soudage! Veuillez me dire de quel processus de soudage vous avez besoin (MIG, TIG ou Électrode) et avec quel matériau vous travaillez.",
+    "de": "Gerne helfe ich Ihnen bei Empfehlungen für Schweißgeräte! Bitte teilen Sie mir mit, welches Schweißverfahren Sie benötigen (MIG, WIG oder Lichtbogen) und mit welchem Material Sie arbeiten."
+}
+
+# Pre-encoded variants for byte-level consumers (e.g. raw HTTP responses)
+_FALLBACK_RESPONSES_BYTES: Final[Dict[str, bytes]] = {
+    language: text.encode("utf-8") for language, text in _FALLBACK_RESPONSES.items()
+}
+
+# Message class per conversation history sender
+_HISTORY_MESSAGE_CLS: Final[Dict[str, type]] = {
+    "user": HumanMessage,
+    "sparky": AIMessage
+}
+
+# Per-turn tail of the system prompt; the static prefix is built once per service
+_PROMPT_SUFFIX_FMT: Final[str] = (
+    "CURRENT CONTEXT:\n"
+    "- Language: {language}\n"
+    "- User preferences: {prefs}\n"
+    "- Previous requirements: {prev}\n"
+)
+
+# Cached in place of the orchestrator service when it failed to initialize
+_ORCHESTRATOR_UNAVAILABLE: Final[object] = object()
+
+# Precompiled patterns for the LLM-free fast path in extract_welding_intent
+_RE_PROCESS = re.compile(r"\b(MIG|TIG|MMA|STICK|GMAW|GTAW|SMAW)\b", re.I)
+_RE_MATERIAL = re.compile(r"\b(aluminum|aluminium|stainless|carbon steel|mild steel|steel)\b", re.I)
+_RE_THICK = re.compile(r"(\d+(?:\.\d+)?)\s*mm\b", re.I)
+# Case-sensitive so "10 a ..." is not read as 10 A
+_RE_AMPS = re.compile(r"(\d{2,4})\s*(?:A|[Aa]mps?)\b")
+# Questions and comparisons need the LLM even when a single process is named
+_RE_AMBIGUOUS = re.compile(r"\?|\b(?:vs|versus|or)\b", re.I)
+
+
+@lru_cache(maxsize=1024)
+def format_history_timestamp(ts_ns: int) -> str:
+    """Format a conversation history ``ts`` (epoch nanoseconds) as ISO-8601"""
+    return datetime.fromtimestamp(ts_ns / 1e9).isoformat()
+
 
 class WeldingProcess(Enum):
     """Supported welding processes"""
@@ -50,7 +107,22 @@ class Material(Enum):
     MILD_STEEL = "mild_steel"
 
 
-@dataclass
+# Enum member -> value lookups used by WeldingRequirements.to_dict
+_PROCESS_VALUE: Final[Dict["WeldingProcess", str]] = {p: p.value for p in WeldingProcess}
+_MATERIAL_VALUE: Final[Dict["Material", str]] = {m: m.value for m in Material}
+
+# Fast-path material spellings -> Material
+_MATERIAL_ALIASES: Final[Dict[str, "Material"]] = {
+    "aluminum": Material.ALUMINUM,
+    "aluminium": Material.ALUMINUM,
+    "stainless": Material.STAINLESS,
+    "carbon steel": Material.CARBON_STEEL,
+    "mild steel": Material.MILD_STEEL,
+    "steel": Material.STEEL
+}
+
+
+@dataclass(slots=True)
 class WeldingRequirements:
     """Structured welding requirements extracted from natural language"""
     processes: List[WeldingProcess]
@@ -67,8 +139,8 @@ class WeldingRequirements:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API compatibility"""
         return {
-            "process": [p.value for p in self.processes],
-            "material": self.material.value if self.material else None,
+            "process": [_PROCESS_VALUE[p] for p in self.processes],
+            "material": _MATERIAL_VALUE[self.material] if self.material else None,
             "current": self.current_amps,
             "voltage": self.voltage,
             "thickness": self.thickness_mm,
@@ -77,13 +149,35 @@ class WeldingRequirements:
         }
 
 
+class WeldingRequirementsSchema(BaseModel):
+    """Function-calling schema mirroring WeldingRequirements"""
+    processes: List[Literal["MIG", "TIG", "MMA", "STICK", "GMAW", "GTAW", "SMAW"]] = Field(default_factory=list)
+    material: Optional[Literal["aluminum", "steel", "stainless", "carbon_steel", "mild_steel"]] = None
+    current_amps: Optional[int] = None
+    voltage: Optional[int] = None
+    thickness_mm: Optional[float] = None
+    environment: Optional[str] = None
+    application: Optional[str] = None
+    certifications: List[str] = Field(default_factory=list)
+    safety_requirements: List[str] = Field(default_factory=list)
+    confidence_score: float = Field(default=0.0, ge=0.0, le=1.0)
+
+
+class WeldingIntentSchema(BaseModel):
+    """Structured LLM output for one Sparky conversation turn"""
+    requirements: WeldingRequirementsSchema = Field(default_factory=WeldingRequirementsSchema)
+    response: str = Field(..., description="Natural language response to user")
+    follow_up_questions: List[str] = Field(default_factory=list)
+    expertise_notes: List[str] = Field(default_factory=list, description="Expert welding insights")
+
+
 @dataclass 
 class ConversationContext:
     """Manages conversation state and user preferences"""
     user_id: str
     session_id: str
     language: str = "en"
-    conversation_history: List[Dict[str, str]] = None
+    conversation_history: List[Dict[str, Any]] = None
     user_preferences: Dict[str, Any] = None
     extracted_requirements: Optional[WeldingRequirements] = None
     
@@ -92,6 +186,56 @@ class ConversationContext:
             self.conversation_history = []
         if self.user_preferences is None:
             self.user_preferences = {}
+    
+    def to_payload(self) -> Dict[str, Any]:
+        """Convert to a plain dict suitable for msgpack serialization"""
+        req = self.extracted_requirements
+        return {
+            "user_id": self.user_id,
+            "session_id": self.session_id,
+            "language": self.language,
+            "conversation_history": self.conversation_history,
+            "user_preferences": self.user_preferences,
+            "extracted_requirements": {
+                "processes": [_PROCESS_VALUE[p] for p in req.processes],
+                "material": _MATERIAL_VALUE[req.material] if req.material else None,
+                "current_amps": req.current_amps,
+                "voltage": req.voltage,
+                "thickness_mm": req.thickness_mm,
+                "environment": req.environment,
+                "application": req.application,
+                "certifications": req.certifications,
+                "safety_requirements": req.safety_requirements,
+                "confidence_score": req.confidence_score
+            } if req else None
+        }
+    
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "ConversationContext":
+        """Rebuild a context from a to_payload() dict"""
+        req_data = payload.get("extracted_requirements")
+        requirements = None
+        if req_data:
+            requirements = WeldingRequirements(
+                processes=[WeldingProcess(p) for p in req_data["processes"]],
+                material=Material(req_data["material"]) if req_data["material"] else None,
+                current_amps=req_data["current_amps"],
+                voltage=req_data["voltage"],
+                thickness_mm=req_data["thickness_mm"],
+                environment=req_data["environment"],
+                application=req_data["application"],
+                certifications=req_data["certifications"],
+                safety_requirements=req_data["safety_requirements"],
+                confidence_score=req_data["confidence_score"]
+            )
+        return cls(
+            user_id=payload["user_id"],
+            session_id=payload["session_id"],
+            language=payload["language"],
+            conversation_history=payload["conversation_history"],
+            user_preferences=payload["user_preferences"],
+            extracted_requirements=requirements
+        )
 
 
 class SparkyService:
@@ -109,31 +253,69 @@ class SparkyService:
     def __init__(self, neo4j_repo: Neo4jRepository):
         self.neo4j_repo = neo4j_repo
         
-        # Initialize LangChain LLM
-        self.llm = ChatOpenAI(
-            temperature=settings.DEFAULT_TEMPERATURE,
-            model="gpt-4-1106-preview",  # Latest GPT-4 Turbo
-            max_tokens=settings.MAX_TOKENS,
-            openai_api_key=settings.OPENAI_API_KEY
-        )
+        # LangChain LLM clients, created lazily on first use
+        self._llm: Optional[ChatOpenAI] = None
+        self._intent_llm = None
         
         # Initialize Langsmith tracing
         self.langsmith_client = None
         self.tracer = None
         if settings.LANGSMITH_API_KEY:
             self.langsmith_client = Client(api_key=settings.LANGSMITH_API_KEY)
-            # Set environment for Langsmith
-            import os
-            os.environ["LANGCHAIN_TRACING_V2"] = "true"
-            os.environ["LANGCHAIN_API_KEY"] = settings.LANGSMITH_API_KEY
-            os.environ["LANGCHAIN_PROJECT"] = settings.LANGSMITH_PROJECT
-            logger.info(f"Langsmith tracing enabled for project: {settings.LANGSMITH_PROJECT}")
+            _setup_langsmith_once()
         
         # Welding domain knowledge
         self.welding_expertise = self._load_welding_expertise()
         
-        # Active conversations
+        # Invariant prompt parts, computed once per service instance
+        self._expertise_json = json.dumps(self.welding_expertise, indent=2)
+        self._static_system_prompt = self._build_static_system_prompt()
+        self._static_system_message = SystemMessage(content=self._static_system_prompt)
+        
+        # Active conversations (in-process; Redis-backed when SPARKY_REDIS_CONTEXT is set
+        # so that context is shared across Uvicorn workers and survives restarts)
         self.conversations: Dict[str, ConversationContext] = {}
+        self.redis = None
+        
+        # 2-agent orchestrator, resolved in the background on first conversation;
+        # the warm-up task is held here so it is not garbage-collected mid-flight
+        self._orchestrator_service = None
+        self._orchestrator_task: Optional[asyncio.Task] = None
+        self._orchestrator_lock = asyncio.Lock()
+        if settings.SPARKY_REDIS_CONTEXT:
+            if REDIS_CONTEXT_AVAILABLE:
+                self.redis = aioredis.from_url(settings.REDIS_URL)
+                logger.info("Sparky conversation context stored in Redis")
+            else:
+                logger.warning("SPARKY_REDIS_CONTEXT is set but redis/msgpack are not installed, using in-process context")
+    
+    @property
+    def llm(self) -> ChatOpenAI:
+        """LangChain LLM client, initialized on first access"""
+        if self._llm is None:
+            self._llm = ChatOpenAI(
+                temperature=settings.DEFAULT_TEMPERATURE,
+                model="gpt-4-1106-preview",  # Latest GPT-4 Turbo
+                max_tokens=settings.MAX_TOKENS,
+                openai_api_key=settings.OPENAI_API_KEY
+            )
+        return self._llm
+    
+    @property
+    def intent_llm(self):
+        """Small, deterministic LLM bound to the WeldingIntentSchema function-calling output
+        
+        Intent extraction is slot filling, so it runs on gpt-4o-mini; the
+        larger model behind ``llm`` is kept for general advice.
+        """
+        if self._intent_llm is None:
+            self._intent_llm = ChatOpenAI(
+                temperature=0,
+                model="gpt-4o-mini",
+                max_tokens=512,
+                openai_api_key=settings.OPENAI_API_KEY
+            ).with_structured_output(WeldingIntentSchema, method="function_calling")
+        return self._intent_llm
     
     def _load_welding_expertise(self) -> Dict[str, Any]:
         """Load welding domain expertise and safety guidelines"""
@@ -185,95 +367,134 @@ class SparkyService:
         """
         
         try:
-            # Build conversation-aware system prompt
-            system_prompt = self._build_system_prompt(context)
-            
-            # Create conversation messages
-            messages = [SystemMessage(content=system_prompt)]
-            
-            # Add conversation history for context
-            for msg in context.conversation_history[-3:]:  # Last 3 exchanges
-                if msg["sender"] == "user":
-                    messages.append(HumanMessage(content=msg["content"]))
-                else:
-                    messages.append(AIMessage(content=msg["content"]))
-            
-            # Add current user message
-            messages.append(HumanMessage(content=user_message))
-            
-            # Get LLM response with Langsmith tracing
-            response = await self.llm.ainvoke(
-                messages,
-                config={
-                    "tags": ["sparky", "intent_extraction", context.language],
-                    "metadata": {
-                        "user_id": context.user_id,
-                        "session_id": context.session_id,
-                        "language": context.language
+            # Obvious English requests are answered without an LLM round trip
+            fast_result = self._fast_path_intent(user_message, context)
+            if fast_result is not None:
+                requirements, response_text = fast_result
+            else:
+                # Shared static prompt plus a small per-turn context message,
+                # followed by the last 3 exchanges and the current user message
+                messages = [
+                    self._static_system_message,
+                    SystemMessage(content=self._dynamic_tail(context)),
+                    *(
+                        _HISTORY_MESSAGE_CLS[msg["sender"]](content=msg["content"])
+                        for msg in context.conversation_history[-3:]
+                    ),
+                    HumanMessage(content=user_message)
+                ]
+                
+                # Get structured LLM response with Langsmith tracing
+                intent = await self.intent_llm.ainvoke(
+                    messages,
+                    config={
+                        "tags": ["sparky", "intent_extraction", context.language],
+                        "metadata": {
+                            "user_id": context.user_id,
+                            "session_id": context.session_id,
+                            "language": context.language
+                        }
                     }
-                }
-            )
-            
-            ai_response = response.content
-            
-            # Parse the structured response
-            requirements, response_text = self._parse_llm_response(ai_response, context)
+                )
+                
+                requirements, response_text = self._from_intent_schema(intent)
             
             # Update conversation history
             context.conversation_history.append({
                 "sender": "user",
                 "content": user_message,
-                "timestamp": datetime.now().isoformat()
+                "ts": time.time_ns()
             })
             context.conversation_history.append({
                 "sender": "sparky", 
                 "content": response_text,
-                "timestamp": datetime.now().isoformat()
+                "ts": time.time_ns()
             })
             
             # Store extracted requirements in context
             if requirements.processes:
                 context.extracted_requirements = requirements
             
+            await self.save_conversation_context(context)
+            
             return requirements, response_text
             
         except Exception as e:
             logger.error(f"Error in LLM intent extraction: {e}")
             return WeldingRequirements(processes=[]), self._get_fallback_response(context.language)
     
-    def _build_system_prompt(self, context: ConversationContext) -> str:
-        """Build context-aware system prompt with welding expertise"""
+    def _fast_path_intent(
+        self,
+        user_message: str,
+        context: ConversationContext
+    ) -> Optional[Tuple[WeldingRequirements, str]]:
+        """Extract requirements with precompiled regexes when the message is unambiguous
+        
+        Returns None (fall through to the LLM) unless the conversation is in
+        English, the message is a statement rather than a question or
+        comparison, and it names exactly one process plus a material or
+        thickness.
+        """
+        if context.language != "en" or _RE_AMBIGUOUS.search(user_message):
+            return None
+        
+        processes = {name.upper() for name in _RE_PROCESS.findall(user_message)}
+        if len(processes) != 1:
+            return None
+        material_match = _RE_MATERIAL.search(user_message)
+        thickness_match = _RE_THICK.search(user_message)
+        if not (material_match or thickness_match):
+            return None
+        amps_match = _RE_AMPS.search(user_message)
+        
+        process = WeldingProcess(processes.pop())
+        material = _MATERIAL_ALIASES[material_match.group(1).lower()] if material_match else None
+        thickness = float(thickness_match.group(1)) if thickness_match else None
+        amps = int(amps_match.group(1)) if amps_match else None
+        
+        requirements = WeldingRequirements(
+            processes=[process],
+            material=material,
+            current_amps=amps,
+            thickness_mm=thickness,
+            certifications=[],
+            safety_requirements=[],
+            confidence_score=0.8
+        )
+        
+        details = []
+        if thickness is not None:
+            details.append(f"{thickness:g}mm")
+        if material is not None:
+            details.append(material.value.replace("_", " "))
+        if amps is not None:
+            details.append(f"at {amps}A")
+        response_text = (
+            f"Got it - {process.value} welding on {' '.join(details)}. "
+            "Let me find the equipment packages that match these requirements."
+        )
+        
+        logger.info(f"Fast-path intent extraction matched: {requirements.to_dict()}")
+        return requirements, response_text
+    
+    def _build_static_system_prompt(self) -> str:
+        """Build the invariant part of the system prompt (expertise, format, rules)"""
         
-        base_prompt = f"""You are Sparky, an expert welding equipment assistant. You help users find the perfect welding equipment for their specific needs.
+        return f"""You are Sparky, an expert welding equipment assistant. You help users find the perfect welding equipment for their specific needs.
 
 CORE CAPABILITIES:
 1. Extract welding requirements from natural language
 2. Provide expert welding advice and safety guidance  
-3. Communicate in {context.language} (but understand all languages)
+3. Communicate in the user's language given in CURRENT CONTEXT (but understand all languages)
 4. Remember conversation context and user preferences
 
 WELDING EXPERTISE:
-{json.dumps(self.welding_expertise, indent=2)}
+{self._expertise_json}
 
 RESPONSE FORMAT:
-Always respond with a JSON object containing:
-{{
-    "requirements": {{
-        "processes": ["MIG"|"TIG"|"MMA"|"STICK"],
-        "material": "aluminum"|"steel"|"stainless"|null,
-        "current_amps": number|null,
-        "voltage": number|null, 
-        "thickness_mm": number|null,
-        "environment": string|null,
-        "application": string|null,
-        "certifications": [string],
-        "safety_requirements": [string],
-        "confidence_score": 0.0-1.0
-    }},
-    "response": "Natural language response to user",
-    "follow_up_questions": ["question1", "question2"],
-    "expertise_notes": ["expert insight 1", "expert insight 2"]
-}}
+Always return the structured welding intent: the extracted requirements
+(null for anything the user has not specified), a natural language response,
+follow-up questions and expert insights.
 
 CONVERSATION RULES:
 1. If requirements are unclear, ask clarifying questions
@@ -282,78 +503,65 @@ CONVERSATION RULES:
 4. Mention relevant certifications for specialized applications
 5. Be conversational and helpful, not robotic
 6. If user switches languages, respond in their language
-
-CURRENT CONTEXT:
-- User preferences: {context.user_preferences}
-- Previous requirements: {context.extracted_requirements.to_dict() if context.extracted_requirements else None}
 """
+    
+    def _dynamic_tail(self, context: ConversationContext) -> str:
+        """Build the per-turn conversation context appended to the static prompt"""
         
-        return base_prompt
+        previous = context.extracted_requirements.to_dict() if context.extracted_requirements else None
+        return _PROMPT_SUFFIX_FMT.format(
+            language=context.language,
+            prefs=context.user_preferences,
+            prev=previous
+        )
     
-    def _parse_llm_response(
-        self, 
-        llm_response: str, 
-        context: ConversationContext
-    ) -> Tuple[WeldingRequirements, str]:
-        """Parse structured LLM response into requirements and response text"""
+    def _from_intent_schema(self, intent: WeldingIntentSchema) -> Tuple[WeldingRequirements, str]:
+        """Convert structured LLM output into requirements and response text"""
         
-        try:
-            # Extract JSON from response
-            json_start = llm_response.find('{')
-            json_end = llm_response.rfind('}') + 1
-            
-            if json_start == -1 or json_end == 0:
-                raise ValueError("No JSON found in LLM response")
-            
-            json_str = llm_response[json_start:json_end]
-            parsed = json.loads(json_str)
-            
-            # Extract requirements
-            req_data = parsed.get("requirements", {})
-            requirements = WeldingRequirements(
-                processes=[WeldingProcess(p) for p in req_data.get("processes", [])],
-                material=Material(req_data["material"]) if req_data.get("material") else None,
-                current_amps=req_data.get("current_amps"),
-                voltage=req_data.get("voltage"),
-                thickness_mm=req_data.get("thickness_mm"),
-                environment=req_data.get("environment"),
-                application=req_data.get("application"),
-                certifications=req_data.get("certifications", []),
-                safety_requirements=req_data.get("safety_requirements", []),
-                confidence_score=req_data.get("confidence_score", 0.0)
-            )
-            
-            # Extract response text
-            response_text = parsed.get("response", "I'd be happy to help you with welding equipment recommendations!")
-            
-            # Add expertise notes if present
-            expertise_notes = parsed.get("expertise_notes", [])
-            if expertise_notes:
-                response_text += "\n\n💡 **Expert Tips:**\n" + "\n".join(f"• {note}" for note in expertise_notes)
-            
-            return requirements, response_text
-            
-        except Exception as e:
-            logger.error(f"Error parsing LLM response: {e}")
-            logger.error(f"Raw LLM response: {llm_response}")
-            
-            # Fallback to simple requirements
-            return WeldingRequirements(processes=[]), self._get_fallback_response(context.language)
+        req_data = intent.requirements
+        requirements = WeldingRequirements(
+            processes=[WeldingProcess(p) for p in req_data.processes],
+            material=Material(req_data.material) if req_data.material else None,
+            current_amps=req_data.current_amps,
+            voltage=req_data.voltage,
+            thickness_mm=req_data.thickness_mm,
+            environment=req_data.environment,
+            application=req_data.application,
+            certifications=req_data.certifications,
+            safety_requirements=req_data.safety_requirements,
+            confidence_score=req_data.confidence_score
+        )
+        
+        response_text = intent.response or "I'd be happy to help you with welding equipment recommendations!"
+        
+        # Add expertise notes if present
+        if intent.expertise_notes:
+            response_text += "\n\n💡 **Expert Tips:**\n" + "\n".join(f"• {note}" for note in intent.expertise_notes)
+        
+        return requirements, response_text
     
     def _get_fallback_response(self, language: str = "en") -> str:
         """Get fallback response when LLM fails"""
-        responses = {
-            "en": "I'd be happy to help you with welding equipment recommendations! Please let me know what welding process you need (MIG, TIG, or Stick) and what material you're working with.",
-            "es": "¡Estaré encantado de ayudarte con recomendaciones de equipos de soldadura! Por favor, dime qué proceso de soldadura necesitas (MIG, TIG o Electrodo) y con qué material estás trabajando.",
-            "fr": "Je serais ravi de vous aider avec des recommandations d'équipement de soudage! Veuillez me dire de quel processus de soudage vous avez besoin (MIG, TIG ou Électrode) et avec quel matériau vous travaillez.",
-            "de": "Gerne helfe ich Ihnen bei Empfehlungen für Schweißgeräte! Bitte teilen Sie mir mit, welches Schweißverfahren Sie benötigen (MIG, WIG oder Lichtbogen) und mit welchem Material Sie arbeiten."
-        }
-        return responses.get(language, responses["en"])
+        return _FALLBACK_RESPONSES.get(language, _FALLBACK_RESPONSES["en"])
+    
+    @staticmethod
+    def _context_key(user_id: str, session_id: str) -> str:
+        """Build the conversation key shared by in-process and Redis storage"""
+        return f"{user_id}:{session_id}"
     
     async def get_conversation_context(self, user_id: str, session_id: str, language: str = "en") -> ConversationContext:
         """Get or create conversation context for user session"""
         
-        context_key = f"{user_id}:{session_id}"
+        context_key = self._context_key(user_id, session_id)
+        
+        if self.redis is not None:
+            raw = await self.redis.get(f"sparky:ctx:{context_key}")
+            if raw:
+                context = ConversationContext.from_payload(msgpack.unpackb(raw))
+            else:
+                context = ConversationContext(user_id=user_id, session_id=session_id, language=language)
+            context.language = language
+            return context
         
         if context_key not in self.conversations:
             self.conversations[context_key] = ConversationContext(
@@ -367,6 +575,39 @@ CURRENT CONTEXT:
         
         return self.conversations[context_key]
     
+    async def save_conversation_context(self, context: ConversationContext) -> None:
+        """Persist a mutated conversation context (no-op for in-process storage)"""
+        if self.redis is None:
+            return
+        key = f"sparky:ctx:{self._context_key(context.user_id, context.session_id)}"
+        await self.redis.set(key, msgpack.packb(context.to_payload()), ex=settings.CACHE_TTL)
+    
+    async def clear_conversation_context(self, user_id: str, session_id: str) -> bool:
+        """Delete conversation context for user session, returns True if it existed"""
+        context_key = self._context_key(user_id, session_id)
+        if self.redis is not None:
+            return bool(await self.redis.delete(f"sparky:ctx:{context_key}"))
+        return self.conversations.pop(context_key, None) is not None
+    
+    async def _get_orchestrator_service(self):
+        """Get (and cache) the 2-agent orchestrator service, None if unavailable
+        
+        Initialization is attempted once; a failure is cached as well so
+        later turns don't retry the import.
+        """
+        if self._orchestrator_service is None:
+            async with self._orchestrator_lock:
+                if self._orchestrator_service is None:
+                    try:
+                        from ..services.simple_orchestrator_service import get_simple_orchestrator_service
+                        self._orchestrator_service = await get_simple_orchestrator_service(self.neo4j_repo)
+                    except Exception as e:
+                        logger.error(f"Error initializing 2-agent orchestrator: {e}")
+                        self._orchestrator_service = _ORCHESTRATOR_UNAVAILABLE
+        if self._orchestrator_service is _ORCHESTRATOR_UNAVAILABLE:
+            return None
+        return self._orchestrator_service
+    
     async def process_conversation(
         self, 
         user_message: str,
@@ -391,6 +632,10 @@ CURRENT CONTEXT:
             # Get conversation context
             context = await self.get_conversation_context(user_id, session_id, language)
             
+            # Warm up the orchestrator service while the LLM is generating (first turn only)
+            if self._orchestrator_task is None:
+                self._orchestrator_task = asyncio.create_task(self._get_orchestrator_service())
+            
             # Extract intent using LLM
             requirements, response_text = await self.extract_welding_intent(user_message, context)
             
@@ -404,13 +649,15 @@ CURRENT CONTEXT:
             ]):
                 try:
                     # Use new 2-agent system for package recommendations
-                    from ..services.simple_orchestrator_service import get_simple_orchestrator_service
-                    
-                    orchestrator_service = await get_simple_orchestrator_service(self.neo4j_repo)
+                    orchestrator_service = await self._get_orchestrator_service()
+                    if orchestrator_service is None:
+                        raise RuntimeError("2-agent orchestrator service unavailable")
                     
-                    # Process through 2-agent orchestrator
+                    # Process through 2-agent orchestrator, handing over the requirements
+                    # extracted above so it can skip its own LLM intent extraction
                     orchestrator_result = await orchestrator_service.process_request(
                         message=user_message,
+                        pre_extracted=requirements,
                         user_id=user_id,
                         session_id=session_id,
                         language=language
@@ -465,10 +712,27 @@ CURRENT CONTEXT:
 
 # Singleton service instance
 _sparky_service: Optional[SparkyService] = None
+_init_lock = asyncio.Lock()
+_langsmith_inited = False
+
+
+def _setup_langsmith_once() -> None:
+    """Export Langsmith tracing environment variables once per process"""
+    global _langsmith_inited
+    if _langsmith_inited:
+        return
+    os.environ["LANGCHAIN_TRACING_V2"] = "true"
+    os.environ["LANGCHAIN_API_KEY"] = settings.LANGSMITH_API_KEY
+    os.environ["LANGCHAIN_PROJECT"] = settings.LANGSMITH_PROJECT
+    _langsmith_inited = True
+    logger.info(f"Langsmith tracing enabled for project: {settings.LANGSMITH_PROJECT}")
+
 
-def get_sparky_service(neo4j_repo: Neo4jRepository) -> SparkyService:
+async def get_sparky_service(neo4j_repo: Neo4jRepository) -> SparkyService:
     """Get singleton Sparky service instance"""
     global _sparky_service
     if _sparky_service is None:
-        _sparky_service = SparkyService(neo4j_repo)
-    return _sparky_service
\ No newline at end of file
+        async with _init_lock:
+            if _sparky_service is None:
+                _sparky_service = SparkyService(neo4j_repo)
+    return _sparky_service
@@ -7,7 +7,8 @@ enhanced ProductEmbeddingGenerator with comprehensive specification extraction.
 
 import asyncio
 import logging
-from typing import List, Dict, Optional, Tuple
+import time
+from typing import AsyncIterator, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
 from ..database.repositories import Neo4jRepository, get_neo4j_repository
@@ -15,6 +16,21 @@ from .embedding_generator import ProductEmbeddingGenerator, ProductEmbedding
 
 logger = logging.getLogger(__name__)
 
+# Short-lived cache of vector search results keyed on (version, query, limit).
+# Shared across service instances since the factory builds a new one per call;
+# the version is bumped when a migration writes embeddings.
+_VECTOR_SEARCH_CACHE_TTL = 60.0
+_VECTOR_SEARCH_CACHE_MAXSIZE = 1024
+_vector_search_cache: Dict[Tuple[int, str, int], Tuple[float, List[Dict]]] = {}
+_vector_search_cache_version = 0
+
+
+def invalidate_vector_search_cache() -> None:
+    """Invalidate cached vector search results (e.g. after embeddings change)"""
+    global _vector_search_cache_version
+    _vector_search_cache_version += 1
+    _vector_search_cache.clear()
+
 
 @dataclass
 class MigrationResult:
@@ -48,10 +64,59 @@ class VectorMigrationService:
         """
         self.neo4j_repo = neo4j_repo
         self.embedding_generator = embedding_generator
+        
+        # Resolved on first write: Neo4j 5.7+ reports per-transaction status,
+        # 5.21+ also supports IN CONCURRENT TRANSACTIONS
+        self._server_version: Optional[Tuple[int, int]] = None
+    
+    async def _get_server_version(self) -> Tuple[int, int]:
+        """
+        Detect the Neo4j server (major, minor) version once per service.
+        
+        Returns:
+            Version tuple, (0, 0) if it could not be determined
+        """
+        if self._server_version is None:
+            version = (0, 0)
+            try:
+                results = await self.neo4j_repo.execute_query(
+                    "CALL dbms.components() YIELD name, versions "
+                    "WHERE name = 'Neo4j Kernel' RETURN versions[0] AS version"
+                )
+                if results:
+                    version = tuple(int(part) for part in results[0]["version"].split(".")[:2])
+                    logger.info(f"Neo4j server version {results[0]['version']} "
+                                f"(concurrent transactions: {version >= (5, 21)})")
+            except Exception as e:
+                logger.warning(f"Failed to detect Neo4j server version: {e}")
+            self._server_version = version
+        
+        return self._server_version
+    
+    async def _check_concurrent_transactions(self) -> bool:
+        """
+        Check whether the server supports CALL { ... } IN CONCURRENT TRANSACTIONS.
+        
+        Returns:
+            True for Neo4j 5.21 or newer, False otherwise
+        """
+        return await self._get_server_version() >= (5, 21)
     
-    async def fetch_all_products(self) -> List[Dict]:
+    async def _check_transaction_status_reporting(self) -> bool:
         """
-        Fetch all products from Neo4j.
+        Check whether the server supports ON ERROR CONTINUE REPORT STATUS.
+        
+        Returns:
+            True for Neo4j 5.7 or newer, False otherwise
+        """
+        return await self._get_server_version() >= (5, 7)
+    
+    async def fetch_all_products(self, skip_existing: bool = True) -> List[Dict]:
+        """
+        Fetch products from Neo4j.
+        
+        Args:
+            skip_existing: Only fetch products that do not have an embedding yet
         
         Returns:
             List of product dictionaries
@@ -59,20 +124,17 @@ class VectorMigrationService:
         try:
             query = """
             MATCH (p:Product)
+            WHERE $include_all OR p.embedding IS NULL
             RETURN p.gin as gin,
                    p.name as name,
                    p.category as category,
                    p.subcategory as subcategory,
                    p.description as description,
-                   p.specifications_json as specifications_json,
-                   p.embedding as existing_embedding
-            ORDER BY p.gin
+                   p.specifications_json as specifications_json
             """
             
-            logger.info("Fetching all products from Neo4j")
-            results = await self.neo4j_repo.execute_query(query)
-            
-            products = [dict(record) for record in results]
+            logger.info("Fetching products from Neo4j")
+            products = await self.neo4j_repo.execute_query(query, {"include_all": not skip_existing})
             logger.info(f"Fetched {len(products)} products from Neo4j")
             
             return products
@@ -81,40 +143,91 @@ class VectorMigrationService:
             logger.error(f"Failed to fetch products: {e}")
             raise
     
-    async def check_vector_index_exists(self) -> bool:
+    async def iter_products(self, skip_existing: bool = True, page_size: int = 1000) -> AsyncIterator[List[Dict]]:
         """
-        Check if vector index already exists.
+        Stream products from Neo4j page by page.
         
-        Returns:
-            True if index exists, False otherwise
-        """
-        try:
-            query = "SHOW INDEXES YIELD name WHERE name = 'product_embeddings'"
-            results = await self.neo4j_repo.execute_query(query)
-            
-            exists = len(results) > 0
-            logger.info(f"Vector index exists: {exists}")
+        Uses keyset pagination on p.gin rather than SKIP, so pages stay stable
+        while earlier pages are being written back (written products stop
+        matching the p.embedding IS NULL filter).
+        
+        Args:
+            skip_existing: Only fetch products that do not have an embedding yet
+            page_size: Number of products per page
             
-            return exists
+        Yields:
+            Lists of product dictionaries
+        """
+        query = """
+        MATCH (p:Product)
+        WHERE p.gin > $last_gin AND ($include_all OR p.embedding IS NULL)
+        RETURN p.gin as gin,
+               p.name as name,
+               p.category as category,
+               p.subcategory as subcategory,
+               p.description as description,
+               p.specifications_json as specifications_json
+        ORDER BY p.gin
+        LIMIT $page_size
+        """
+        
+        last_gin = ""
+        while True:
+            page = await self.neo4j_repo.execute_query(query, {
+                "last_gin": last_gin,
+                "include_all": not skip_existing,
+                "page_size": page_size
+            })
+            if not page:
+                return
+            last_gin = page[-1]["gin"]
+            yield page
+            if len(page) < page_size:
+                return
+    
+    async def fetch_embedding_text_hashes(self, gins: List[str]) -> Dict[str, str]:
+        """
+        Fetch stored embedding text hashes for the given products.
+        
+        Args:
+            gins: Product GINs
             
-        except Exception as e:
-            logger.warning(f"Failed to check vector index: {e}")
-            return False
+        Returns:
+            Mapping of gin -> stored embedding_text_hash (only products that have one)
+        """
+        results = await self.neo4j_repo.execute_query(
+            """
+            MATCH (p:Product)
+            WHERE p.gin IN $gins AND p.embedding_text_hash IS NOT NULL AND p.embedding IS NOT NULL
+            RETURN p.gin AS gin, p.embedding_text_hash AS embedding_text_hash
+            """,
+            {"gins": gins}
+        )
+        return {record["gin"]: record["embedding_text_hash"] for record in results}
+    
+    async def count_products_with_embeddings(self) -> int:
+        """
+        Count products that already have an embedding.
+        
+        Returns:
+            Number of products with an embedding property
+        """
+        results = await self.neo4j_repo.execute_query(
+            "MATCH (p:Product) WHERE p.embedding IS NOT NULL RETURN count(p) AS n"
+        )
+        return results[0]["n"] if results else 0
     
     async def create_vector_index(self) -> bool:
         """
         Create vector index for product embeddings.
         
+        The CREATE is idempotent (IF NOT EXISTS), so no separate existence
+        check is issued.
+        
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Check if index already exists
-            if await self.check_vector_index_exists():
-                logger.info("Vector index already exists, skipping creation")
-                return True
-            
-            # Create vector index
             create_index_query = """
             CREATE VECTOR INDEX product_embeddings IF NOT EXISTS
             FOR (p:Product) ON (p.embedding)
@@ -126,10 +239,10 @@ class VectorMigrationService:
             }
             """
             
-            logger.info("Creating vector index for product embeddings")
+            logger.info("Ensuring vector index for product embeddings")
             await self.neo4j_repo.execute_query(create_index_query)
             
-            logger.info("Vector index created successfully")
+            logger.info("Vector index ready")
             return True
             
         except Exception as e:
@@ -158,7 +271,7 @@ class VectorMigrationService:
             
             parameters = {
                 "gin": embedding.gin,
-                "embedding": embedding.embedding,
+                "embedding": embedding.embedding.tolist(),
                 "embedding_text": embedding.embedding_text,
                 "embedding_model": embedding.embedding_model,
                 "embedding_created_at": embedding.embedding_created_at
@@ -177,56 +290,132 @@ class VectorMigrationService:
             logger.error(f"Failed to update embedding for product {embedding.gin}: {e}")
             return False
     
-    async def update_products_batch(self, embeddings: List[ProductEmbedding], batch_size: int = 10) -> Tuple[int, int]:
+    async def update_products_batch(self, embeddings: List[ProductEmbedding], batch_size: int = 500) -> Tuple[int, int]:
         """
-        Update multiple products with embeddings in batches.
+        Update multiple products with embeddings in a single server-side batched write.
+        
+        All rows are sent in one UNWIND query; Neo4j commits them in
+        transactions of batch_size rows, in parallel on 5.21+ servers.
         
         Args:
             embeddings: List of ProductEmbedding objects
-            batch_size: Number of products to update per batch
+            batch_size: Number of rows per server-side transaction
             
         Returns:
             Tuple of (successful_updates, failed_updates)
         """
-        successful = 0
-        failed = 0
+        if not embeddings:
+            return 0, 0
         
-        logger.info(f"Updating {len(embeddings)} products with embeddings (batch size: {batch_size})")
+        concurrency = "CONCURRENT " if await self._check_concurrent_transactions() else ""
+        report_status = await self._check_transaction_status_reporting()
         
-        for i in range(0, len(embeddings), batch_size):
-            batch = embeddings[i:i + batch_size]
-            
-            logger.info(f"Processing batch {i//batch_size + 1}/{(len(embeddings) + batch_size - 1)//batch_size}")
-            
-            # Process batch concurrently
-            tasks = [self.update_product_embedding(embedding) for embedding in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Count results
-            for result in results:
-                if isinstance(result, Exception):
-                    failed += 1
-                elif result:
-                    successful += 1
-                else:
-                    failed += 1
-            
-            # Small delay between batches to avoid overwhelming the database
-            await asyncio.sleep(0.1)
+        # With status reporting a failed inner transaction no longer aborts the
+        # query; only rows from committed transactions are counted as updated
+        if report_status:
+            on_error = "ON ERROR CONTINUE REPORT STATUS AS status"
+            summary = ("RETURN sum(CASE WHEN status.committed THEN n ELSE 0 END) AS updated, "
+                       "collect(DISTINCT status.errorMessage) AS errors")
+        else:
+            on_error = ""
+            summary = "RETURN sum(n) AS updated, [] AS errors"
+        
+        update_query = f"""
+        UNWIND $rows AS row
+        CALL {{
+            WITH row
+            MATCH (p:Product {{gin: row.gin}})
+            SET p.embedding = row.embedding,
+                p.embedding_text = row.embedding_text,
+                p.embedding_model = row.embedding_model,
+                p.embedding_created_at = row.embedding_created_at,
+                p.embedding_text_hash = row.embedding_text_hash
+            RETURN count(p) AS n
+        }} IN {concurrency}TRANSACTIONS OF {int(batch_size)} ROWS {on_error}
+        {summary}
+        """
+        
+        rows = [
+            {
+                "gin": e.gin,
+                "embedding": e.embedding.tolist(),
+                "embedding_text": e.embedding_text,
+                "embedding_model": e.embedding_model,
+                "embedding_created_at": e.embedding_created_at,
+                "embedding_text_hash": e.embedding_text_hash
+            }
+            for e in embeddings
+        ]
+        
+        logger.info(f"Updating {len(embeddings)} products with embeddings "
+                    f"(IN {concurrency}TRANSACTIONS OF {batch_size} ROWS)")
+        
+        try:
+            results = await self.neo4j_repo.execute_query(update_query, {"rows": rows})
+            successful = results[0]["updated"] if results else 0
+            for error in (results[0]["errors"] if results else []):
+                logger.error(f"Embedding update transaction failed: {error}")
+        except Exception as e:
+            # Inner transactions commit independently, so earlier batches may be written
+            logger.error(f"Failed to update product embeddings: {e}")
+            successful = await self._count_committed_embeddings(rows)
+        
+        failed = len(embeddings) - successful
         
         logger.info(f"Batch update complete: {successful} successful, {failed} failed")
         
         return successful, failed
     
+    async def _count_committed_embeddings(self, rows: List[Dict]) -> int:
+        """
+        Count rows whose embedding was committed before a batched write failed.
+        
+        Each row's embedding_created_at timestamp identifies the write that
+        produced it, so a matching product property means that row committed.
+        
+        Args:
+            rows: Row parameters sent to the failed update query
+            
+        Returns:
+            Number of committed rows, 0 if they could not be counted
+        """
+        query = """
+        UNWIND $rows AS row
+        MATCH (p:Product {gin: row.gin})
+        WHERE p.embedding_created_at = row.embedding_created_at
+        RETURN count(p) AS committed
+        """
+        
+        try:
+            results = await self.neo4j_repo.execute_query(query, {
+                "rows": [{"gin": row["gin"], "embedding_created_at": row["embedding_created_at"]} for row in rows]
+            })
+            committed = results[0]["committed"] if results else 0
+        except Exception as e:
+            logger.error(f"Failed to count committed embedding updates: {e}")
+            return 0
+        
+        if committed:
+            logger.warning(f"{committed} embeddings were committed before the batched write failed")
+        return committed
+    
     async def migrate_products(self, 
                              skip_existing: bool = True, 
-                             batch_size: int = 10) -> MigrationResult:
+                             batch_size: int = 500,
+                             page_size: int = 1000) -> MigrationResult:
         """
         Complete migration process for all products.
         
+        Products are streamed in pages by a producer task, encoded by an
+        encoder task and written by a writer task, linked by bounded queues,
+        so fetching, encoding and writing overlap and peak memory is bounded
+        by page_size. The vector index is created concurrently with the
+        pipeline.
+        
         Args:
             skip_existing: Skip products that already have embeddings
-            batch_size: Number of products to process per batch
+            batch_size: Number of products per server-side write transaction
+            page_size: Number of products fetched and encoded per page
             
         Returns:
             MigrationResult with statistics
@@ -236,53 +425,84 @@ class VectorMigrationService:
         try:
             logger.info("Starting vector migration for all products")
             
-            # 1. Fetch all products
-            products = await self.fetch_all_products()
-            result.total_products = len(products)
+            # Products filtered out in Cypher by skip_existing never reach the pipeline
+            already_embedded = await self.count_products_with_embeddings() if skip_existing else 0
+            result.skipped_existing = already_embedded
+            
+            queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+            write_queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+            
+            # Each stage sends its end-of-stream sentinel only on normal completion;
+            # on failure the remaining stages are cancelled instead
+            async def produce() -> None:
+                async for page in self.iter_products(skip_existing=skip_existing, page_size=page_size):
+                    await queue.put(page)
+                await queue.put(None)
+            
+            async def encode() -> None:
+                while (page := await queue.get()) is not None:
+                    result.total_products += len(page)
+                    
+                    items = self.embedding_generator.prepare_embedding_texts(page)
+                    result.failed_embeddings += len(page) - len(items)
+                    
+                    # Skip products whose (model, text) hash matches the stored embedding
+                    if not skip_existing:
+                        stored_hashes = await self.fetch_embedding_text_hashes([gin for gin, _ in items])
+                        unchanged = {
+                            gin for gin, embedding_text in items
+                            if stored_hashes.get(gin) == self.embedding_generator.embedding_text_hash(embedding_text)
+                        }
+                        if unchanged:
+                            result.skipped_existing += len(unchanged)
+                            items = [item for item in items if item[0] not in unchanged]
+                    
+                    # Encoding is CPU/GPU bound, keep the event loop free for fetching and writing
+                    embeddings = await asyncio.to_thread(
+                        self.embedding_generator.encode_embedding_texts, items
+                    )
+                    result.successful_embeddings += len(embeddings)
+                    result.failed_embeddings += len(items) - len(embeddings)
+                    
+                    if embeddings:
+                        await write_queue.put(embeddings)
+                await write_queue.put(None)
+            
+            async def write() -> None:
+                while (embeddings := await write_queue.get()) is not None:
+                    successful_updates, failed_updates = await self.update_products_batch(embeddings, batch_size)
+                    result.successful_updates += successful_updates
+                    result.failed_updates += failed_updates
+            
+            # Index creation, fetching, encoding and writing all run concurrently:
+            # page N is written while page N+1 is being encoded
+            index_task = asyncio.create_task(self.create_vector_index())
+            producer = asyncio.create_task(produce())
+            encoder = asyncio.create_task(encode())
+            writer = asyncio.create_task(write())
+            tasks = (index_task, producer, encoder, writer)
+            try:
+                index_created, _, _, _ = await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+                # Let cancelled stages finish unwinding before returning or re-raising
+                await asyncio.gather(*tasks, return_exceptions=True)
             
-            if not products:
-                logger.warning("No products found for migration")
-                return result
-            
-            # 2. Filter products if skipping existing embeddings
-            products_to_process = []
-            
-            for product in products:
-                if skip_existing and product.get('existing_embedding'):
-                    result.skipped_existing += 1
-                    logger.debug(f"Skipping product {product.get('gin')} - already has embedding")
-                else:
-                    products_to_process.append(product)
-            
-            logger.info(f"Processing {len(products_to_process)} products ({result.skipped_existing} skipped)")
-            
-            if not products_to_process:
-                logger.info("No products need embedding generation")
-                return result
-            
-            # 3. Generate embeddings
-            logger.info("Generating embeddings for products")
-            embeddings = self.embedding_generator.generate_embeddings_batch(products_to_process)
-            
-            result.successful_embeddings = len(embeddings)
-            result.failed_embeddings = len(products_to_process) - len(embeddings)
-            
-            if not embeddings:
-                logger.warning("No embeddings generated successfully")
-                return result
-            
-            # 4. Create vector index if it doesn't exist
-            index_created = await self.create_vector_index()
             if not index_created:
                 logger.warning("Failed to create vector index, but continuing with migration")
             
-            # 5. Update products with embeddings
-            successful_updates, failed_updates = await self.update_products_batch(embeddings, batch_size)
+            result.total_products += already_embedded
+            
+            if result.successful_updates:
+                invalidate_vector_search_cache()
             
-            result.successful_updates = successful_updates
-            result.failed_updates = failed_updates
+            if not result.total_products:
+                logger.warning("No products found for migration")
             
-            logger.info(f"Migration complete: {result.successful_updates}/{result.total_products} products updated")
+            logger.info(f"Migration complete: {result.successful_updates}/{result.total_products} products updated "
+                        f"({result.skipped_existing} skipped)")
             
             return result
             
@@ -294,6 +514,9 @@ class VectorMigrationService:
         """
         Test vector search functionality after migration.
         
+        Results are cached for a short TTL keyed on the normalized query text
+        and limit, so repeated queries skip both encoding and the index call.
+        
         Args:
             query_text: Search query text
             limit: Number of results to return
@@ -301,9 +524,15 @@ class VectorMigrationService:
         Returns:
             List of search results
         """
+        cache_key = (_vector_search_cache_version, query_text.strip().lower(), limit)
+        cached = _vector_search_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            logger.debug(f"Vector search cache hit for '{query_text}'")
+            return list(cached[1])
+        
         try:
             # Generate query embedding
-            query_embedding = self.embedding_generator.query_embedding(query_text)
+            query_embedding = self.embedding_generator.query_embedding_array(query_text)
             
             # Perform vector search with correct parameter names
             search_query = """
@@ -312,7 +541,6 @@ class VectorMigrationService:
             RETURN product.gin as gin,
                    product.name as name,
                    product.category as category,
-                   product.embedding_text as embedding_text,
                    score
             ORDER BY score DESC
             """
@@ -320,21 +548,78 @@ class VectorMigrationService:
             parameters = {
                 "indexName": "product_embeddings",
                 "numberOfNearestNeighbours": limit,
-                "query": query_embedding
+                "query": query_embedding.tolist()
             }
             
-            results = await self.neo4j_repo.execute_query(search_query, parameters)
-            
-            search_results = [dict(record) for record in results]
+            search_results = await self.neo4j_repo.execute_query(search_query, parameters)
             
             logger.info(f"Vector search test for '{query_text}' returned {len(search_results)} results")
             
-            return search_results
+            if len(_vector_search_cache) >= _VECTOR_SEARCH_CACHE_MAXSIZE:
+                # Evict the oldest entry (dicts preserve insertion order)
+                _vector_search_cache.pop(next(iter(_vector_search_cache)))
+            _vector_search_cache[cache_key] = (time.monotonic() + _VECTOR_SEARCH_CACHE_TTL, search_results)
+            
+            return list(search_results)
             
         except Exception as e:
             logger.error(f"Vector search test failed: {e}")
             raise
 
+    
+    async def test_vector_search_batch(self, query_texts: List[str], limit: int = 5) -> List[List[Dict]]:
+        """
+        Run vector search for several queries in one round trip.
+        
+        All query texts are encoded in one batched model call and searched
+        with a single UNWIND query against the vector index.
+        
+        Args:
+            query_texts: Search query texts
+            limit: Number of results to return per query
+            
+        Returns:
+            One list of search results per query text, in input order
+        """
+        if not query_texts:
+            return []
+        
+        try:
+            query_embeddings = self.embedding_generator.query_embeddings_array(query_texts)
+            
+            search_query = """
+            UNWIND $queries AS q
+            CALL db.index.vector.queryNodes($indexName, $numberOfNearestNeighbours, q.vec)
+            YIELD node as product, score
+            WITH q, product, score
+            ORDER BY q.id, score DESC
+            RETURN q.id as qid,
+                   collect({gin: product.gin, name: product.name, category: product.category, score: score}) as hits
+            """
+            
+            parameters = {
+                "indexName": "product_embeddings",
+                "numberOfNearestNeighbours": limit,
+                "queries": [
+                    {"id": i, "vec": embedding.tolist()}
+                    for i, embedding in enumerate(query_embeddings)
+                ]
+            }
+            
+            results = await self.neo4j_repo.execute_query(search_query, parameters)
+            
+            search_results: List[List[Dict]] = [[] for _ in query_texts]
+            for record in results:
+                search_results[record["qid"]] = record["hits"]
+            
+            logger.info(f"Batched vector search for {len(query_texts)} queries returned "
+                        f"{sum(len(hits) for hits in search_results)} results")
+            
+            return search_results
+            
+        except Exception as e:
+            logger.error(f"Batched vector search failed: {e}")
+            raise
 
 # Factory function for dependency injection
 async def get_vector_migration_service() -> VectorMigrationService:
@@ -4,11 +4,90 @@ Reusable, configurable search logic for finding products with fuzzy name matchin
 """
 
 import logging
+import re
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Full-text (Lucene) index backing the Stage 1 shortlist
+PRODUCT_NAME_FULLTEXT_INDEX = "product_name_fulltext"
+
+# Lucene query syntax characters that must be escaped in user-supplied terms
+_LUCENE_SPECIAL_CHARS = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+# Stage 1 rejects products that cannot match any Stage 2 word combination
+_OTHER_WORDS_FILTER = """(size($others) = 0
+             OR toLower(p.name) CONTAINS $concat
+             OR ALL(w IN $others WHERE toLower(p.name) CONTAINS w)
+             OR ANY(b IN $bigrams WHERE toLower(p.name) CONTAINS b))"""
+
+
+@lru_cache(maxsize=4096)
+def _parse_search_terms(product_name: str) -> Tuple[str, ...]:
+    """Parse and normalize search terms (memoized; popular names repeat)"""
+    if not product_name or not product_name.strip():
+        return ()
+    
+    # Normalize spaces and convert to lowercase
+    clean_name = product_name.strip().lower()
+    words = clean_name.split()
+    
+    # Filter out very short words (but keep numbers)
+    return tuple(word for word in words if len(word) >= 2 or word.isdigit())
+
+
+@lru_cache(maxsize=4096)
+def _build_word_patterns(other_words: Tuple[str, ...]) -> Tuple[str, str, Tuple[str, ...]]:
+    """
+    Precompute the word combinations checked by _check_word_combinations.
+    
+    Returns (concatenated, spaced, two-word combinations).
+    """
+    concatenated = ''.join(other_words)
+    spaced = ' '.join(other_words)
+    bigrams = tuple(other_words[i] + other_words[i + 1] for i in range(len(other_words) - 1))
+    return concatenated, spaced, bigrams
+
+
+@lru_cache(maxsize=65536)
+def _check_word_combinations(product_name: str, other_words: Tuple[str, ...]) -> Optional[Tuple[str, float]]:
+    """
+    Check if product name contains the other words in various combinations.
+    
+    Returns (match_type, match_score) or None if no match.
+    
+    Match types and priorities:
+    1. concatenated: "400i" (highest score)
+    2. spaced: "400 i"  
+    3. individual: all words present separately
+    4. partial: some 2-word combinations present
+    """
+    concatenated, spaced, bigrams = _build_word_patterns(other_words)
+    
+    # 1. Concatenated version (highest priority): "400i"
+    if concatenated in product_name:
+        return ("concatenated", 1.0)
+    
+    # 2. Spaced version: "400 i"
+    if spaced in product_name:
+        return ("spaced", 0.9)
+    
+    # 3. All individual words present: contains both "400" AND "i"
+    if all(word in product_name for word in other_words):
+        return ("individual", 0.8)
+    
+    # 4. Partial combinations (for 3+ words)
+    if bigrams:
+        partial_matches = sum(1 for combo in bigrams if combo in product_name)
+        
+        if partial_matches > 0:
+            match_score = 0.6 + (partial_matches / len(bigrams)) * 0.2  # 0.6-0.8 range
+            return ("partial", match_score)
+    
+    return None
+
 
 @dataclass
 class SearchResult:
@@ -29,19 +108,28 @@ class ProductSearchEngine:
     Generic product search engine that handles fuzzy name matching.
     
     Core Algorithm:
-    1. Stage 1: Fast shortlist using first word
+    1. Stage 1: Fast shortlist using first word (full-text index prefix match)
     2. Stage 2: Filter by remaining words using multiple combination strategies
+    3. Stage 3: Hydrate full product details for the final results only
     
     This approach is:
-    - Fast: Single DB query + in-memory filtering
+    - Fast: Slim index-backed shortlist + in-memory filtering + targeted hydration
     - Accurate: Handles various product name formats
     - Scalable: Works for any product naming convention
     - Maintainable: Clear separation of concerns
     """
     
+    # Categories at or below this size are shortlisted without truncation
+    SMALL_CATEGORY_THRESHOLD = 100
+    
     def __init__(self, neo4j_repo):
         """Initialize with database repository"""
         self.neo4j_repo = neo4j_repo
+        # Product counts per category, memoized for the process lifetime
+        # (categories only change between migrations)
+        self.category_counts: Dict[str, int] = {}
+        # Set once queryNodes reports the full-text index is missing
+        self._fulltext_index_missing = False
         
     async def search_products(
         self, 
@@ -71,8 +159,19 @@ class ProductSearchEngine:
             first_word = words[0]
             other_words = words[1:] if len(words) > 1 else []
             
-            # Stage 1: Get shortlist using first word
-            shortlist = await self._get_shortlist_by_first_word(first_word, category, limit * 2)
+            # Size the shortlist from the category population
+            category_count = await self._get_category_count(category)
+            if not category_count:
+                logger.info(f"📭 Category '{category}' has no products")
+                return []
+            
+            if category_count <= self.SMALL_CATEGORY_THRESHOLD:
+                shortlist_limit = category_count
+            else:
+                shortlist_limit = min(limit * 2, category_count)
+            
+            # Stage 1: Get shortlist using first word (pre-filtered by remaining words in Cypher)
+            shortlist = await self._get_shortlist_by_first_word(first_word, category, shortlist_limit, other_words)
             logger.info(f"📋 Stage 1: Found {len(shortlist)} products containing '{first_word}'")
             
             if not shortlist:
@@ -86,17 +185,22 @@ class ProductSearchEngine:
                 # Single word search - return shortlist as-is
                 filtered_results = [(result, "exact", 1.0) for result in shortlist]
             
+            # Stage 3: Hydrate full product payloads for the top-limit survivors only
+            top_results = filtered_results[:limit]
+            hydrated = await self._hydrate_products([result["product_id"] for result, _, _ in top_results])
+            
             # Convert to SearchResult objects
             search_results = []
-            for result, match_type, match_score in filtered_results[:limit]:
+            for result, match_type, match_score in top_results:
+                product = hydrated.get(result["product_id"], result)
                 search_result = SearchResult(
                     product_id=result["product_id"],
                     product_name=result["product_name"],
-                    category=result["category"],
-                    subcategory=result.get("subcategory"),
-                    price=result.get("price"),
+                    category=product.get("category", category),
+                    subcategory=product.get("subcategory"),
+                    price=product.get("price"),
                     sales_frequency=result.get("sales_frequency", 0),
-                    description=result.get("description", ""),
+                    description=product.get("description", ""),
                     match_type=match_type,
                     match_score=match_score
                 )
@@ -111,50 +215,118 @@ class ProductSearchEngine:
     
     def _parse_search_terms(self, product_name: str) -> List[str]:
         """Parse and normalize search terms"""
-        if not product_name or not product_name.strip():
-            return []
-        
-        # Normalize spaces and convert to lowercase
-        clean_name = product_name.strip().lower()
-        words = clean_name.split()
-        
-        # Filter out very short words (but keep numbers)
-        filtered_words = [word for word in words if len(word) >= 2 or word.isdigit()]
-        
-        return filtered_words
+        return list(_parse_search_terms(product_name))
     
     async def _get_shortlist_by_first_word(
         self, 
         first_word: str, 
         category: str, 
-        limit: int
+        limit: int,
+        other_words: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Stage 1: Get shortlist using first word search.
-        Fast database query to reduce search space.
+        Fast full-text index lookup to reduce search space.
+        
+        The first word is matched as a prefix against the product_name_fulltext
+        Lucene index (created by the product loader). On databases without
+        that index the engine falls back to a toLower(p.name) CONTAINS scan.
+        Products that cannot match any Stage 2 combination of other_words
+        (concatenated, all individual words, or a 2-word combination) are
+        rejected in Cypher so they never cross the wire.
         """
-        query = """
+        other_words = other_words or []
+        concatenated, _, bigrams = self._build_word_patterns(other_words)
+        
+        parameters = {
+            "category": category,
+            "concat": concatenated,
+            "others": other_words,
+            "bigrams": list(bigrams),
+            "limit": limit
+        }
+        
+        if not self._fulltext_index_missing:
+            query = f"""
+            CALL db.index.fulltext.queryNodes($index_name, $fulltext_query) YIELD node AS p, score
+            WHERE p.category = $category
+            AND {_OTHER_WORDS_FILTER}
+            RETURN p.gin as product_id,
+                   p.name as product_name,
+                   p.sales_frequency as sales_frequency
+            ORDER BY score DESC, p.sales_frequency DESC
+            LIMIT $limit
+            """
+            try:
+                return await self.neo4j_repo.execute_query(query, {
+                    **parameters,
+                    "index_name": PRODUCT_NAME_FULLTEXT_INDEX,
+                    "fulltext_query": self._fulltext_prefix_query(first_word)
+                })
+            except Exception as e:
+                # Databases loaded before the index existed: fall back to a name scan
+                if PRODUCT_NAME_FULLTEXT_INDEX not in str(e):
+                    raise
+                logger.warning(f"Full-text index {PRODUCT_NAME_FULLTEXT_INDEX} unavailable, "
+                               f"using CONTAINS shortlist: {e}")
+                self._fulltext_index_missing = True
+        
+        query = f"""
         MATCH (p:Product)
         WHERE p.category = $category
         AND toLower(p.name) CONTAINS toLower($first_word)
+        AND {_OTHER_WORDS_FILTER}
         RETURN p.gin as product_id,
                p.name as product_name,
+               p.sales_frequency as sales_frequency
+        ORDER BY p.sales_frequency DESC, p.name ASC
+        LIMIT $limit
+        """
+        
+        return await self.neo4j_repo.execute_query(query, {**parameters, "first_word": first_word})
+    
+    async def _get_category_count(self, category: str) -> int:
+        """Number of products in a category (non-empty counts are cached)"""
+        count = self.category_counts.get(category)
+        if count is None:
+            results = await self.neo4j_repo.execute_query(
+                "MATCH (p:Product {category: $category}) RETURN count(p) AS n",
+                {"category": category}
+            )
+            count = results[0]["n"] if results else 0
+            # Don't pin empty categories; they may be loaded after startup
+            if count:
+                self.category_counts[category] = count
+        return count
+    
+    async def _hydrate_products(self, product_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Stage 3: Fetch the full payload for the final products.
+        
+        The shortlist only carries what Stage 2 scoring needs (gin, name,
+        sales frequency); descriptions and other properties are fetched here
+        for the survivors so they are not serialized for discarded rows.
+        """
+        if not product_ids:
+            return {}
+        
+        query = """
+        MATCH (p:Product)
+        WHERE p.gin IN $gins
+        RETURN p.gin as product_id,
                p.category as category,
                p.subcategory as subcategory,
                p.price as price,
-               p.sales_frequency as sales_frequency,
                p.description as description
-        ORDER BY p.sales_frequency DESC, p.name ASC
-        LIMIT $limit
         """
         
-        parameters = {
-            "category": category,
-            "first_word": first_word,
-            "limit": limit
-        }
-        
-        return await self.neo4j_repo.execute_query(query, parameters)
+        results = await self.neo4j_repo.execute_query(query, {"gins": product_ids})
+        return {row["product_id"]: row for row in results}
+    
+    @staticmethod
+    def _fulltext_prefix_query(word: str) -> str:
+        """Escape a search word for Lucene and turn it into a prefix query"""
+        return _LUCENE_SPECIAL_CHARS.sub(r"\\\1", word) + "*"
     
     def _filter_by_remaining_words(
         self, 
@@ -172,9 +344,11 @@ class ProductSearchEngine:
         
         filtered_results = []
         
+        # Memoized per (name, words); duplicate names and repeated queries are free
+        words_key = tuple(other_words)
+        
         for result in shortlist:
-            product_name = result["product_name"].lower()
-            match_info = self._check_word_combinations(product_name, other_words)
+            match_info = _check_word_combinations(result["product_name"].lower(), words_key)
             
             if match_info:
                 match_type, match_score = match_info
@@ -186,6 +360,11 @@ class ProductSearchEngine:
         
         return filtered_results
     
+    @staticmethod
+    def _build_word_patterns(other_words: List[str]) -> Tuple[str, str, Tuple[str, ...]]:
+        """Precompute the word combinations checked by _check_word_combinations"""
+        return _build_word_patterns(tuple(other_words))
+    
     def _check_word_combinations(
         self, 
         product_name: str, 
@@ -195,44 +374,8 @@ class ProductSearchEngine:
         Check if product name contains the other words in various combinations.
         
         Returns (match_type, match_score) or None if no match.
-        
-        Match types and priorities:
-        1. concatenated: "400i" (highest score)
-        2. spaced: "400 i"  
-        3. individual: all words present separately
-        4. partial: some 2-word combinations present
         """
-        
-        # 1. Concatenated version (highest priority): "400i"
-        concatenated = ''.join(other_words)
-        if concatenated in product_name:
-            return ("concatenated", 1.0)
-        
-        # 2. Spaced version: "400 i"
-        spaced = ' '.join(other_words)
-        if spaced in product_name:
-            return ("spaced", 0.9)
-        
-        # 3. All individual words present: contains both "400" AND "i"
-        all_words_present = all(word in product_name for word in other_words)
-        if all_words_present:
-            return ("individual", 0.8)
-        
-        # 4. Partial combinations (for 3+ words)
-        if len(other_words) >= 2:
-            partial_matches = 0
-            total_combinations = len(other_words) - 1
-            
-            for i in range(len(other_words) - 1):
-                two_word_combo = ''.join(other_words[i:i+2])
-                if two_word_combo in product_name:
-                    partial_matches += 1
-            
-            if partial_matches > 0:
-                match_score = 0.6 + (partial_matches / total_combinations) * 0.2  # 0.6-0.8 range
-                return ("partial", match_score)
-        
-        return None
+        return _check_word_combinations(product_name, tuple(other_words))
 
 
 class ProductSearchConfig:
@@ -8,195 +8,384 @@ Each GIN should appear in only ONE category role across all rules.
 Flags any inconsistencies before proceeding with data loading.
 """
 
+import copy
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Set, List, Tuple
-from collections import defaultdict
+from typing import Any, Dict, Iterator, Set, List, Tuple
+from collections import Counter, defaultdict
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Category → bit position in a GIN's category mask
+CATEGORY_ID = {
+    "PowerSource": 0,
+    "Feeder": 1,
+    "Cooler": 2,
+    "Interconnector": 3,
+    "Torch": 4,
+    "Remote": 5,
+    "PowerSourceAccessory": 6,
+    "FeederAccessory": 7,
+    "CoolerAccessory": 8,
+    "InterconnectorAccessory": 9,
+    "TorchAccessory": 10,
+}
+CATEGORY_NAMES = sorted(CATEGORY_ID, key=CATEGORY_ID.get)
+CATEGORY_BIT = {category: 1 << category_id for category, category_id in CATEGORY_ID.items()}
+
+
+@lru_cache(maxsize=65536)
+def _pad_gin(gin: str) -> str:
+    """Pad GIN to 10 characters with leading zeros (memoized; GINs recur across rules)"""
+    if not gin or gin.startswith('F000'):
+        return gin
+    return gin.zfill(10)
+
+
+# Golden package component type → (category, source, rule_type) recorded for its GIN
+GOLDEN_COMPONENT_TRIPLES = {
+    comp_type: (category, "golden_packages", f"component_{comp_type}")
+    for comp_type, category in {
+        "powersource": "PowerSource",
+        "feeder": "Feeder",
+        "cooler": "Cooler",
+        "interconnector": "Interconnector",
+        "torch": "Torch",
+        "power_accessory": "PowerSourceAccessory",
+        "feeder_accessory": "FeederAccessory",
+        "cooler_accessory": "CoolerAccessory"
+    }.items()
+}
+
+
+def categories_from_mask(mask: int) -> Set[str]:
+    """Decode a category bitmask into category names"""
+    return {name for name, bit in CATEGORY_ID.items() if mask & (1 << bit)}
+
 class CategoryConsistencyAnalyzer:
     def __init__(self):
         self.base_path = Path("/Users/bharath/Desktop/AgenticAI/Recommender")
         self.valid_files_path = self.base_path / "archive" / "ValidFiles"
         self.orphan_files_path = self.base_path / "archive" / "Orphans"
         
-        # Track GIN → category mappings
-        self.gin_categories = defaultdict(set)  # GIN → set of categories
-        self.category_sources = defaultdict(list)  # GIN → list of (category, source, rule_type)
+        self._reset_state()
         
         # Target PowerSources for context
-        self.target_powersources = {
+        self.target_powersources = frozenset({
             "0465350883",  # Warrior 500i
             "0465350884",  # Warrior 400i
             "0445555880",  # Warrior 750i 380-460V, CE
             "0445250880",  # Renegade ES 300i with cables
             "0446200880"   # Aristo 500ix
-        }
+        })
+    
+    def _reset_state(self):
+        """Initialize per-analysis state"""
+        # Track GIN → category mappings
+        self.gin_mask: Dict[str, int] = {}  # GIN → bitmask of CATEGORY_ID bits
+        self.category_sources = defaultdict(list)  # GIN → list of interned (category, source, rule_type) IDs
+        
+        # (category, source, rule_type) triples are few; store each once and reference by ID
+        self._triple_to_id: Dict[Tuple[str, str, str], int] = {}
+        self._id_to_triple: List[Tuple[str, str, str]] = []
+        
+        # Parsed JSON files by path (used when a file is loaded whole rather than streamed)
+        self._json_cache: Dict[Path, Dict] = {}
+        
+        # Padded PowerSource GIN → all_gins lists of the golden packages built on it
+        # (indexed during the golden packages pass)
+        self._pkgs_by_ps: Dict[str, List[List[str]]] = {}
+        self._golden_packages_scanned = False
+    
+    def _spawn_shard(self) -> "CategoryConsistencyAnalyzer":
+        """Copy of this analyzer (same paths and targets) with empty analysis state"""
+        shard = copy.copy(self)
+        shard._reset_state()
+        return shard
+    
+    def _merge_shard(self, shard: "CategoryConsistencyAnalyzer"):
+        """Fold a shard's masks, sources and package index into this analyzer"""
+        for gin, mask in shard.gin_mask.items():
+            self.gin_mask[gin] = self.gin_mask.get(gin, 0) | mask
+        
+        remap = [self._intern(triple) for triple in shard._id_to_triple]
+        for gin, triple_ids in shard.category_sources.items():
+            self.category_sources[gin].extend(remap[triple_id] for triple_id in triple_ids)
+        
+        for ps_gin, package_gins in shard._pkgs_by_ps.items():
+            self._pkgs_by_ps.setdefault(ps_gin, []).extend(package_gins)
+        self._golden_packages_scanned |= shard._golden_packages_scanned
+    
+    def run_analyses(self):
+        """
+        Run the valid, orphan and golden package passes concurrently.
+        
+        Each pass reads its own file into a private shard, so file I/O and
+        parsing overlap; shards are merged in pass order, which keeps GIN and
+        source ordering identical to running the passes one after another.
+        """
+        passes = [
+            CategoryConsistencyAnalyzer.analyze_valid_rules,
+            CategoryConsistencyAnalyzer.analyze_orphan_rules,
+            CategoryConsistencyAnalyzer.analyze_golden_packages
+        ]
+        shards = [self._spawn_shard() for _ in passes]
+        
+        with ThreadPoolExecutor(max_workers=len(passes)) as executor:
+            futures = [executor.submit(analysis, shard) for analysis, shard in zip(passes, shards)]
+            for future, shard in zip(futures, shards):
+                future.result()
+                self._merge_shard(shard)
     
     def load_json_file(self, file_path: Path) -> Dict:
-        """Load JSON file with error handling"""
+        """Load JSON file with error handling (parsed once per path)"""
+        if file_path in self._json_cache:
+            return self._json_cache[file_path]
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                data = json_loads(f.read())
+            self._json_cache[file_path] = data
+            return data
         except Exception as e:
             logger.error(f"Error loading {file_path}: {e}")
             return {}
     
+    def iter_json_items(self, file_path: Path, prefix: str) -> Iterator[Any]:
+        """
+        Stream the items of a JSON array one at a time.
+        
+        prefix is an ijson path such as "packages.item". Falls back to
+        loading the whole file when ijson is not installed.
+        """
+        try:
+            if ijson is not None:
+                with open(file_path, 'rb') as f:
+                    yield from ijson.items(f, prefix)
+                return
+            
+            data = self.load_json_file(file_path)
+            for key in prefix.split('.')[:-1]:
+                data = data.get(key, {}) if isinstance(data, dict) else {}
+            yield from data or []
+        except Exception as e:
+            logger.error(f"Error streaming {file_path}: {e}")
+    
+    def iter_json_sections(self, file_path: Path, prefix: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Stream the (key, value) pairs of a JSON object one section at a time.
+        
+        Only one section is materialized at a time. Falls back to loading the
+        whole file when ijson is not installed.
+        """
+        try:
+            if ijson is not None:
+                with open(file_path, 'rb') as f:
+                    yield from ijson.kvitems(f, prefix)
+                return
+            
+            yield from self.load_json_file(file_path).get(prefix, {}).items()
+        except Exception as e:
+            logger.error(f"Error streaming {file_path}: {e}")
+    
     def pad_gin(self, gin: str) -> str:
         """Pad GIN to 10 characters with leading zeros"""
-        if not gin or gin.startswith('F000'):
-            return gin
-        return gin.zfill(10)
+        return _pad_gin(gin)
+    
+    def _intern(self, triple: Tuple[str, str, str]) -> int:
+        """Return the ID of a (category, source, rule_type) triple, assigning one if new"""
+        triple_id = self._triple_to_id.get(triple)
+        if triple_id is None:
+            triple_id = len(self._id_to_triple)
+            self._triple_to_id[triple] = triple_id
+            self._id_to_triple.append(triple)
+        return triple_id
+    
+    def get_sources(self, gin: str) -> List[Tuple[str, str, str]]:
+        """Decode the (category, source, rule_type) records of a GIN"""
+        return [self._id_to_triple[triple_id] for triple_id in self.category_sources.get(gin, ())]
     
     def extract_gin_category(self, gin: str, category: str, source: str, rule_type: str):
         """Record GIN-category mapping with source tracking"""
-        padded_gin = self.pad_gin(gin)
-        if padded_gin and padded_gin != "":
-            self.gin_categories[padded_gin].add(category)
-            self.category_sources[padded_gin].append((category, source, rule_type))
+        self._record(gin, (category, source, rule_type))
+    
+    def _record(self, gin: str, triple: Tuple[str, str, str]):
+        """Record a GIN under a prebuilt (category, source, rule_type) triple"""
+        padded_gin = _pad_gin(gin)
+        if padded_gin:
+            self.gin_mask[padded_gin] = self.gin_mask.get(padded_gin, 0) | CATEGORY_BIT[triple[0]]
+            self.category_sources[padded_gin].append(self._intern(triple))
     
     def analyze_valid_rules(self):
         """Analyze valid compatibility rules for category consistency"""
         logger.info("Analyzing valid compatibility rules...")
         
-        rules_data = self.load_json_file(self.valid_files_path / "compatibility_rules_valid.json")
-        if not rules_data:
-            return
-        
-        compatibility_rules = rules_data.get("compatibility_rules", {})
-        
-        # Analyze powersource_feeder_cooler rules
-        for rule in compatibility_rules.get("powersource_feeder_cooler", []):
-            ps_gin = rule.get("powersource", {}).get("gin", "")
-            feeder_gin = rule.get("feeder", {}).get("gin", "")
-            cooler_gin = rule.get("cooler", {}).get("gin", "")
-            
-            self.extract_gin_category(ps_gin, "PowerSource", "valid_rules", "powersource_feeder_cooler")
-            self.extract_gin_category(feeder_gin, "Feeder", "valid_rules", "powersource_feeder_cooler")
-            self.extract_gin_category(cooler_gin, "Cooler", "valid_rules", "powersource_feeder_cooler")
-        
-        # Analyze powersource_accessories rules
-        for rule in compatibility_rules.get("powersource_accessories", []):
-            ps_gin = rule.get("powersource_gin", "")
-            acc_gin = rule.get("accessory", {}).get("gin", "")
+        rules_file = self.valid_files_path / "compatibility_rules_valid.json"
+        
+        # One rule-type section in memory at a time
+        for rule_type, rules in self.iter_json_sections(rules_file, "compatibility_rules"):
+            if rule_type == "powersource_feeder_cooler":
+                ps_triple = ("PowerSource", "valid_rules", rule_type)
+                feeder_triple = ("Feeder", "valid_rules", rule_type)
+                cooler_triple = ("Cooler", "valid_rules", rule_type)
+                
+                for rule in rules:
+                    ps_gin = rule.get("powersource", {}).get("gin", "")
+                    feeder_gin = rule.get("feeder", {}).get("gin", "")
+                    cooler_gin = rule.get("cooler", {}).get("gin", "")
+                    
+                    self._record(ps_gin, ps_triple)
+                    self._record(feeder_gin, feeder_triple)
+                    self._record(cooler_gin, cooler_triple)
             
-            self.extract_gin_category(ps_gin, "PowerSource", "valid_rules", "powersource_accessories")
-            self.extract_gin_category(acc_gin, "PowerSourceAccessory", "valid_rules", "powersource_accessories")
-        
-        # Analyze feeder_accessories rules
-        for rule in compatibility_rules.get("feeder_accessories", []):
-            ps_gin = rule.get("powersource_gin", "")
-            feeder_gin = rule.get("feeder_gin", "")
-            acc_gin = rule.get("accessory", {}).get("gin", "")
+            elif rule_type == "powersource_accessories":
+                ps_triple = ("PowerSource", "valid_rules", rule_type)
+                acc_triple = ("PowerSourceAccessory", "valid_rules", rule_type)
+                
+                for rule in rules:
+                    ps_gin = rule.get("powersource_gin", "")
+                    acc_gin = rule.get("accessory", {}).get("gin", "")
+                    
+                    self._record(ps_gin, ps_triple)
+                    self._record(acc_gin, acc_triple)
             
-            self.extract_gin_category(ps_gin, "PowerSource", "valid_rules", "feeder_accessories")
-            self.extract_gin_category(feeder_gin, "Feeder", "valid_rules", "feeder_accessories")
-            self.extract_gin_category(acc_gin, "FeederAccessory", "valid_rules", "feeder_accessories")
-        
-        # Analyze interconnector_accessories rules
-        for rule in compatibility_rules.get("interconnector_accessories", []):
-            ps_gin = rule.get("gin_powersource", "")
-            ic_gin = rule.get("gin_interconnector", "")
-            acc_gin = rule.get("gin_accessory", "")
+            elif rule_type == "feeder_accessories":
+                ps_triple = ("PowerSource", "valid_rules", rule_type)
+                feeder_triple = ("Feeder", "valid_rules", rule_type)
+                acc_triple = ("FeederAccessory", "valid_rules", rule_type)
+                
+                for rule in rules:
+                    ps_gin = rule.get("powersource_gin", "")
+                    feeder_gin = rule.get("feeder_gin", "")
+                    acc_gin = rule.get("accessory", {}).get("gin", "")
+                    
+                    self._record(ps_gin, ps_triple)
+                    self._record(feeder_gin, feeder_triple)
+                    self._record(acc_gin, acc_triple)
             
-            self.extract_gin_category(ps_gin, "PowerSource", "valid_rules", "interconnector_accessories")
-            self.extract_gin_category(ic_gin, "Interconnector", "valid_rules", "interconnector_accessories")
-            self.extract_gin_category(acc_gin, "InterconnectorAccessory", "valid_rules", "interconnector_accessories")
-        
-        # Analyze torch_accessories rules
-        for rule in compatibility_rules.get("torch_accessories", []):
-            ps_gin = rule.get("gin_powersource", "")
-            torch_gin = rule.get("gin_torch", "")
-            acc_gin = rule.get("gin_accessory", "")
+            elif rule_type == "interconnector_accessories":
+                ps_triple = ("PowerSource", "valid_rules", rule_type)
+                ic_triple = ("Interconnector", "valid_rules", rule_type)
+                acc_triple = ("InterconnectorAccessory", "valid_rules", rule_type)
+                
+                for rule in rules:
+                    ps_gin = rule.get("gin_powersource", "")
+                    ic_gin = rule.get("gin_interconnector", "")
+                    acc_gin = rule.get("gin_accessory", "")
+                    
+                    self._record(ps_gin, ps_triple)
+                    self._record(ic_gin, ic_triple)
+                    self._record(acc_gin, acc_triple)
             
-            self.extract_gin_category(ps_gin, "PowerSource", "valid_rules", "torch_accessories")
-            self.extract_gin_category(torch_gin, "Torch", "valid_rules", "torch_accessories")
-            self.extract_gin_category(acc_gin, "TorchAccessory", "valid_rules", "torch_accessories")
+            elif rule_type == "torch_accessories":
+                ps_triple = ("PowerSource", "valid_rules", rule_type)
+                torch_triple = ("Torch", "valid_rules", rule_type)
+                acc_triple = ("TorchAccessory", "valid_rules", rule_type)
+                
+                for rule in rules:
+                    ps_gin = rule.get("gin_powersource", "")
+                    torch_gin = rule.get("gin_torch", "")
+                    acc_gin = rule.get("gin_accessory", "")
+                    
+                    self._record(ps_gin, ps_triple)
+                    self._record(torch_gin, torch_triple)
+                    self._record(acc_gin, acc_triple)
     
     def analyze_orphan_rules(self):
         """Analyze orphan compatibility rules for category consistency"""
         logger.info("Analyzing orphan compatibility rules...")
         
-        rules_data = self.load_json_file(self.orphan_files_path / "compatibility_rules_orphan.json")
-        if not rules_data:
-            return
-        
-        orphan_rules = rules_data.get("orphan_rules", {})
-        
-        # Analyze torches rules
-        for rule in orphan_rules.get("torches", []):
-            feeder_gin = rule.get("feeder_gin", "")
-            cooler_gin = rule.get("cooler_gin", "")
-            torch_gin = rule.get("torch", {}).get("gin", "")
-            
-            self.extract_gin_category(feeder_gin, "Feeder", "orphan_rules", "torches")
-            self.extract_gin_category(cooler_gin, "Cooler", "orphan_rules", "torches")
-            self.extract_gin_category(torch_gin, "Torch", "orphan_rules", "torches")
-        
-        # Analyze remotes rules
-        for rule in orphan_rules.get("remotes", []):
-            ps_gin = rule.get("powersource_gin", "")
-            feeder_gin = rule.get("feeder_gin", "")
-            remote_gin = rule.get("remote", {}).get("gin", "")
+        rules_file = self.orphan_files_path / "compatibility_rules_orphan.json"
+        
+        # One rule-type section in memory at a time
+        for rule_type, rules in self.iter_json_sections(rules_file, "orphan_rules"):
+            if rule_type == "torches":
+                feeder_triple = ("Feeder", "orphan_rules", rule_type)
+                cooler_triple = ("Cooler", "orphan_rules", rule_type)
+                torch_triple = ("Torch", "orphan_rules", rule_type)
+                
+                for rule in rules:
+                    feeder_gin = rule.get("feeder_gin", "")
+                    cooler_gin = rule.get("cooler_gin", "")
+                    torch_gin = rule.get("torch", {}).get("gin", "")
+                    
+                    self._record(feeder_gin, feeder_triple)
+                    self._record(cooler_gin, cooler_triple)
+                    self._record(torch_gin, torch_triple)
             
-            self.extract_gin_category(ps_gin, "PowerSource", "orphan_rules", "remotes")
-            self.extract_gin_category(feeder_gin, "Feeder", "orphan_rules", "remotes")
-            self.extract_gin_category(remote_gin, "Remote", "orphan_rules", "remotes")
-        
-        # Analyze powersource_accessories rules
-        for rule in orphan_rules.get("powersource_accessories", []):
-            ps_gin = rule.get("powersource_gin", "")
-            acc_gin = rule.get("accessory", {}).get("gin", "")
+            elif rule_type == "remotes":
+                ps_triple = ("PowerSource", "orphan_rules", rule_type)
+                feeder_triple = ("Feeder", "orphan_rules", rule_type)
+                remote_triple = ("Remote", "orphan_rules", rule_type)
+                
+                for rule in rules:
+                    ps_gin = rule.get("powersource_gin", "")
+                    feeder_gin = rule.get("feeder_gin", "")
+                    remote_gin = rule.get("remote", {}).get("gin", "")
+                    
+                    self._record(ps_gin, ps_triple)
+                    self._record(feeder_gin, feeder_triple)
+                    self._record(remote_gin, remote_triple)
             
-            self.extract_gin_category(ps_gin, "PowerSource", "orphan_rules", "powersource_accessories")
-            self.extract_gin_category(acc_gin, "PowerSourceAccessory", "orphan_rules", "powersource_accessories")
-        
-        # Continue for other orphan rule types...
-        # (Adding similar patterns for other rule types in orphan rules)
+            elif rule_type == "powersource_accessories":
+                ps_triple = ("PowerSource", "orphan_rules", rule_type)
+                acc_triple = ("PowerSourceAccessory", "orphan_rules", rule_type)
+                
+                for rule in rules:
+                    ps_gin = rule.get("powersource_gin", "")
+                    acc_gin = rule.get("accessory", {}).get("gin", "")
+                    
+                    self._record(ps_gin, ps_triple)
+                    self._record(acc_gin, acc_triple)
+        
+            # Continue for other orphan rule types...
+            # (Adding similar patterns for other rule types in orphan rules)
     
     def analyze_golden_packages(self):
         """Analyze golden packages for category consistency"""
         logger.info("Analyzing golden packages...")
         
-        golden_data = self.load_json_file(self.valid_files_path / "golden_packages_valid.json")
-        if not golden_data:
-            return
-        
-        packages = golden_data.get("packages", [])
-        
-        for package in packages:
+        # Single streaming pass: category mapping and PowerSource → package index together
+        for package in self.iter_json_items(self.valid_files_path / "golden_packages_valid.json", "packages.item"):
             components = package.get("components", {})
             
-            # Map component types to categories
-            component_category_map = {
-                "powersource": "PowerSource",
-                "feeder": "Feeder", 
-                "cooler": "Cooler",
-                "interconnector": "Interconnector",
-                "torch": "Torch",
-                "power_accessory": "PowerSourceAccessory",
-                "feeder_accessory": "FeederAccessory",
-                "cooler_accessory": "CoolerAccessory"
-            }
-            
-            for comp_type, category in component_category_map.items():
+            for comp_type, triple in GOLDEN_COMPONENT_TRIPLES.items():
                 if comp_type in components:
                     gin = components[comp_type].get("gin", "")
                     if gin and gin != "":
-                        self.extract_gin_category(gin, category, "golden_packages", f"component_{comp_type}")
+                        self._record(gin, triple)
+            
+            self._index_package(package)
+        
+        self._golden_packages_scanned = True
+    
+    def _index_package(self, package: Dict):
+        """Record a package's GINs under its padded PowerSource GIN"""
+        ps_gin = package.get("components", {}).get("powersource", {}).get("gin", "")
+        self._pkgs_by_ps.setdefault(_pad_gin(ps_gin), []).append(package.get("all_gins", []))
     
     def find_inconsistencies(self) -> List[Tuple[str, Set[str], List[Tuple]]]:
         """Find GINs with multiple category assignments"""
         inconsistencies = []
         
-        for gin, categories in self.gin_categories.items():
-            if len(categories) > 1:
-                sources = self.category_sources[gin]
-                inconsistencies.append((gin, categories, sources))
+        for gin, mask in self.gin_mask.items():
+            if mask & (mask - 1):  # more than one category bit set
+                inconsistencies.append((gin, categories_from_mask(mask), self.get_sources(gin)))
         
         return inconsistencies
     
@@ -204,27 +393,26 @@ class CategoryConsistencyAnalyzer:
         """Analyze GINs specifically related to target PowerSources"""
         logger.info("Analyzing GINs related to target PowerSources...")
         
-        target_related_gins = set()
-        
-        # Extract from golden packages first
-        golden_data = self.load_json_file(self.valid_files_path / "golden_packages_valid.json")
-        packages = golden_data.get("packages", [])
+        # Indexed during analyze_golden_packages; stream the file only if that pass didn't run
+        if not self._golden_packages_scanned:
+            for package in self.iter_json_items(self.valid_files_path / "golden_packages_valid.json", "packages.item"):
+                self._index_package(package)
+            self._golden_packages_scanned = True
         
-        for package in packages:
-            ps_gin = package.get("components", {}).get("powersource", {}).get("gin", "")
-            if self.pad_gin(ps_gin) in self.target_powersources:
-                # Add all component GINs from this package
-                all_gins = package.get("all_gins", [])
-                for gin in all_gins:
-                    target_related_gins.add(self.pad_gin(gin))
+        # Only the packages of the few target PowerSources are touched
+        target_related_gins = set()
+        for ps_gin in self.target_powersources:
+            for package_gins in self._pkgs_by_ps.get(ps_gin, ()):
+                target_related_gins.update(_pad_gin(gin) for gin in package_gins)
         
         logger.info(f"Found {len(target_related_gins)} GINs related to target PowerSources")
         
         # Check category consistency for target-related GINs
         target_inconsistencies = []
         for gin in target_related_gins:
-            if gin in self.gin_categories and len(self.gin_categories[gin]) > 1:
-                target_inconsistencies.append((gin, self.gin_categories[gin], self.category_sources[gin]))
+            mask = self.gin_mask.get(gin, 0)
+            if mask & (mask - 1):  # more than one category bit set
+                target_inconsistencies.append((gin, categories_from_mask(mask), self.get_sources(gin)))
         
         return target_related_gins, target_inconsistencies
     
@@ -235,25 +423,24 @@ class CategoryConsistencyAnalyzer:
         logger.info("=" * 60)
         
         # Analyze all rulesets
-        self.analyze_valid_rules()
-        self.analyze_orphan_rules()
-        self.analyze_golden_packages()
+        self.run_analyses()
         
         # Overall statistics
-        total_gins = len(self.gin_categories)
+        total_gins = len(self.gin_mask)
         logger.info(f"Total unique GINs analyzed: {total_gins}")
         
         # Find inconsistencies
         inconsistencies = self.find_inconsistencies()
         logger.info(f"GINs with category inconsistencies: {len(inconsistencies)}")
         
-        if inconsistencies:
-            logger.warning("🚨 CATEGORY INCONSISTENCIES FOUND:")
+        # Detail sections are built as one message each rather than one log call per line
+        if inconsistencies and logger.isEnabledFor(logging.WARNING):
+            lines = ["🚨 CATEGORY INCONSISTENCIES FOUND:"]
             for gin, categories, sources in inconsistencies:
-                logger.warning(f"GIN {gin} appears as: {', '.join(categories)}")
-                for category, source, rule_type in sources:
-                    logger.warning(f"  - {category} in {source} ({rule_type})")
-                logger.warning("")
+                lines.append(f"GIN {gin} appears as: {', '.join(categories)}")
+                lines.extend(f"  - {category} in {source} ({rule_type})" for category, source, rule_type in sources)
+                lines.append("")
+            logger.warning("\n".join(lines))
         
         # Target PowerSource analysis
         target_gins, target_inconsistencies = self.analyze_target_powersource_gins()
@@ -261,34 +448,40 @@ class CategoryConsistencyAnalyzer:
         # Detailed breakdown of target GINs by category
         target_gin_categories = defaultdict(list)
         for gin in target_gins:
-            if gin in self.gin_categories and len(self.gin_categories[gin]) == 1:
-                category = list(self.gin_categories[gin])[0]
+            mask = self.gin_mask.get(gin, 0)
+            if mask and not mask & (mask - 1):
+                category = CATEGORY_NAMES[mask.bit_length() - 1]
                 target_gin_categories[category].append(gin)
         
-        logger.info("\nDetailed breakdown of 18 target-related GINs:")
-        for category, gins in sorted(target_gin_categories.items()):
-            logger.info(f"  {category}: {len(gins)} GINs")
-            for gin in sorted(gins):
-                logger.info(f"    - {gin}")
+        if logger.isEnabledFor(logging.INFO):
+            lines = ["\nDetailed breakdown of 18 target-related GINs:"]
+            for category, gins in sorted(target_gin_categories.items()):
+                lines.append(f"  {category}: {len(gins)} GINs")
+                lines.extend(f"    - {gin}" for gin in sorted(gins))
+            logger.info("\n".join(lines))
         
         if target_inconsistencies:
-            logger.error("🚨 INCONSISTENCIES IN TARGET POWERSOURCE ECOSYSTEM:")
+            lines = ["🚨 INCONSISTENCIES IN TARGET POWERSOURCE ECOSYSTEM:"]
             for gin, categories, sources in target_inconsistencies:
-                logger.error(f"Target-related GIN {gin} appears as: {', '.join(categories)}")
-                for category, source, rule_type in sources:
-                    logger.error(f"  - {category} in {source} ({rule_type})")
+                lines.append(f"Target-related GIN {gin} appears as: {', '.join(categories)}")
+                lines.extend(f"  - {category} in {source} ({rule_type})" for category, source, rule_type in sources)
+            logger.error("\n".join(lines))
         else:
             logger.info("✅ No category inconsistencies found in target PowerSource ecosystem")
         
         # Category distribution
-        category_counts = defaultdict(int)
-        for gin, categories in self.gin_categories.items():
-            if len(categories) == 1:  # Only count consistent GINs
-                category_counts[list(categories)[0]] += 1
-        
-        logger.info("\nCategory Distribution (consistent GINs only):")
-        for category, count in sorted(category_counts.items()):
-            logger.info(f"  {category}: {count} GINs")
+        category_counts = Counter(
+            mask.bit_length() - 1 for mask in self.gin_mask.values()
+            if mask and not mask & (mask - 1)  # Only count consistent GINs
+        )
+        
+        if logger.isEnabledFor(logging.INFO):
+            lines = ["\nCategory Distribution (consistent GINs only):"]
+            lines.extend(
+                f"  {category}: {count} GINs"
+                for category, count in sorted((CATEGORY_NAMES[cid], count) for cid, count in category_counts.items())
+            )
+            logger.info("\n".join(lines))
         
         # Return analysis results
         return {
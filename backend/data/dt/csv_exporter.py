@@ -4,145 +4,264 @@ CSV Exporter for GIN Extraction Data
 Creates clean CSV with Excel file, sheet, GIN, category, description, and compatibility info
 """
 
+import argparse
 import json
-import pandas as pd
+import re
 import csv
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def export_gin_extraction_csv():
+# PowerSource GINs → names for readability
+PS_NAMES = {
+    '0446200880': 'Aristo 500ix',
+    '0465350883': 'Warrior 500i', 
+    '0465350884': 'Warrior 400i',
+    '0445555880': 'Warrior 750i',
+    '0445250880': 'Renegade ES300'
+}
+
+# Descriptions for special synthetic codes
+SYNTHETIC_DESCRIPTIONS = {
+    'F000000002': 'No Cooler Available - Placeholder',
+    'F000000003': 'No Torch Available - Placeholder', 
+    'F000000005': 'No Cooler Available - Standalone',
+    'F000000006': 'No Torch Available - Standalone',
+    'F000000007': 'No Feeder Available - Placeholder',
+    'F000000008': 'No Interconnector Available - Placeholder',
+    'F000000009': 'No Feeder Accessory Available - Placeholder',
+    'F000000010': 'No Accessory Available - Placeholder',
+    'F000000011': 'No Connectivity Available - Placeholder'
+}
+
+# Sheet-name keywords in priority order ('Cond' covers 'Conditional', 'Acc' covers 'Accessories')
+SHEET_RE = re.compile(r'Init|Mandatory|Cond|Acc|Wears')
+SHEET_PRIORITY = ('Init', 'Mandatory', 'Cond', 'Acc', 'Wears')
+
+# Sheet keyword → (prefix, suffix) around the PowerSource name
+SHEET_TO_TMPL = {
+    'Init': ('Core component for ', ''),
+    'Mandatory': ('Required component for ', ''),
+    'Cond': ('Optional component for ', ' (conditional)'),
+    'Acc': ('Accessory for ', ''),
+    'Wears': ('Wear part for ', '')
+}
+
+# extraction_details fields used by the export
+DETAIL_COLUMNS = [
+    'excel_file', 'sheet_name', 'gin', 'category', 'product_name', 'exists_in_eng',
+    'source_type', 'column_name', 'powersource_gin', 'row_index'
+]
+
+# Categories whose role is called out in the compatibility text
+ROLE_CATEGORIES = ['Feeder', 'Cooler', 'Torch', 'Interconnector']
+
+# Output columns in CSV order
+CSV_FIELDS = [
+    'Excel_File', 'Sheet_Name', 'GIN', 'Category', 'Description', 'Compatibility_Inferred',
+    'Source_Type', 'Column_Name', 'PowerSource_Context', 'Row_Index', 'Exists_in_ENG'
+]
+
+def export_gin_extraction_csv(use_pandas=False):
     """Export GIN extraction data to CSV format"""
     
-    # Load the detailed extraction report
-    report_file = '/Users/bharath/Desktop/AgenticAI/Recommender/neo4j_datasets/gin_extraction_report.json'
+    # Load the detailed extraction report (zstd-compressed variant preferred when present)
+    report_file = Path('/Users/bharath/Desktop/AgenticAI/Recommender/neo4j_datasets/gin_extraction_report.json')
+    compressed_report_file = report_file.with_name(report_file.name + '.zst')
+    if compressed_report_file.exists():
+        report_file = compressed_report_file
     
     try:
-        with open(report_file, 'r', encoding='utf-8') as f:
-            report = json.load(f)
+        report = load_report(report_file)
+        details = load_extraction_details(report, report_file.parent)
+        del report
         
-        logger.info(f"Loaded extraction report with {len(report['extraction_details'])} records")
+        logger.info(f"Loaded extraction report with {len(details)} records")
         
     except Exception as e:
         logger.error(f"Error loading report: {e}")
         return False
     
-    # Prepare CSV data
-    csv_data = []
-    
-    for detail in report['extraction_details']:
-        # Determine compatibility inference based on context
-        compatibility_info = infer_compatibility(detail)
-        
-        # Get description (from ENG.json if available, otherwise generate)
-        description = get_product_description(detail)
-        
-        csv_row = {
-            'Excel_File': detail['excel_file'],
-            'Sheet_Name': detail['sheet_name'],
-            'GIN': detail['gin'],
-            'Category': detail['category'],
-            'Description': description,
-            'Compatibility_Inferred': compatibility_info,
-            'Source_Type': detail['source_type'],
-            'Column_Name': detail['column_name'],
-            'PowerSource_Context': detail['powersource_gin'],
-            'Row_Index': detail['row_index'],
-            'Exists_in_ENG': 'Yes' if detail['exists_in_eng'] else 'No'
-        }
-        
-        csv_data.append(csv_row)
-    
-    # Create DataFrame
-    df = pd.DataFrame(csv_data)
-    
-    # Sort by Excel file, sheet, then GIN for better organization
-    df = df.sort_values(['Excel_File', 'Sheet_Name', 'GIN'])
-    
     # Export to CSV
     output_file = '/Users/bharath/Desktop/AgenticAI/Recommender/neo4j_datasets/gin_extraction_details.csv'
-    df.to_csv(output_file, index=False, encoding='utf-8')
+    
+    if use_pandas:
+        stats = export_with_pandas(details, output_file)
+    else:
+        stats = export_with_csv_writer(details, output_file)
     
     logger.info(f"CSV exported to: {output_file}")
-    logger.info(f"Total records: {len(df)}")
+    logger.info(f"Total records: {stats['total']}")
     
     # Print summary statistics
     print("\\n" + "=" * 60)
     print("CSV EXPORT SUMMARY")
     print("=" * 60)
-    print(f"Total Records: {len(df):,}")
-    print(f"Unique GINs: {df['GIN'].nunique():,}")
-    print(f"Unique Excel Files: {df['Excel_File'].nunique()}")
-    print(f"Unique Sheets: {df['Sheet_Name'].nunique()}")
+    print(f"Total Records: {stats['total']:,}")
+    print(f"Unique GINs: {stats['unique_gins']:,}")
+    print(f"Unique Excel Files: {stats['unique_files']}")
+    print(f"Unique Sheets: {stats['unique_sheets']}")
     
     print("\\nRecords by Excel File:")
-    file_counts = df['Excel_File'].value_counts()
-    for file, count in file_counts.items():
+    for file, count in stats['file_counts']:
         print(f"  {file}: {count:,} records")
     
     print("\\nRecords by Category:")
-    category_counts = df['Category'].value_counts()
-    for category, count in category_counts.items():
+    for category, count in stats['category_counts']:
         print(f"  {category}: {count:,} records")
     
     print("\\nSource Type Distribution:")
-    source_counts = df['Source_Type'].value_counts()
-    for source, count in source_counts.items():
-        print(f"  {source}: {count:,} records ({count/len(df)*100:.1f}%)")
+    for source, count in stats['source_counts']:
+        print(f"  {source}: {count:,} records ({count/stats['total']*100:.1f}%)")
     
     print(f"\\nCSV file saved to: {output_file}")
     
     return True
 
+def load_report(report_file):
+    """Load an extraction report; '.zst' files hold zstd-compressed JSON bytes"""
+    data = Path(report_file).read_bytes()
+    if str(report_file).endswith('.zst'):
+        if zstandard is None:
+            raise ImportError("zstandard is required to read compressed reports")
+        data = zstandard.ZstdDecompressor().decompress(data)
+    return json_loads(data)
+
+def load_extraction_details(report, report_dir):
+    """Extraction records inline in the report, or read from its JSON Lines sidecar"""
+    if 'extraction_details' in report:
+        return report.pop('extraction_details')
+    
+    with open(Path(report_dir) / report['extraction_details_file'], 'rb') as f:
+        return [json_loads(line) for line in f if line.strip()]
+
+def export_with_csv_writer(details, output_file):
+    """Build, sort and stream rows with the stdlib csv module; returns summary stats"""
+    rows = [build_csv_row(detail) for detail in details]
+    
+    # Sort by Excel file, sheet, then GIN for better organization
+    rows.sort(key=itemgetter('Excel_File', 'Sheet_Name', 'GIN'))
+    
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows)
+    
+    return {
+        'total': len(rows),
+        'unique_gins': len({row['GIN'] for row in rows}),
+        'unique_files': len({row['Excel_File'] for row in rows}),
+        'unique_sheets': len({row['Sheet_Name'] for row in rows}),
+        'file_counts': Counter(row['Excel_File'] for row in rows).most_common(),
+        'category_counts': Counter(row['Category'] for row in rows).most_common(),
+        'source_counts': Counter(row['Source_Type'] for row in rows).most_common()
+    }
+
+def export_with_pandas(details, output_file):
+    """Build columns with vectorized pandas operations and write the CSV; returns summary stats"""
+    # pandas/numpy (and pyarrow) are only imported on this path to keep the default export light
+    import numpy as np
+    import pandas as pd
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        pa = None
+    
+    # Explicit columns skip key inference
+    details = pd.DataFrame.from_records(details, columns=DETAIL_COLUMNS)
+    
+    df = pd.DataFrame({
+        'Excel_File': details['excel_file'],
+        'Sheet_Name': details['sheet_name'],
+        'GIN': details['gin'],
+        'Category': details['category'],
+        'Description': product_description_column(details),
+        'Compatibility_Inferred': infer_compatibility_column(details),
+        'Source_Type': details['source_type'],
+        'Column_Name': details['column_name'],
+        'PowerSource_Context': details['powersource_gin'],
+        'Row_Index': details['row_index'],
+        'Exists_in_ENG': np.where(details['exists_in_eng'], 'Yes', 'No')
+    })
+    
+    # Sort by Excel file, sheet, then GIN for better organization
+    df = df.sort_values(['Excel_File', 'Sheet_Name', 'GIN'])
+    
+    if pa is not None:
+        # Arrow's C++ CSV writer (string values are always quoted)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pa_csv.write_csv(table, output_file, write_options=pa_csv.WriteOptions(include_header=True))
+    else:
+        df.to_csv(output_file, index=False, encoding='utf-8')
+    
+    return {
+        'total': len(df),
+        'unique_gins': df['GIN'].nunique(),
+        'unique_files': df['Excel_File'].nunique(),
+        'unique_sheets': df['Sheet_Name'].nunique(),
+        'file_counts': list(df['Excel_File'].value_counts().items()),
+        'category_counts': list(df['Category'].value_counts().items()),
+        'source_counts': list(df['Source_Type'].value_counts().items())
+    }
+
+def build_csv_row(detail):
+    """Build one CSV row from an extraction detail record"""
+    return {
+        'Excel_File': detail['excel_file'],
+        'Sheet_Name': detail['sheet_name'],
+        'GIN': detail['gin'],
+        'Category': detail['category'],
+        'Description': get_product_description(detail),
+        'Compatibility_Inferred': infer_compatibility(detail),
+        'Source_Type': detail['source_type'],
+        'Column_Name': detail['column_name'],
+        'PowerSource_Context': detail['powersource_gin'],
+        'Row_Index': detail['row_index'],
+        'Exists_in_ENG': 'Yes' if detail['exists_in_eng'] else 'No'
+    }
+
 def infer_compatibility(detail):
     """Infer compatibility information based on context"""
     powersource = detail['powersource_gin']
-    sheet_name = detail['sheet_name']
     category = detail['category']
-    gin = detail['gin']
-    
-    # Map PowerSource GINs to names for readability
-    ps_names = {
-        '0446200880': 'Aristo 500ix',
-        '0465350883': 'Warrior 500i', 
-        '0465350884': 'Warrior 400i',
-        '0445555880': 'Warrior 750i',
-        '0445250880': 'Renegade ES300'
-    }
+    ps_name = PS_NAMES.get(powersource, f'PowerSource {powersource}')
     
-    ps_name = ps_names.get(powersource, f'PowerSource {powersource}')
-    
-    # Base compatibility
-    compatibility = f"Compatible with {ps_name}"
-    
-    # Add context based on sheet
-    if 'Init' in sheet_name:
-        if category == 'PowerSource':
-            compatibility = f"Primary PowerSource for {ps_name}"
-        else:
-            compatibility = f"Core component for {ps_name}"
-    elif 'Mandatory' in sheet_name:
-        compatibility = f"Required component for {ps_name}"
-    elif 'Conditional' in sheet_name or 'Cond' in sheet_name:
-        compatibility = f"Optional component for {ps_name} (conditional)"
-    elif 'Accessories' in sheet_name or 'Acc' in sheet_name:
-        compatibility = f"Accessory for {ps_name}"
-    elif 'Wears' in sheet_name:
-        compatibility = f"Wear part for {ps_name}"
+    # Context based on sheet
+    sheet_key = classify_sheet(detail['sheet_name'])
+    if sheet_key == 'Init' and category == 'PowerSource':
+        compatibility = f"Primary PowerSource for {ps_name}"
+    else:
+        prefix, suffix = SHEET_TO_TMPL.get(sheet_key, ('Compatible with ', ''))
+        compatibility = f"{prefix}{ps_name}{suffix}"
     
     # Add category-specific context
-    if category in ['Feeder', 'Cooler', 'Torch', 'Interconnector']:
+    if category in ROLE_CATEGORIES:
         compatibility += f" ({category.lower()} role)"
     elif 'Accessory' in category:
-        compatibility += f" (accessory role)"
+        compatibility += " (accessory role)"
     elif category == 'Remote':
-        compatibility += f" (remote control)"
+        compatibility += " (remote control)"
     
     # Handle synthetic products
-    if gin.startswith('F000'):
+    if detail['gin'].startswith('F000'):
         compatibility = f"Placeholder - No {category.lower()} available for {ps_name}"
     
     return compatibility
@@ -150,47 +269,113 @@ def infer_compatibility(detail):
 def get_product_description(detail):
     """Get product description from ENG.json or generate one"""
     if detail['exists_in_eng']:
-        # Would need to load ENG.json again to get description
-        # For now, use the product name from the detail
         return detail['product_name']
+    
+    # Generate description for synthetic and missing products
+    gin = detail['gin']
+    category = detail['category']
+    
+    if gin.startswith('F000'):
+        return SYNTHETIC_DESCRIPTIONS.get(gin, f'Synthetic {category} {gin}')
+    elif category == 'Interconnector':
+        return f'Interconnector Cable {gin}'
+    elif category == 'Feeder':
+        return f'Wire Feeder {gin}'
+    elif category == 'Cooler':
+        return f'Cooling Unit {gin}'
+    elif category == 'Torch':
+        return f'Welding Torch {gin}'
+    elif 'Accessory' in category:
+        return f'{category} {gin}'
     else:
-        # Generate description for synthetic products
-        gin = detail['gin']
-        category = detail['category']
-        
-        if gin.startswith('F000'):
-            # Handle special synthetic codes
-            synthetic_descriptions = {
-                'F000000002': 'No Cooler Available - Placeholder',
-                'F000000003': 'No Torch Available - Placeholder', 
-                'F000000005': 'No Cooler Available - Standalone',
-                'F000000006': 'No Torch Available - Standalone',
-                'F000000007': 'No Feeder Available - Placeholder',
-                'F000000008': 'No Interconnector Available - Placeholder',
-                'F000000009': 'No Feeder Accessory Available - Placeholder',
-                'F000000010': 'No Accessory Available - Placeholder',
-                'F000000011': 'No Connectivity Available - Placeholder'
-            }
-            return synthetic_descriptions.get(gin, f'Synthetic {category} {gin}')
-        else:
-            # Generate description for missing products
-            if category == 'Interconnector':
-                return f'Interconnector Cable {gin}'
-            elif category == 'Feeder':
-                return f'Wire Feeder {gin}'
-            elif category == 'Cooler':
-                return f'Cooling Unit {gin}'
-            elif category == 'Torch':
-                return f'Welding Torch {gin}'
-            elif 'Accessory' in category:
-                return f'{category} {gin}'
-            else:
-                return f'{category} Product {gin}'
+        return f'{category} Product {gin}'
+
+@lru_cache(maxsize=1024)
+def classify_sheet(sheet_name):
+    """Return the highest-priority sheet keyword in a sheet name, or None"""
+    found = set(SHEET_RE.findall(sheet_name))
+    return next((key for key in SHEET_PRIORITY if key in found), None)
+
+def infer_compatibility_column(details):
+    """Infer compatibility information for every record based on context"""
+    import numpy as np
+    
+    powersource = details['powersource_gin'].astype(str)
+    sheet_name = details['sheet_name'].astype(str)
+    category = details['category'].astype(str)
+    gin = details['gin'].astype(str)
+    
+    # Map PowerSource GINs to names for readability
+    ps_name = powersource.map(PS_NAMES).fillna('PowerSource ' + powersource)
+    
+    # Context based on sheet; sheet names repeat, so classify each distinct name once
+    sheet_key = sheet_name.map({name: classify_sheet(name) for name in sheet_name.unique()})
+    prefix = sheet_key.map({key: tmpl[0] for key, tmpl in SHEET_TO_TMPL.items()}).fillna('Compatible with ')
+    suffix = sheet_key.map({key: tmpl[1] for key, tmpl in SHEET_TO_TMPL.items()}).fillna('')
+    compatibility = prefix + ps_name + suffix
+    
+    primary = (sheet_key == 'Init') & (category == 'PowerSource')
+    compatibility = compatibility.where(~primary, 'Primary PowerSource for ' + ps_name)
+    
+    # Add category-specific context
+    compatibility += np.select(
+        [
+            category.isin(ROLE_CATEGORIES),
+            category.str.contains('Accessory', regex=False),
+            category == 'Remote'
+        ],
+        [
+            ' (' + category.str.lower() + ' role)',
+            ' (accessory role)',
+            ' (remote control)'
+        ],
+        default=''
+    )
+    
+    # Handle synthetic products
+    placeholder = 'Placeholder - No ' + category.str.lower() + ' available for ' + ps_name
+    return compatibility.where(~gin.str.startswith('F000'), placeholder)
+
+def product_description_column(details):
+    """Get product descriptions from ENG.json names or generate them"""
+    import numpy as np
+    
+    gin = details['gin'].astype(str)
+    category = details['category'].astype(str)
+    
+    # Generate descriptions for synthetic and missing products
+    generated = np.select(
+        [
+            gin.str.startswith('F000'),
+            category == 'Interconnector',
+            category == 'Feeder',
+            category == 'Cooler',
+            category == 'Torch',
+            category.str.contains('Accessory', regex=False)
+        ],
+        [
+            gin.map(SYNTHETIC_DESCRIPTIONS).fillna('Synthetic ' + category + ' ' + gin),
+            'Interconnector Cable ' + gin,
+            'Wire Feeder ' + gin,
+            'Cooling Unit ' + gin,
+            'Welding Torch ' + gin,
+            category + ' ' + gin
+        ],
+        default=category + ' Product ' + gin
+    )
+    
+    # Products in ENG.json use the product name from the detail
+    return np.where(details['exists_in_eng'], details['product_name'], generated)
 
 def main():
     """Main export function"""
+    parser = argparse.ArgumentParser(description="Export GIN extraction data to CSV")
+    parser.add_argument("--use-pandas", action="store_true",
+                       help="Build the CSV with the vectorized pandas path instead of the csv module")
+    args = parser.parse_args()
+    
     print("Exporting GIN extraction data to CSV...")
-    success = export_gin_extraction_csv()
+    success = export_gin_extraction_csv(use_pandas=args.use_pandas)
     
     if success:
         print("✅ CSV export completed successfully!")
@@ -5,25 +5,114 @@ Creates comprehensive report of all GINs extracted by Excel file and sheet
 """
 
 import json
+import os
 import pandas as pd
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
-from collections import defaultdict
+from typing import Dict, List, Any, Tuple, Optional
+from collections import defaultdict, namedtuple
 import logging
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Valid GIN shapes: standard 8-12 digit GINs, F-series synthetic GINs and
+# alphanumeric GINs (checked against the upper-cased value)
+_GIN_RE = re.compile(r'^(?:\d{8,12}|F\d{9}|[0-9A-Z]{8,12})$')
+
+# Keys of an extraction detail record, in report order
+DETAIL_COLUMNS = [
+    'gin', 'category', 'product_name', 'exists_in_eng', 'source_type',
+    'excel_file', 'sheet_name', 'column_name', 'powersource_gin', 'row_index'
+]
+
+# One extraction detail; converted to a dict only when the report is built
+GinInfo = namedtuple('GinInfo', DETAIL_COLUMNS)
+
+# Prefer the Rust calamine reader; pandas' openpyxl reader already opens workbooks
+# in read-only, data-only mode. pandas only knows the calamine engine from 2.2 on.
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine" if tuple(map(int, re.findall(r'\d+', pd.__version__)[:2])) >= (2, 2) else "openpyxl"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+
+# Reporter copy used by ruleset worker processes (set by _init_worker)
+_worker_reporter = None
+
+def _init_worker(reporter: "GINExtractionReporter"):
+    """Process pool initializer: keep one reporter (and its ENG products) per worker"""
+    global _worker_reporter
+    _worker_reporter = reporter
+
+def _extract_ruleset_in_worker(ruleset_file: str, powersource_gin: str) -> List[Tuple[str, List["GinInfo"]]]:
+    """Extract one ruleset workbook in a worker process"""
+    return _worker_reporter.extract_ruleset(ruleset_file, powersource_gin)
+
 class GINExtractionReporter:
+    # Column mapping for categories
+    COLUMN_CATEGORY_MAPPING = {
+        'GIN Powersource': 'PowerSource',
+        'GIN Feeder': 'Feeder',
+        'GIN Cooler': 'Cooler',
+        'GIN Torches': 'Torch',
+        'GIN Interconn': 'Interconnector',
+        'GIN Remote': 'Remote',
+        'GIN_powersource': 'PowerSource',
+        'GIN_feeder': 'Feeder',
+        'GIN_cooler': 'Cooler',
+        'GIN_torches': 'Torch',
+        'GIN_interconn': 'Interconnector',
+        'GIN_remote': 'Remote',
+        'GIN Accessories': 'WeldingAccessory',
+        'GIN_accessories': 'WeldingAccessory',
+        
+        # Additional mappings for accessories
+        'GIN Power Acc': 'PowerSourceAccessory',
+        'GIN_power_acc': 'PowerSourceAccessory',
+        'GIN Feeder Acc': 'FeederAccessory',
+        'GIN_feeder_acc': 'FeederAccessory',
+        'GIN Remote Acc': 'RemoteAccessory',
+        'GIN_remote_acc': 'RemoteAccessory',
+        'GIN Connectivity': 'ConnectivityAccessory',
+        'GIN_connectivity': 'ConnectivityAccessory'
+    }
+    COLUMN_SET = frozenset(COLUMN_CATEGORY_MAPPING)
+    
     def __init__(self, target_powersources: List[str]):
         self.base_path = Path("/Users/bharath/Desktop/AgenticAI/Recommender/Datasets")
-        self.target_powersources = set(self.pad_gin(ps) for ps in target_powersources)
+        # Deduplicated in input order, so processing and report order are stable
+        self.target_powersources = list(dict.fromkeys(self.pad_gin(ps) for ps in target_powersources))
+        
+        # Resolve each PowerSource's ruleset file once
+        self.ruleset_map = {}
+        for powersource_gin in self.target_powersources:
+            ruleset_file = self.find_matching_ruleset(powersource_gin)
+            if ruleset_file:
+                self.ruleset_map[powersource_gin] = ruleset_file
+            else:
+                logger.warning(f"No ruleset found for PowerSource {powersource_gin}")
         
         # Load ENG.json to check which GINs exist
         self.eng_products = self.load_eng_products()
         
+        # Membership and name lookups used while extracting
+        self.eng_gin_set = frozenset(self.eng_products)
+        self.eng_names = {gin: product['name'] for gin, product in self.eng_products.items()}
+        
         # Storage for extraction details
         self.extraction_details = []
         self.gin_sources = defaultdict(list)
@@ -31,29 +120,29 @@ class GINExtractionReporter:
         
     def pad_gin(self, gin: str) -> str:
         """Pad GIN to 10 characters with leading zeros"""
-        if not gin or pd.isna(gin):
+        # Plain strings (the common case) skip the missing-value checks
+        if gin.__class__ is str:
+            return gin.strip().zfill(10) if gin else ""
+        if not gin or gin != gin:  # None/empty or NaN
             return ""
-        gin_str = str(gin).strip()
-        return gin_str.zfill(10)
+        return str(gin).strip().zfill(10)
     
     def load_eng_products(self) -> Dict[str, Dict]:
-        """Load products from ENG.json"""
+        """Load products from ENG.json (streamed one product at a time when ijson is available)"""
         try:
             eng_file = self.base_path / "ENG.json"
-            with open(eng_file, 'r', encoding='utf-8') as f:
-                eng_data = json.load(f)
-            
             products = {}
-            for product in eng_data:
-                gin_raw = product.get('data', {}).get('attributes', {}).get('GIN', '')
-                gin = self.pad_gin(gin_raw)
-                if gin:
-                    products[gin] = {
-                        'name': product.get('data', {}).get('attributes', {}).get('GINName', ''),
-                        'description': product.get('data', {}).get('attributes', {}).get('description', ''),
-                        'available': product.get('data', {}).get('attributes', {}).get('Available', 'true') == 'true',
-                        'original_data': product
-                    }
+            with open(eng_file, 'rb') as f:
+                eng_data = ijson.items(f, 'item') if ijson is not None else json.load(f)
+                
+                for product in eng_data:
+                    attributes = product.get('data', {}).get('attributes', {})
+                    gin = self.pad_gin(attributes.get('GIN', ''))
+                    if gin:
+                        products[gin] = {
+                            'name': attributes.get('GINName', ''),
+                            'available': attributes.get('Available', 'true') == 'true'
+                        }
             
             logger.info(f"Loaded {len(products)} products from ENG.json")
             return products
@@ -85,171 +174,192 @@ class GINExtractionReporter:
         
         return None
     
-    def extract_gins_from_sheet(self, file_path: str, sheet_name: str, powersource_gin: str) -> List[Dict]:
-        """Extract GINs from a specific sheet"""
+    def extract_gins_from_sheet(self, xl: pd.ExcelFile, excel_file_name: str, sheet_name: str, powersource_gin: str) -> List[GinInfo]:
+        """Extract GINs from a specific sheet of an already opened workbook"""
+        excel_file_name = sys.intern(excel_file_name)
+        sheet_name = sys.intern(sheet_name)
+        powersource_gin = sys.intern(powersource_gin)
         try:
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
-            
-            # Column mapping for categories
-            column_category_mapping = {
-                'GIN Powersource': 'PowerSource',
-                'GIN Feeder': 'Feeder',
-                'GIN Cooler': 'Cooler', 
-                'GIN Torches': 'Torch',
-                'GIN Interconn': 'Interconnector',
-                'GIN Remote': 'Remote',
-                'GIN_powersource': 'PowerSource',
-                'GIN_feeder': 'Feeder',
-                'GIN_cooler': 'Cooler',
-                'GIN_torches': 'Torch', 
-                'GIN_interconn': 'Interconnector',
-                'GIN_remote': 'Remote',
-                'GIN Accessories': 'WeldingAccessory',
-                'GIN_accessories': 'WeldingAccessory'
-            }
-            
-            # Additional mappings for accessories
-            accessory_mappings = {
-                'GIN Power Acc': 'PowerSourceAccessory',
-                'GIN_power_acc': 'PowerSourceAccessory',
-                'GIN Feeder Acc': 'FeederAccessory', 
-                'GIN_feeder_acc': 'FeederAccessory',
-                'GIN Remote Acc': 'RemoteAccessory',
-                'GIN_remote_acc': 'RemoteAccessory',
-                'GIN Connectivity': 'ConnectivityAccessory',
-                'GIN_connectivity': 'ConnectivityAccessory'
-            }
-            
-            column_category_mapping.update(accessory_mappings)
+            # Only GIN columns are parsed, as plain strings with empty cells as ""
+            df = xl.parse(
+                sheet_name,
+                usecols=lambda col: col in self.COLUMN_SET,
+                dtype=str,
+                na_filter=False
+            )
             
             extracted_gins = []
             
             for col_name in df.columns:
-                if col_name in column_category_mapping:
-                    category = column_category_mapping[col_name]
+                if col_name in self.COLUMN_SET:
+                    category = sys.intern(self.COLUMN_CATEGORY_MAPPING[col_name])
+                    col_name = sys.intern(col_name)
+                    
+                    # Validate and pad the whole column at once; only valid GINs reach the loop
+                    values = df[col_name].str.strip()
+                    valid = values.str.upper().str.match(_GIN_RE)
+                    gins = values[valid].str.zfill(10)
                     
-                    for idx, value in df[col_name].items():
-                        if pd.isna(value) or not self.is_valid_gin(value):
-                            continue
+                    for idx, gin in gins.items():
+                        gin = sys.intern(gin)
+                        # Check if exists in ENG.json
+                        exists_in_eng = gin in self.eng_gin_set
+                        product_name = self.eng_names[gin] if exists_in_eng else f'Unknown Product {gin}'
                         
-                        gin = self.pad_gin(value)
-                        if gin:
-                            # Check if exists in ENG.json
-                            exists_in_eng = gin in self.eng_products
-                            product_name = self.eng_products.get(gin, {}).get('name', f'Unknown Product {gin}')
-                            
-                            gin_info = {
-                                'gin': gin,
-                                'category': category,
-                                'product_name': product_name,
-                                'exists_in_eng': exists_in_eng,
-                                'source_type': 'catalog' if exists_in_eng else 'synthetic',
-                                'excel_file': Path(file_path).name,
-                                'sheet_name': sheet_name,
-                                'column_name': col_name,
-                                'powersource_gin': powersource_gin,
-                                'row_index': idx
-                            }
-                            
-                            extracted_gins.append(gin_info)
-                            
-                            # Store for category tracking
-                            self.gin_categories[gin] = category
-                            self.gin_sources[gin].append({
-                                'file': Path(file_path).name,
-                                'sheet': sheet_name,
-                                'column': col_name,
-                                'powersource': powersource_gin
-                            })
+                        gin_info = GinInfo(
+                            gin=gin,
+                            category=category,
+                            product_name=product_name,
+                            exists_in_eng=exists_in_eng,
+                            source_type='catalog' if exists_in_eng else 'synthetic',
+                            excel_file=excel_file_name,
+                            sheet_name=sheet_name,
+                            column_name=col_name,
+                            powersource_gin=powersource_gin,
+                            row_index=idx
+                        )
+                        
+                        extracted_gins.append(gin_info)
             
             return extracted_gins
             
         except Exception as e:
-            logger.error(f"Error extracting from {file_path}, sheet {sheet_name}: {e}")
+            logger.error(f"Error extracting from {excel_file_name}, sheet {sheet_name}: {e}")
             return []
     
-    def is_valid_gin(self, value) -> bool:
-        """Check if value looks like a valid GIN"""
-        if pd.isna(value):
-            return False
-        
-        value_str = str(value).strip()
-        if not value_str:
-            return False
-        
-        # Standard 10-digit GIN
-        if re.match(r'^\d{8,12}$', value_str):
-            return True
-        
-        # F-series synthetic GINs
-        if re.match(r'^F\d{9}$', value_str):
-            return True
-        
-        # Handle alphanumeric GINs
-        if re.match(r'^[0-9A-Z]{8,12}$', value_str.upper()):
+    def extract_ruleset(self, ruleset_file: str, powersource_gin: str) -> List[Tuple[str, List[GinInfo]]]:
+        """Extract GINs from every sheet of a ruleset workbook as (sheet name, GINs) pairs"""
+        # Open the workbook once; every sheet is parsed from the same ExcelFile
+        excel_file = pd.ExcelFile(ruleset_file, engine=EXCEL_ENGINE)
+        excel_file_name = Path(ruleset_file).name
+        return [
+            (
+                sheet_name,
+                self.extract_gins_from_sheet(excel_file, excel_file_name, sheet_name, powersource_gin)
+                if self.has_gin_columns(excel_file, sheet_name) else []
+            )
+            for sheet_name in excel_file.sheet_names
+        ]
+    
+    def has_gin_columns(self, xl: pd.ExcelFile, sheet_name: str) -> bool:
+        """Header-only read, so sheets without any GIN column skip the full parse"""
+        try:
+            header = xl.parse(sheet_name, nrows=0).columns
+        except Exception:
+            # Let the full parse report the error
             return True
-        
-        return False
+        return not self.COLUMN_SET.isdisjoint(header)
     
-    def generate_report(self) -> Dict[str, Any]:
-        """Generate comprehensive extraction report"""
+    def record_gin_sources(self, sheet_gins: List[GinInfo]):
+        """Track categories and sources of extracted GINs"""
+        for gin_info in sheet_gins:
+            gin = gin_info.gin
+            self.gin_categories[gin] = gin_info.category
+            self.gin_sources[gin].append({
+                'file': gin_info.excel_file,
+                'sheet': gin_info.sheet_name,
+                'column': gin_info.column_name,
+                'powersource': gin_info.powersource_gin
+            })
+    
+    def generate_report(self, details_file: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Generate comprehensive extraction report.
+        
+        With details_file, extraction details are written there as JSON Lines and
+        the report references the file by name instead of embedding every record.
+        """
         logger.info("=" * 80)
         logger.info("GENERATING COMPREHENSIVE GIN EXTRACTION REPORT")
         logger.info("=" * 80)
+        logger.info(f"Excel engine: {EXCEL_ENGINE}")
         
-        # Process each target PowerSource
-        for powersource_gin in self.target_powersources:
-            logger.info(f"Processing PowerSource: {powersource_gin}")
-            
-            # Find and process ruleset
-            ruleset_file = self.find_matching_ruleset(powersource_gin)
-            if not ruleset_file:
-                logger.warning(f"No ruleset found for PowerSource {powersource_gin}")
-                continue
-            
-            logger.info(f"Processing ruleset: {Path(ruleset_file).name}")
+        # Rulesets are independent and CPU-bound to parse, so each one is
+        # extracted in its own process; results are merged in PowerSource order
+        with ProcessPoolExecutor(
+            max_workers=max(1, min(len(self.ruleset_map), os.cpu_count() or 1)),
+            initializer=_init_worker,
+            initargs=(self,)
+        ) as executor:
+            futures = {
+                ps: executor.submit(_extract_ruleset_in_worker, ruleset_file, ps)
+                for ps, ruleset_file in self.ruleset_map.items()
+            }
             
-            # Get all sheets in the Excel file
-            try:
-                excel_file = pd.ExcelFile(ruleset_file)
-                for sheet_name in excel_file.sheet_names:
-                    logger.info(f"  Processing sheet: {sheet_name}")
-                    
-                    sheet_gins = self.extract_gins_from_sheet(
-                        ruleset_file, sheet_name, powersource_gin
-                    )
-                    
-                    self.extraction_details.extend(sheet_gins)
-                    logger.info(f"    Extracted {len(sheet_gins)} GINs from {sheet_name}")
-                    
-            except Exception as e:
-                logger.error(f"Error processing {ruleset_file}: {e}")
+            # Process each target PowerSource
+            for powersource_gin, ruleset_file in self.ruleset_map.items():
+                logger.info(f"Processing PowerSource: {powersource_gin}")
+                
+                logger.info(f"Processing ruleset: {Path(ruleset_file).name}")
+                
+                try:
+                    for sheet_name, sheet_gins in futures[powersource_gin].result():
+                        logger.info(f"  Processing sheet: {sheet_name}")
+                        
+                        self.extraction_details.extend(sheet_gins)
+                        self.record_gin_sources(sheet_gins)
+                        logger.info(f"    Extracted {len(sheet_gins)} GINs from {sheet_name}")
+                        
+                except Exception as e:
+                    logger.error(f"Error processing {ruleset_file}: {e}")
+        
+        # One frame over all details feeds the grouped statistics below
+        details = self.details_frame()
         
         # Analyze inconsistencies
-        inconsistencies = self.analyze_inconsistencies()
+        inconsistencies = self.analyze_inconsistencies(details)
         
         # Generate summary statistics
-        summary = self.generate_summary()
+        summary = self.generate_summary(details)
+        
+        catalog_products = int(details['exists_in_eng'].sum())
         
         report = {
             'metadata': {
-                'total_gins_extracted': len(self.extraction_details),
-                'unique_gins': len(set(g['gin'] for g in self.extraction_details)),
-                'catalog_products': len([g for g in self.extraction_details if g['exists_in_eng']]),
-                'synthetic_products': len([g for g in self.extraction_details if not g['exists_in_eng']]),
+                'total_gins_extracted': len(details),
+                'unique_gins': int(details['gin'].nunique()),
+                'catalog_products': catalog_products,
+                'synthetic_products': len(details) - catalog_products,
                 'target_powersources': list(self.target_powersources),
-                'files_processed': len(set(g['excel_file'] for g in self.extraction_details)),
-                'sheets_processed': len(set(f"{g['excel_file']}:{g['sheet_name']}" for g in self.extraction_details))
-            },
-            'extraction_details': self.extraction_details,
-            'inconsistencies': inconsistencies,
-            'summary': summary
+                'files_processed': int(details['excel_file'].nunique()),
+                'sheets_processed': details.groupby(['excel_file', 'sheet_name']).ngroups
+            }
         }
         
+        if details_file:
+            self.write_extraction_details(details_file)
+            report['extraction_details_file'] = Path(details_file).name
+        else:
+            report['extraction_details'] = [detail._asdict() for detail in self.extraction_details]
+        
+        report['inconsistencies'] = inconsistencies
+        report['summary'] = summary
+        
         return report
     
-    def analyze_inconsistencies(self) -> Dict[str, Any]:
+    def write_extraction_details(self, details_file: str):
+        """Write extraction details as JSON Lines, one record per line"""
+        if orjson is not None:
+            dumps = orjson.dumps
+        else:
+            dumps = lambda record: json.dumps(record, ensure_ascii=False).encode('utf-8')
+        
+        with open(details_file, 'wb') as f:
+            for detail in self.extraction_details:
+                f.write(dumps(detail._asdict()))
+                f.write(b'\n')
+    
+    def details_frame(self) -> pd.DataFrame:
+        """Extraction details as a DataFrame for grouped statistics"""
+        details = pd.DataFrame.from_records(self.extraction_details, columns=DETAIL_COLUMNS)
+        details['exists_in_eng'] = details['exists_in_eng'].astype(bool)
+        return details
+    
+    def analyze_inconsistencies(self, details: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """Analyze data inconsistencies"""
+        if details is None:
+            details = self.details_frame()
+        
         inconsistencies = {
             'category_conflicts': [],
             'missing_from_eng': [],
@@ -257,77 +367,64 @@ class GINExtractionReporter:
             'suspicious_patterns': []
         }
         
+        # Row positions of each GIN's details, so sources are sliced rather than rescanned
+        by_gin = details.groupby('gin', sort=False)
+        rows_by_gin = by_gin.indices
+        
         # Check for category conflicts (same GIN with different categories)
-        gin_categories_multi = defaultdict(set)
-        for detail in self.extraction_details:
-            gin_categories_multi[detail['gin']].add(detail['category'])
+        gin_categories_multi = by_gin['category'].unique()
         
         for gin, categories in gin_categories_multi.items():
             if len(categories) > 1:
                 inconsistencies['category_conflicts'].append({
                     'gin': gin,
                     'categories': list(categories),
-                    'sources': [d for d in self.extraction_details if d['gin'] == gin]
+                    'sources': [self.extraction_details[i]._asdict() for i in rows_by_gin[gin]]
                 })
         
         # Find missing from ENG.json (high-frequency synthetic products)
-        gin_frequency = defaultdict(int)
-        for detail in self.extraction_details:
-            if not detail['exists_in_eng']:
-                gin_frequency[detail['gin']] += 1
+        gin_frequency = details[~details['exists_in_eng']].groupby('gin', sort=False).size()
         
-        high_freq_missing = {gin: freq for gin, freq in gin_frequency.items() if freq >= 3}
+        high_freq_missing = gin_frequency[gin_frequency >= 3]
         inconsistencies['missing_from_eng'] = [
             {
                 'gin': gin,
-                'frequency': freq,
+                'frequency': int(freq),
                 'category': self.gin_categories.get(gin, 'Unknown'),
-                'sources': [d for d in self.extraction_details if d['gin'] == gin][:3]  # First 3 sources
+                'sources': [self.extraction_details[i]._asdict() for i in rows_by_gin[gin][:3]]  # First 3 sources
             }
             for gin, freq in high_freq_missing.items()
         ]
         
         # Find suspicious patterns (e.g., obvious product names that should exist)
-        for detail in self.extraction_details:
-            if not detail['exists_in_eng'] and not detail['gin'].startswith('F'):
-                # Non-F synthetic GINs that might actually exist
-                inconsistencies['suspicious_patterns'].append(detail)
+        # Non-F synthetic GINs that might actually exist
+        suspicious = ~details['exists_in_eng'] & ~details['gin'].str.startswith('F')
+        inconsistencies['suspicious_patterns'] = details[suspicious].to_dict('records')
         
         return inconsistencies
     
-    def generate_summary(self) -> Dict[str, Any]:
+    def generate_summary(self, details: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """Generate summary statistics"""
-        # Category breakdown
-        category_stats = defaultdict(lambda: {'total': 0, 'catalog': 0, 'synthetic': 0})
+        if details is None:
+            details = self.details_frame()
         
-        for detail in self.extraction_details:
-            category = detail['category']
-            category_stats[category]['total'] += 1
-            if detail['exists_in_eng']:
-                category_stats[category]['catalog'] += 1
-            else:
-                category_stats[category]['synthetic'] += 1
+        # Category breakdown (groups keep first-seen order)
+        category_stats = details.groupby('category', sort=False)['exists_in_eng'].agg(total='size', catalog='sum')
+        category_stats['synthetic'] = category_stats['total'] - category_stats['catalog']
         
         # File breakdown
-        file_stats = defaultdict(lambda: {'total_gins': 0, 'unique_gins': set(), 'sheets': set()})
-        
-        for detail in self.extraction_details:
-            file_name = detail['excel_file']
-            file_stats[file_name]['total_gins'] += 1
-            file_stats[file_name]['unique_gins'].add(detail['gin'])
-            file_stats[file_name]['sheets'].add(detail['sheet_name'])
-        
-        # Convert sets to counts for JSON serialization
-        for file_name in file_stats:
-            file_stats[file_name]['unique_gins'] = len(file_stats[file_name]['unique_gins'])
-            file_stats[file_name]['sheets'] = len(file_stats[file_name]['sheets'])
+        file_stats = details.groupby('excel_file', sort=False).agg(
+            total_gins=('gin', 'size'),
+            unique_gins=('gin', 'nunique'),
+            sheets=('sheet_name', 'nunique')
+        )
         
         return {
-            'category_breakdown': dict(category_stats),
-            'file_breakdown': dict(file_stats),
+            'category_breakdown': category_stats.to_dict('index'),
+            'file_breakdown': file_stats.to_dict('index'),
             'top_missing_gins': sorted(
                 [(gin, len(sources)) for gin, sources in self.gin_sources.items() 
-                 if gin not in self.eng_products and not gin.startswith('F')],
+                 if gin not in self.eng_gin_set and not gin.startswith('F')],
                 key=lambda x: x[1], reverse=True
             )[:10]
         }
@@ -338,12 +435,18 @@ def main():
     target_powersources = ['0465350883', '0465350884', '0445555880', '0445250880', '0446200880']
     
     reporter = GINExtractionReporter(target_powersources)
-    report = reporter.generate_report()
     
-    # Save detailed report
+    # Save detailed report; per-GIN extraction records go to a JSON Lines file next to it
     output_file = '/Users/bharath/Desktop/AgenticAI/Recommender/neo4j_datasets/gin_extraction_report.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    details_file = '/Users/bharath/Desktop/AgenticAI/Recommender/neo4j_datasets/gin_extraction_details.jsonl'
+    report = reporter.generate_report(details_file)
+    
+    if orjson is not None:
+        # orjson writes UTF-8 bytes directly (same layout as the json.dump fallback)
+        Path(output_file).write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
     
     logger.info(f"Detailed report saved to: {output_file}")
     
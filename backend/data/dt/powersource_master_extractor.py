@@ -18,31 +18,124 @@ Output: product_catalog.json, compatibility_rules.json, golden_packages.json, sa
 import pandas as pd
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, Set, List, Any, Tuple
+from typing import Dict, Set, List, Any, Tuple, Optional
 from collections import defaultdict
 import re
+import sys
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Non-F000 GIN shapes (matched against the upper-cased cell): 8+ digits or
+# 8-12 character alphanumerics such as "114P381040"
+_GIN_RE = re.compile(r'\d{8,}|[0-9A-Z]{8,12}')
+
+# Prefer the Rust calamine reader for workbooks; pandas' openpyxl reader
+# (read-only, values only) is the fallback. pandas only knows the calamine
+# engine from 2.2 on.
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine" if tuple(map(int, re.findall(r'\d+', pd.__version__)[:2])) >= (2, 2) else "openpyxl"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+
+# Sales CSV reader: pyarrow's multithreaded parser with Arrow-backed GIN strings
+# when pyarrow is installed, pandas' C parser otherwise
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE, GIN_DTYPE = "pyarrow", "string[pyarrow]"
+except ImportError:
+    CSV_ENGINE, GIN_DTYPE = "c", "string"
+
+# Polars runs the whole sales filter as one lazy query when it is installed
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
 class PowerSourceMasterExtractor:
+    # Rule type implied by the first keyword found in a ruleset source's sheet part
+    _SHEET_KEYWORD_MAP = [
+        ('Accessories', 'accessory_compatibility'),
+        ('Torch', 'torch_compatibility'),
+        ('Feeder', 'feeder_compatibility'),
+        ('Remote', 'remote_compatibility'),
+        ('Connectivity', 'connectivity_compatibility'),
+        ('Interconn', 'connectivity_compatibility'),
+    ]
+    _SHEET_CACHE: Dict[str, str] = {}
+    
+    # Names for F000 placeholder GINs (integrated / absent components)
+    F000_NAME_MAP = {
+        'F000000007': 'No Feeder Available',
+        'F000000005': 'No Cooler Available',
+        'F000000002': 'No Cooler Available',
+        'F000000003': 'No Torch Available',
+        'F000000006': 'No Torch Available',
+        'F000000008': 'No Interconnector Available',
+        'F000000009': 'No Feeder Accessory Available',
+        'F000000010': 'No Accessory Available',
+        'F000000011': 'No Connectivity Available'
+    }
+    
+    # Synthetic product name per category: (required rule type, name template)
+    CATEGORY_NAME_TEMPLATES = {
+        'Remote': ('remote_compatibility', 'Remote Control {gin}'),
+        'Torch': ('torch_compatibility', 'Welding Torch {gin}'),
+        'Feeder': ('feeder_compatibility', 'Wire Feeder {gin}'),
+        'Interconnector': ('connectivity_compatibility', 'Interconnector Cable {gin}')
+    }
+    
+    # Ruleset sheets that hold documentation rather than GINs
+    _SKIP_SHEETS = frozenset({'Description', 'Attributes'})
+    
+    # Map of PowerSource GINs to names
+    TARGET_POWERSOURCES_NAMES = {
+        "0465350883": "Warrior 500i",
+        "0465350884": "Warrior 400i",
+        "0445555880": "Warrior 750i 380-460V CE",
+        "0445250880": "Renegade ES 300i",
+        "0446200880": "Aristo 500ix"
+    }
+    
     def __init__(self, target_powersources: List[str]):
         self.base_path = Path("/Users/bharath/Desktop/AgenticAI/Recommender/Datasets")
         
         # Target PowerSources (can be 1 or more)
-        self.target_powersources = set(self.pad_gin(ps) for ps in target_powersources)
+        self.target_powersources = frozenset(self.pad_gin(ps) for ps in target_powersources)
+        self._target_list = sorted(self.target_powersources)
         
         # Master GIN discovery
         self.master_gin_list = set()
         self.gin_sources = defaultdict(list)  # Track where each GIN was discovered
+        self._source_log: List[Tuple[str, str]] = []  # (gin, source) pairs, grouped into gin_sources per step
+        self._gins_from_golden = set()
+        self._gins_from_ruleset = set()
         
         # Category inference from rulesets
         self.gin_categories = {}
         
-        logger.info(f"Initializing PowerSource Master Extractor for: {self.target_powersources}")
+        # Golden packages sheet, parsed once and shared by discovery and filtering
+        self._golden_df: Optional[pd.DataFrame] = None
+        
+        # ENG.json products keyed by padded GIN, loaded on first use
+        self._existing_products = None
+        
+        # gin_categories as a Series for bulk lookups, built after discovery
+        self._category_series: Optional[pd.Series] = None
+        
+        logger.info(f"Initializing PowerSource Master Extractor for: {self._target_list}")
     
     def pad_gin(self, gin: str) -> str:
         """Pad GIN to 10 characters with leading zeros"""
@@ -53,25 +146,35 @@ class PowerSourceMasterExtractor:
             return gin_str
         return gin_str.zfill(10)
     
+    @staticmethod
+    def pad_gin_series(series: pd.Series) -> pd.Series:
+        """Vectorized pad_gin: strip, keep F000 placeholders, zero-pad the rest; nulls become empty"""
+        s = series.astype('string').str.strip().fillna('')
+        return s.where(s.str.startswith('F000') | s.eq(''), s.str.zfill(10))
+    
+    def _load_golden(self) -> pd.DataFrame:
+        """Golden packages sheet, parsed on first use and cached on the extractor"""
+        if self._golden_df is None:
+            golden_file = self.base_path / "golden_pkg_format_V2.xlsx"
+            self._golden_df = pd.read_excel(golden_file, sheet_name='Sheet1', engine=EXCEL_ENGINE)
+            logger.info(f"Golden packages loaded: {self._golden_df.shape}")
+        return self._golden_df
+    
+    def _flush_source_log(self):
+        """Group the logged (gin, source) pairs into gin_sources, keeping discovery order"""
+        gin_sources = self.gin_sources
+        for gin, source in self._source_log:
+            gin_sources[gin].append(source)
+        self._source_log.clear()
+    
     def discover_gins_from_golden_packages(self):
         """Discover all GINs related to target PowerSources from golden packages"""
         logger.info("🔍 Discovering GINs from Golden Packages...")
         
-        golden_file = self.base_path / "golden_pkg_format_V2.xlsx"
-        
         try:
-            df = pd.read_excel(golden_file, sheet_name='Sheet1')
-            logger.info(f"Golden packages loaded: {df.shape}")
+            df = self._load_golden()
             
-            # Find packages containing target PowerSources
-            related_packages = []
-            for idx, row in df.iterrows():
-                ps_gin = self.pad_gin(row.get('powersource gin', ''))
-                if ps_gin in self.target_powersources:
-                    related_packages.append(row)
-                    logger.info(f"Found package for PowerSource {ps_gin}: {row.get('powersource name', 'Unknown')}")
-            
-            # Extract ALL GINs from related packages
+            # GIN columns in a golden package and the category each one implies
             column_mappings = {
                 'powersource gin': 'PowerSource',
                 'feeder gin': 'Feeder',
@@ -83,20 +186,34 @@ class PowerSourceMasterExtractor:
                 'GIN Cooler Accessories': 'CoolerAccessory'
             }
             
-            for package in related_packages:
-                ps_gin = self.pad_gin(package.get('powersource gin', ''))
-                for col_name, category in column_mappings.items():
-                    gin_value = package.get(col_name, '')
-                    if pd.notna(gin_value) and str(gin_value).strip():
-                        gin = self.pad_gin(gin_value)
-                        if gin:
-                            self.master_gin_list.add(gin)
-                            self.gin_sources[gin].append(f"golden_package_{ps_gin}")
-                            if gin not in self.gin_categories:
-                                self.gin_categories[gin] = category
-                            logger.info(f"  Discovered {gin} ({category}) from golden package")
+            # Pad each GIN column on its own dtype before melting; melting mixed
+            # int/float columns would upcast integer GINs to float strings
+            gins = df.reindex(columns=list(column_mappings)).apply(self.pad_gin_series)
             
-            logger.info(f"✅ Golden Packages: Discovered {len([g for g in self.master_gin_list if any('golden_package' in src for src in self.gin_sources[g])])} GINs")
+            # Find packages containing target PowerSources
+            related = gins.assign(_ps=gins['powersource gin'])
+            related = related[related['_ps'].isin(self._target_list)]
+            logger.info(f"Found {len(related)} packages for target PowerSources")
+            
+            # Extract ALL GINs from related packages, one row per (package, column) cell
+            # in package order so first-seen categories and source order are unchanged
+            cells = related.melt(id_vars='_ps', var_name='column', value_name='gin', ignore_index=False)
+            cells = cells.sort_index(kind='stable')
+            cells = cells[cells['gin'] != '']
+            categories = cells['column'].map(column_mappings)
+            
+            debug = logger.isEnabledFor(logging.DEBUG)
+            self.master_gin_list.update(cells['gin'])
+            self._gins_from_golden.update(cells['gin'])
+            for gin, ps_gin, category in zip(cells['gin'], cells['_ps'], categories):
+                self._source_log.append((gin, sys.intern(f"golden_package_{ps_gin}")))
+                if gin not in self.gin_categories:
+                    self.gin_categories[gin] = category
+                if debug:
+                    logger.debug(f"  Discovered {gin} ({category}) from golden package {ps_gin}")
+            self._flush_source_log()
+            
+            logger.info(f"✅ Golden Packages: Discovered {len(self._gins_from_golden)} GINs")
             
         except Exception as e:
             logger.error(f"Error processing golden packages: {e}")
@@ -116,29 +233,66 @@ class PowerSourceMasterExtractor:
             "0446200880": "HIP configurator_Aristo 500ix_08092025.xlsx"     # Aristo 500ix
         }
         
-        for ps_gin in self.target_powersources:
+        jobs = []
+        for ps_gin in self._target_list:
             if ps_gin in powersource_file_mapping:
                 file_name = powersource_file_mapping[ps_gin]
-                file_path = ruleset_dir / file_name
-                
                 logger.info(f"Processing ruleset for {ps_gin}: {file_name}")
-                
-                try:
-                    self._extract_gins_from_ruleset_file(file_path, ps_gin)
-                except Exception as e:
-                    logger.error(f"Error processing {file_name}: {e}")
+                jobs.append((ps_gin, file_name, ruleset_dir / file_name))
+        
+        extract = partial(self._extract_gins_from_ruleset_file, target_list=self._target_list)
+        if len(jobs) > 1:
+            # Workbooks are independent: calamine parses without holding the GIL, so
+            # threads suffice; the openpyxl reader needs worker processes
+            executor = ThreadPoolExecutor if EXCEL_ENGINE == "calamine" else ProcessPoolExecutor
+            with executor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+                futures = [pool.submit(extract, path, ps_gin) for ps_gin, _, path in jobs]
+            results = [future.result for future in futures]
+        else:
+            results = [partial(extract, path, ps_gin) for ps_gin, _, path in jobs]
         
-        ruleset_gins = len([g for g in self.master_gin_list if any('ruleset' in src for src in self.gin_sources[g])])
-        logger.info(f"✅ Rulesets: Discovered {ruleset_gins} additional GINs")
+        # Merge in PowerSource order so first-seen categories and source order
+        # match a sequential run
+        for (_, file_name, _), result in zip(jobs, results):
+            try:
+                gins, categories, source_log = result()
+            except Exception as e:
+                logger.error(f"Error processing {file_name}: {e}")
+                continue
+            
+            self.master_gin_list.update(gins)
+            self._gins_from_ruleset.update(gins)
+            for gin, category in categories.items():
+                if gin not in self.gin_categories:
+                    self.gin_categories[gin] = category
+            self._source_log.extend(source_log)
+        self._flush_source_log()
+        
+        logger.info(f"✅ Rulesets: Discovered {len(self._gins_from_ruleset)} additional GINs")
     
-    def _extract_gins_from_ruleset_file(self, file_path: Path, powersource_gin: str):
-        """Extract GINs from a specific ruleset file"""
+    @staticmethod
+    def _extract_gins_from_ruleset_file(file_path: Path, powersource_gin: str,
+                                        target_list: List[str]) -> Tuple[Set[str], Dict[str, str], List[Tuple[str, str]]]:
+        """Extract GINs from a specific ruleset file.
+        
+        Returns (gins, first-seen category per GIN, (gin, source) pairs). Only
+        the path, PowerSource and target list go to the worker, not the
+        extractor and its loaded data.
+        """
+        gins = set()
+        categories = {}
+        source_log = []
+        
         if not file_path.exists():
             logger.warning(f"Ruleset file not found: {file_path}")
-            return
+            return gins, categories, source_log
         
         try:
-            excel_file = pd.ExcelFile(file_path)
+            # Open the workbook once and parse every non-description sheet in one call
+            with pd.ExcelFile(file_path, engine=EXCEL_ENGINE) as excel_file:
+                sheet_names = [name for name in excel_file.sheet_names
+                               if name not in PowerSourceMasterExtractor._SKIP_SHEETS]
+                sheets = excel_file.parse(sheet_name=sheet_names)
             
             # Define category mappings based on COLUMN NAMES (not sheet names)
             column_category_mapping = {
@@ -189,93 +343,102 @@ class PowerSourceMasterExtractor:
                 'Connectivity Name': 'ConnectivityAccessory',
             }
             
-            for sheet_name in excel_file.sheet_names:
-                if sheet_name in ['Description', 'Attributes']:
-                    continue  # Skip description/attribute sheets
+            for sheet_name, df in sheets.items():
+                if df.empty:
+                    continue
                 
                 try:
-                    df = pd.read_excel(file_path, sheet_name=sheet_name)
-                    if len(df) == 0:
-                        continue
                     
-                    # Extract GINs using COLUMN-BASED categorization
-                    for idx, row in df.iterrows():
-                        for col_name, value in row.items():
-                            if pd.notna(value):
-                                value_str = str(value).strip()
-                                # Look for GIN patterns
-                                if self._is_valid_gin_pattern(value_str):
-                                    gin = self.pad_gin(value_str)
-                                    if gin:
-                                        # Determine category based on COLUMN NAME, not sheet name
-                                        category = column_category_mapping.get(col_name, 'Unknown')
-                                        
-                                        # CRITICAL FIX: Only add PowerSource GINs that are in target_powersources
-                                        # All other categories should be added without restriction
-                                        if category == 'PowerSource':
-                                            if gin in self.target_powersources:
-                                                self.master_gin_list.add(gin)
-                                                self.gin_sources[gin].append(f"ruleset_{powersource_gin}_{sheet_name}_{col_name}")
-                                                if gin not in self.gin_categories:
-                                                    self.gin_categories[gin] = category
-                                                logger.info(f"    Added target PowerSource from ruleset: {gin}")
-                                            else:
-                                                logger.info(f"    Skipped non-target PowerSource: {gin} (not in config)")
-                                        else:
-                                            # Non-PowerSource components: add without restriction
-                                            self.master_gin_list.add(gin)
-                                            self.gin_sources[gin].append(f"ruleset_{powersource_gin}_{sheet_name}_{col_name}")
-                                            if gin not in self.gin_categories:
-                                                self.gin_categories[gin] = category
+                    # Extract GINs using COLUMN-BASED categorization: flatten the sheet
+                    # into one (column, value) cell per row in sheet order and match
+                    # the GIN pattern on the whole column at once
+                    cells = df.melt(var_name='column', value_name='_value', ignore_index=False)
+                    cells = cells[cells['_value'].notna()].sort_index(kind='stable')
+                    values = cells['_value'].astype('string').str.strip()
+                    is_gin = values.str.startswith('F000') | values.str.upper().str.fullmatch(_GIN_RE)
+                    
+                    hits = cells.loc[is_gin, ['column']]
+                    hits['gin'] = PowerSourceMasterExtractor.pad_gin_series(values[is_gin])
+                    # Determine category based on COLUMN NAME, not sheet name
+                    hits['category'] = hits['column'].map(column_category_mapping).fillna('Unknown')
+                    
+                    # CRITICAL FIX: Only add PowerSource GINs that are in target_powersources
+                    # All other categories should be added without restriction
+                    is_ps = hits['category'] == 'PowerSource'
+                    is_target = hits['gin'].isin(target_list)
+                    skipped = is_ps & ~is_target
+                    if logger.isEnabledFor(logging.DEBUG):
+                        for gin, target in zip(hits.loc[is_ps, 'gin'], is_target[is_ps]):
+                            if target:
+                                logger.debug(f"    Added target PowerSource from ruleset: {gin}")
+                            else:
+                                logger.debug(f"    Skipped non-target PowerSource: {gin} (not in config)")
+                    hits = hits[~skipped]
+                    
+                    gins.update(hits['gin'])
+                    # One interned source string per column, shared by all its GINs
+                    column_sources = {
+                        col_name: sys.intern(f"ruleset_{powersource_gin}_{sheet_name}_{col_name}")
+                        for col_name in hits['column'].unique()
+                    }
+                    for gin, col_name, category in zip(hits['gin'], hits['column'], hits['category']):
+                        source_log.append((gin, column_sources[col_name]))
+                        if gin not in categories:
+                            categories[gin] = category
+                    
+                    logger.info(f"    Sheet {sheet_name}: {len(hits)} GINs discovered, {int(skipped.sum())} non-target PowerSources skipped")
                 
                 except Exception as e:
                     logger.warning(f"Could not process sheet {sheet_name}: {e}")
                     
         except Exception as e:
             logger.error(f"Error processing ruleset file {file_path}: {e}")
+        
+        return gins, categories, source_log
     
-    def _is_valid_gin_pattern(self, value: str) -> bool:
-        """Check if value matches GIN pattern"""
-        # GIN patterns: 10 digits, F000 series, or specific alphanumeric patterns
-        if value.startswith('F000'):
-            return True
-        if value.isdigit() and len(value) >= 8:
-            return True
-        # Handle alphanumeric GINs like "114P381040"
-        if re.match(r'^[0-9A-Z]{8,12}$', value.upper()):
-            return True
-        return False
+    def _categories_for(self, gins) -> pd.Series:
+        """Category per GIN ('Unknown' when undiscovered) via one map against the category table"""
+        if self._category_series is None:
+            self._category_series = pd.Series(self.gin_categories, name='category', dtype=object)
+        return pd.Series(gins, dtype=object).map(self._category_series).fillna('Unknown')
     
-    def create_enhanced_product_catalog(self):
-        """Create enhanced product catalog with synthetic entries for missing GINs"""
-        logger.info("📦 Creating Enhanced Product Catalog...")
+    def load_existing_products(self) -> Dict[str, Any]:
+        """Load ENG.json products keyed by padded GIN (memoized on the extractor)"""
+        if self._existing_products is not None:
+            return self._existing_products
         
-        # Load existing product catalog
         eng_file = self.base_path / "ENG.json"
-        existing_products = {}
         
         try:
-            with open(eng_file, 'r', encoding='utf-8') as f:
-                eng_data = json.load(f)
+            raw = eng_file.read_bytes()
+            eng_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
-            for product in eng_data:
-                # Handle ENG.json structure: product['data']['attributes']['GIN']
-                gin_raw = product.get('data', {}).get('attributes', {}).get('GIN', '')
-                gin = self.pad_gin(gin_raw)
-                if gin:
-                    existing_products[gin] = product
+            # Handle ENG.json structure: product['data']['attributes']['GIN']
+            gins = pd.Series([product.get('data', {}).get('attributes', {}).get('GIN', '') for product in eng_data], dtype=object)
+            existing_products = {gin: product for gin, product in zip(self.pad_gin_series(gins).tolist(), eng_data) if gin}
             
             logger.info(f"Loaded {len(existing_products)} existing products from ENG.json")
             
         except Exception as e:
             logger.error(f"Error loading ENG.json: {e}")
-            existing_products = {}
+            return {}
+        
+        self._existing_products = existing_products
+        return existing_products
+    
+    def create_enhanced_product_catalog(self):
+        """Create enhanced product catalog with synthetic entries for missing GINs"""
+        logger.info("📦 Creating Enhanced Product Catalog...")
+        
+        # Load existing product catalog
+        existing_products = self.load_existing_products()
         
         # Create enhanced catalog
         enhanced_catalog = []
         missing_count = 0
         
-        for gin in sorted(self.master_gin_list):
+        master_gins = sorted(self.master_gin_list)
+        for gin, category in zip(master_gins, self._categories_for(master_gins)):
             if gin in existing_products:
                 # Use existing product from ENG.json structure
                 eng_product = existing_products[gin]
@@ -285,7 +448,7 @@ class PowerSourceMasterExtractor:
                     'gin': gin,  # Ensure padded format
                     'name': attrs.get('GINName', f'Product {gin}'),
                     'description': attrs.get('description', f'Product {gin}'),
-                    'category': self.gin_categories.get(gin, 'Unknown'),
+                    'category': category,
                     'available': attrs.get('Available', 'true') == 'true',
                     'source': 'catalog',
                     'original_data': eng_product
@@ -293,7 +456,7 @@ class PowerSourceMasterExtractor:
                 enhanced_catalog.append(product)
             else:
                 # Create synthetic product
-                synthetic_product = self._create_synthetic_product(gin)
+                synthetic_product = self._create_synthetic_product(gin, category)
                 enhanced_catalog.append(synthetic_product)
                 missing_count += 1
                 logger.info(f"Created synthetic product for {gin}: {synthetic_product['name']}")
@@ -305,16 +468,15 @@ class PowerSourceMasterExtractor:
                 "total_products": len(enhanced_catalog),
                 "existing_products": len(enhanced_catalog) - missing_count,
                 "synthetic_products": missing_count,
-                "target_powersources": list(self.target_powersources),
+                "target_powersources": self._target_list,
                 "generated_date": datetime.now().strftime("%Y-%m-%d"),
                 "source": "Enhanced catalog from ENG.json + synthetic products"
             },
             "products": enhanced_catalog
         }
     
-    def _create_synthetic_product(self, gin: str) -> Dict[str, Any]:
+    def _create_synthetic_product(self, gin: str, category: str) -> Dict[str, Any]:
         """Create enhanced synthetic product entry with ruleset context"""
-        category = self.gin_categories.get(gin, 'Unknown')
         sources = self.gin_sources.get(gin, [])
         
         # Analyze sources to extract context
@@ -322,18 +484,7 @@ class PowerSourceMasterExtractor:
         
         # Generate enhanced name based on category and context
         if gin.startswith('F000'):
-            name_map = {
-                'F000000007': 'No Feeder Available',
-                'F000000005': 'No Cooler Available', 
-                'F000000002': 'No Cooler Available',
-                'F000000003': 'No Torch Available',
-                'F000000006': 'No Torch Available',
-                'F000000008': 'No Interconnector Available',
-                'F000000009': 'No Feeder Accessory Available',
-                'F000000010': 'No Accessory Available',
-                'F000000011': 'No Connectivity Available'
-            }
-            name = name_map.get(gin, f'No {category} Available')
+            name = self.F000_NAME_MAP.get(gin, f'No {category} Available')
             description = f"SG-Integrated component placeholder - {name}. {context_info['description']}"
         else:
             # Create detailed name from context
@@ -374,27 +525,13 @@ class PowerSourceMasterExtractor:
         for source in sources:
             # Parse source format: "ruleset_{powersource_gin}_{sheet_name}"
             if source.startswith('ruleset_'):
-                parts = source.split('_', 2)
-                if len(parts) >= 3:
-                    ps_gin = parts[1]
-                    sheet_name = parts[2]
+                parts = source[8:].split('_', 1)
+                if len(parts) == 2:
+                    ps_gin, sheet_name = parts
                     
                     powersource_set.add(ps_gin)
                     sheet_types.add(sheet_name)
-                    
-                    # Map sheet names to rule types
-                    if 'Accessories' in sheet_name:
-                        rule_types.add('accessory_compatibility')
-                    elif 'Torch' in sheet_name:
-                        rule_types.add('torch_compatibility')
-                    elif 'Feeder' in sheet_name:
-                        rule_types.add('feeder_compatibility')
-                    elif 'Remote' in sheet_name:
-                        rule_types.add('remote_compatibility')
-                    elif 'Connectivity' in sheet_name or 'Interconn' in sheet_name:
-                        rule_types.add('connectivity_compatibility')
-                    else:
-                        rule_types.add('general_compatibility')
+                    rule_types.add(self._classify_sheet(sheet_name))
         
         context['powersources'] = list(powersource_set)
         context['rule_types'] = list(rule_types)
@@ -408,16 +545,25 @@ class PowerSourceMasterExtractor:
         
         return context
     
+    @classmethod
+    def _classify_sheet(cls, sheet_name: str) -> str:
+        """Map a ruleset sheet name to its rule type (cached per distinct name)"""
+        rule_type = cls._SHEET_CACHE.get(sheet_name)
+        if rule_type is None:
+            rule_type = next(
+                (rule for keyword, rule in cls._SHEET_KEYWORD_MAP if keyword in sheet_name),
+                'general_compatibility'
+            )
+            cls._SHEET_CACHE[sheet_name] = rule_type
+        return rule_type
+    
     def _generate_context_description(self, gin: str, context: Dict[str, Any]) -> str:
         """Generate descriptive text from ruleset context"""
         descriptions = []
         
         # PowerSource context
         if context['powersources']:
-            ps_names = []
-            for ps_gin in context['powersources']:
-                ps_name = self.target_powersources_names.get(ps_gin, ps_gin)
-                ps_names.append(ps_name)
+            ps_names = [self.TARGET_POWERSOURCES_NAMES.get(ps_gin, ps_gin) for ps_gin in context['powersources']]
             descriptions.append(f"Used with {', '.join(ps_names)}")
         
         # Rule type context
@@ -442,32 +588,14 @@ class PowerSourceMasterExtractor:
     
     def _generate_product_name(self, gin: str, category: str, context: Dict[str, Any]) -> str:
         """Generate meaningful product name from context"""
-        base_name = f"{category} {gin}"
-        
-        # Add descriptive suffixes based on context
-        if category == 'Remote' and 'remote_compatibility' in context.get('rule_types', []):
-            return f"Remote Control {gin}"
-        elif category == 'Torch' and 'torch_compatibility' in context.get('rule_types', []):
-            return f"Welding Torch {gin}"
-        elif category == 'Feeder' and 'feeder_compatibility' in context.get('rule_types', []):
-            return f"Wire Feeder {gin}"
-        elif category == 'Interconnector' and 'connectivity_compatibility' in context.get('rule_types', []):
-            return f"Interconnector Cable {gin}"
-        elif 'Accessory' in category:
+        # Descriptive names apply when the GIN's rule types back up its category
+        template = self.CATEGORY_NAME_TEMPLATES.get(category)
+        if template and template[0] in context.get('rule_types', []):
+            return template[1].format(gin=gin)
+        if 'Accessory' in category:
             return f"{category.replace('Accessory', ' Accessory')} {gin}"
         
-        return base_name
-    
-    @property
-    def target_powersources_names(self):
-        """Map of PowerSource GINs to names"""
-        return {
-            "0465350883": "Warrior 500i",
-            "0465350884": "Warrior 400i", 
-            "0445555880": "Warrior 750i 380-460V CE",
-            "0445250880": "Renegade ES 300i",
-            "0446200880": "Aristo 500ix"
-        }
+        return f"{category} {gin}"
     
     def create_filtered_sales_data(self):
         """Filter sales data for complete orders with PowerSource + Feeder + Cooler combo"""
@@ -476,44 +604,10 @@ class PowerSourceMasterExtractor:
         sales_file = self.base_path / "sales_data_cleaned.csv"
         
         try:
-            df = pd.read_csv(sales_file, dtype={'GIN': str, 'GIN with Zero': str})
-            logger.info(f"Loaded sales data: {df.shape}")
-            
-            # Group by order to analyze complete orders
-            orders_analysis = self._analyze_orders_for_complete_combos(df)
-            
-            # Filter for complete orders only
-            complete_orders = []
-            valid_order_ids = set()
-            
-            for order_id, order_info in orders_analysis.items():
-                if order_info['is_complete_combo']:
-                    valid_order_ids.add(order_id)
-                    complete_orders.append(order_info)
-            
-            logger.info(f"Found {len(complete_orders)} complete PowerSource + Feeder + Cooler orders")
-            
-            # Extract all records from valid orders
-            filtered_sales = []
-            for _, row in df.iterrows():
-                order_id = str(row.get('Ord_No', ''))
-                if order_id in valid_order_ids:
-                    gin_raw = str(row.get('GIN with Zero', '') or row.get('GIN', ''))
-                    gin = self.pad_gin(gin_raw)
-                    
-                    # Only include GINs from our master list
-                    if gin in self.master_gin_list:
-                        sales_record = {
-                            "order_id": order_id,
-                            "line_no": str(row.get('Line_No', '')),
-                            "gin": gin,
-                            "description": str(row.get('Descr', '')),
-                            "customer": str(row.get('Cust_nm', '')),
-                            "facility": str(row.get('Facility', '')),
-                            "warehouse": str(row.get('Whs', '')),
-                            "category": self.gin_categories.get(gin, 'Unknown')
-                        }
-                        filtered_sales.append(sales_record)
+            if pl is not None:
+                filtered_sales, valid_order_ids = self._filter_sales_with_polars(sales_file)
+            else:
+                filtered_sales, valid_order_ids = self._filter_sales_with_pandas(sales_file)
             
             logger.info(f"✅ Sales Data: {len(filtered_sales)} records from {len(valid_order_ids)} complete orders")
             
@@ -521,8 +615,8 @@ class PowerSourceMasterExtractor:
                 "metadata": {
                     "total_records": len(filtered_sales),
                     "unique_orders": len(valid_order_ids),
-                    "complete_combo_orders": len(complete_orders),
-                    "target_powersources": list(self.target_powersources),
+                    "complete_combo_orders": len(valid_order_ids),
+                    "target_powersources": self._target_list,
                     "generated_date": datetime.now().strftime("%Y-%m-%d"),
                     "source": "Filtered from sales_data_cleaned.csv - complete PowerSource+Feeder+Cooler orders only",
                     "filtering_rule": "Orders must contain PowerSource + Feeder + Cooler minimum combo"
@@ -534,135 +628,165 @@ class PowerSourceMasterExtractor:
             logger.error(f"Error processing sales data: {e}")
             return {"metadata": {"total_records": 0}, "sales_records": []}
     
-    def _analyze_orders_for_complete_combos(self, df) -> Dict[str, Dict[str, Any]]:
-        """Analyze orders to find complete PowerSource + Feeder + Cooler combos"""
-        from collections import defaultdict
-        
-        orders_analysis = defaultdict(lambda: {
-            'powersources': set(),
-            'feeders': set(), 
-            'coolers': set(),
-            'other_components': set(),
-            'total_items': 0,
-            'is_complete_combo': False
-        })
-        
-        # Group by order ID and categorize components
-        for _, row in df.iterrows():
-            order_id = str(row.get('Ord_No', ''))
-            if not order_id:
-                continue
-                
-            gin_raw = str(row.get('GIN with Zero', '') or row.get('GIN', ''))
-            gin = self.pad_gin(gin_raw)
-            
-            # Only process GINs from our master list
-            if gin not in self.master_gin_list:
-                continue
-                
-            category = self.gin_categories.get(gin, 'Unknown')
-            orders_analysis[order_id]['total_items'] += 1
-            
-            # Categorize by component type
-            if category == 'PowerSource':
-                orders_analysis[order_id]['powersources'].add(gin)
-            elif category == 'Feeder':
-                orders_analysis[order_id]['feeders'].add(gin)
-            elif category == 'Cooler':
-                orders_analysis[order_id]['coolers'].add(gin)
-            else:
-                orders_analysis[order_id]['other_components'].add(gin)
-        
-        # Determine complete combos
-        complete_count = 0
-        for order_id, analysis in orders_analysis.items():
-            # Check for complete combo: at least 1 PowerSource + 1 Feeder + 1 Cooler
-            has_powersource = len(analysis['powersources']) > 0
-            has_feeder = len(analysis['feeders']) > 0
-            has_cooler = len(analysis['coolers']) > 0
-            
-            # Special handling for integrated PowerSources (like Renegade with F000 components)
-            has_integrated_feeder = any(gin.startswith('F000') and self.gin_categories.get(gin) == 'Feeder' 
-                                      for gin in analysis['other_components'])
-            has_integrated_cooler = any(gin.startswith('F000') and self.gin_categories.get(gin) == 'Cooler' 
-                                      for gin in analysis['other_components'])
-            
-            # Accept integrated components as valid
-            if has_integrated_feeder:
-                has_feeder = True
-            if has_integrated_cooler:
-                has_cooler = True
-            
-            analysis['is_complete_combo'] = has_powersource and has_feeder and has_cooler
-            
-            if analysis['is_complete_combo']:
-                complete_count += 1
-        
-        logger.info(f"Order analysis: {len(orders_analysis)} total orders, {complete_count} complete combos")
-        logger.info(f"Complete combo rate: {(complete_count/len(orders_analysis)*100):.1f}%")
-        
-        return dict(orders_analysis)
+    def _filter_sales_with_polars(self, sales_file: Path) -> Tuple[List[Dict[str, str]], Set[str]]:
+        """Sales filtering as one lazy polars query: pad, filter, categorize, group by order"""
+        gin_with_zero = pl.col('GIN with Zero')
+        gin = (
+            pl.when(gin_with_zero.is_null() | (gin_with_zero == ''))
+            .then(pl.col('GIN'))
+            .otherwise(gin_with_zero)
+            .str.strip_chars()
+        )
+        padded = pl.when(gin.str.starts_with('F000') | (gin == '')).then(gin).otherwise(gin.str.zfill(10))
+        
+        # Only GINs from our master list take part in the analysis; every
+        # column is read as text so GINs keep their leading zeros
+        lines = (
+            pl.scan_csv(sales_file, infer_schema=False)
+            .select('Ord_No', 'Line_No', 'Descr', 'Cust_nm', 'Facility', 'Whs', _gin=padded)
+            .filter(pl.col('_gin').is_in(list(self.master_gin_list)))
+            .with_columns(_cat=pl.col('_gin').replace_strict(self.gin_categories, default='Unknown'))
+        )
+        orders = lines.group_by('Ord_No').agg(
+            is_complete_combo=pl.col('_cat').eq('PowerSource').any()
+            & pl.col('_cat').eq('Feeder').any()
+            & pl.col('_cat').eq('Cooler').any()
+        )
+        lines, orders = pl.collect_all([lines, orders])
+        
+        valid_order_ids = set(orders.filter('is_complete_combo')['Ord_No'])
+        logger.info(f"Order analysis: {orders.height} total orders, {len(valid_order_ids)} complete combos")
+        logger.info(f"Complete combo rate: {(len(valid_order_ids)/orders.height*100):.1f}%")
+        logger.info(f"Found {len(valid_order_ids)} complete PowerSource + Feeder + Cooler orders")
+        
+        # Extract all records from valid orders; missing text reads 'nan' as in the pandas records
+        text = ['Line_No', 'Descr', 'Cust_nm', 'Facility', 'Whs']
+        filtered_sales = (
+            lines.filter(pl.col('Ord_No').is_in(list(valid_order_ids)))
+            .with_columns(pl.col(text).fill_null('nan'))
+            .select(
+                order_id='Ord_No',
+                line_no='Line_No',
+                gin='_gin',
+                description='Descr',
+                customer='Cust_nm',
+                facility='Facility',
+                warehouse='Whs',
+                category='_cat'
+            )
+            .to_dicts()
+        )
+        return filtered_sales, valid_order_ids
+    
+    def _filter_sales_with_pandas(self, sales_file: Path) -> Tuple[List[Dict[str, str]], Set[str]]:
+        """Sales filtering with pandas when polars is not installed"""
+        # Only the columns the analysis and records use; the low-cardinality
+        # text columns are loaded as categoricals
+        df = pd.read_csv(
+            sales_file,
+            engine=CSV_ENGINE,
+            usecols=['Ord_No', 'Line_No', 'GIN', 'GIN with Zero', 'Descr', 'Cust_nm', 'Facility', 'Whs'],
+            dtype={'GIN': GIN_DTYPE, 'GIN with Zero': GIN_DTYPE,
+                   'Cust_nm': 'category', 'Facility': 'category', 'Whs': 'category'}
+        )
+        logger.info(f"Loaded sales data: {df.shape}")
+        
+        # Padded GIN per sales line; GIN with Zero falls back to GIN when blank
+        gin_with_zero = df['GIN with Zero']
+        gin_raw = gin_with_zero.where(gin_with_zero.notna() & (gin_with_zero != ''), df['GIN'])
+        df['_gin'] = self.pad_gin_series(gin_raw)
+        
+        # Only GINs from our master list take part in the analysis
+        df = df[df['_gin'].isin(self.master_gin_list)].copy()
+        df['_order'] = df['Ord_No'].map(str)
+        df['_cat'] = self._categories_for(df['_gin'])
+        
+        # Group by order to find complete orders
+        is_complete_combo = self._analyze_orders_for_complete_combos(df)
+        valid_order_ids = set(is_complete_combo.index[is_complete_combo])
+        
+        logger.info(f"Found {len(valid_order_ids)} complete PowerSource + Feeder + Cooler orders")
+        
+        # Extract all records from valid orders
+        sales = df[df['_order'].isin(valid_order_ids)]
+        filtered_sales = pd.DataFrame({
+            "order_id": sales['_order'],
+            "line_no": sales['Line_No'].astype(object).map(str),
+            "gin": sales['_gin'],
+            "description": sales['Descr'].astype(object).map(str),
+            "customer": sales['Cust_nm'].astype(object).map(str),
+            "facility": sales['Facility'].astype(object).map(str),
+            "warehouse": sales['Whs'].astype(object).map(str),
+            "category": sales['_cat']
+        }).to_dict(orient='records')
+        return filtered_sales, valid_order_ids
+    
+    def _analyze_orders_for_complete_combos(self, df: pd.DataFrame) -> pd.Series:
+        """Flag orders holding a complete PowerSource + Feeder + Cooler combo.
+        
+        Expects master-list sales lines with the order id in `_order` and the GIN
+        category in `_cat`; returns a boolean Series indexed by order id.
+        """
+        # Which component categories each order contains. F000 placeholders for
+        # integrated feeders/coolers (e.g. Renegade) carry the Feeder/Cooler
+        # category themselves, so they count towards the combo directly.
+        present = pd.crosstab(df['_order'], df['_cat']).astype(bool)
+        present = present.reindex(columns=['PowerSource', 'Feeder', 'Cooler'], fill_value=False)
+        is_complete_combo = present.all(axis=1)
+        
+        complete_count = int(is_complete_combo.sum())
+        logger.info(f"Order analysis: {len(is_complete_combo)} total orders, {complete_count} complete combos")
+        logger.info(f"Complete combo rate: {(complete_count/len(is_complete_combo)*100):.1f}%")
+        
+        return is_complete_combo
     
     def create_filtered_golden_packages(self):
         """Filter golden packages for target PowerSources"""
         logger.info("🏆 Filtering Golden Packages...")
         
-        golden_file = self.base_path / "golden_pkg_format_V2.xlsx"
-        
         try:
-            df = pd.read_excel(golden_file, sheet_name='Sheet1')
+            df = self._load_golden()
+            
+            # (component, GIN column, name column) for every component of a package
+            components = [
+                ('feeder', 'feeder gin', 'feeder name'),
+                ('cooler', 'cooler gin', 'cooler name'),
+                ('interconnector', 'Interconn GIN', 'Interconn name'),
+                ('torch', 'torches gin', 'torches name'),
+                ('power_accessory', 'power accessories gin', 'power accessories name'),
+                ('feeder_accessory', 'feeder accessories gin', 'feeder accessories name'),
+                ('cooler_accessory', 'GIN Cooler Accessories', 'Cooler Accessories Name')
+            ]
+            gin_columns = ['powersource gin'] + [gin_col for _, gin_col, _ in components]
+            name_columns = [name_col for _, _, name_col in components]
+            
+            # Pad GINs ("" when blank) and clean names once, then keep target packages
+            packages = df.reindex(columns=['powersource gin', 'powersource name'] + gin_columns[1:] + name_columns)
+            packages[gin_columns] = packages[gin_columns].apply(self.pad_gin_series)
+            packages[name_columns] = packages[name_columns].astype('string').fillna('')
+            packages = packages[packages['powersource gin'].isin(self._target_list)]
             
             filtered_packages = []
             
-            for idx, row in df.iterrows():
-                ps_gin = self.pad_gin(row.get('powersource gin', ''))
-                if ps_gin in self.target_powersources:
-                    package = {
-                        "package_id": idx + 1,
-                        "powersource_gin": ps_gin,
-                        "powersource_name": str(row.get('powersource name', '')),
-                        "components": {}
-                    }
-                    
-                    # Map all component columns
-                    component_mappings = {
-                        'feeder_gin': row.get('feeder gin', ''),
-                        'feeder_name': row.get('feeder name', ''),
-                        'cooler_gin': row.get('cooler gin', ''),
-                        'cooler_name': row.get('cooler name', ''),
-                        'interconnector_gin': row.get('Interconn GIN', ''),
-                        'interconnector_name': row.get('Interconn name', ''),
-                        'torch_gin': row.get('torches gin', ''),
-                        'torch_name': row.get('torches name', ''),
-                        'power_accessory_gin': row.get('power accessories gin', ''),
-                        'power_accessory_name': row.get('power accessories name', ''),
-                        'feeder_accessory_gin': row.get('feeder accessories gin', ''),
-                        'feeder_accessory_name': row.get('feeder accessories name', ''),
-                        'cooler_accessory_gin': row.get('GIN Cooler Accessories', ''),
-                        'cooler_accessory_name': row.get('Cooler Accessories Name', '')
+            for idx, ps_gin, ps_name, *cells in packages.itertuples(name=None):
+                gins, names = cells[:len(components)], cells[len(components):]
+                filtered_packages.append({
+                    "package_id": idx + 1,
+                    "powersource_gin": ps_gin,
+                    "powersource_name": str(ps_name),
+                    "components": {
+                        comp_name: {"gin": gin, "name": name}
+                        for (comp_name, _, _), gin, name in zip(components, gins, names)
+                        if gin
                     }
-                    
-                    for comp_type, value in component_mappings.items():
-                        if pd.notna(value) and str(value).strip():
-                            if comp_type.endswith('_gin'):
-                                comp_name = comp_type.replace('_gin', '')
-                                gin = self.pad_gin(value)
-                                name = component_mappings.get(f"{comp_name}_name", "")
-                                
-                                if gin:
-                                    package["components"][comp_name] = {
-                                        "gin": gin,
-                                        "name": str(name) if pd.notna(name) else ""
-                                    }
-                    
-                    filtered_packages.append(package)
+                })
             
             logger.info(f"✅ Golden Packages: {len(filtered_packages)} packages for target PowerSources")
             
             return {
                 "metadata": {
                     "total_packages": len(filtered_packages),
-                    "target_powersources": list(self.target_powersources),
+                    "target_powersources": self._target_list,
                     "generated_date": datetime.now().strftime("%Y-%m-%d"),
                     "source": "Filtered from golden_pkg_format_V2.xlsx"
                 },
@@ -686,7 +810,7 @@ class PowerSourceMasterExtractor:
         except Exception as e:
             logger.error(f"Failed to load PowerSource config: {e}")
             return {
-                "metadata": {"total_rules": 0, "target_powersources": list(self.target_powersources), 
+                "metadata": {"total_rules": 0, "target_powersources": self._target_list, 
                            "generated_date": datetime.now().strftime("%Y-%m-%d"), "source": "Error loading config"},
                 "compatibility_rules": []
             }
@@ -694,7 +818,7 @@ class PowerSourceMasterExtractor:
         compatibility_rules = []
         total_rules = 0
         
-        for powersource_gin in self.target_powersources:
+        for powersource_gin in self._target_list:
             if powersource_gin in powersource_names:
                 powersource_name = powersource_names[powersource_gin]
                 logger.info(f"  Processing PowerSource: {powersource_gin} ({powersource_name})")
@@ -718,7 +842,7 @@ class PowerSourceMasterExtractor:
         return {
             "metadata": {
                 "total_rules": total_rules,
-                "target_powersources": list(self.target_powersources),
+                "target_powersources": self._target_list,
                 "generated_date": datetime.now().strftime("%Y-%m-%d"),
                 "source": "Extracted from ruleset Excel files"
             },
@@ -762,17 +886,9 @@ class PowerSourceMasterExtractor:
         rules = []
         
         try:
-            # Process Init sheet (PowerSource -> Feeder/Cooler rules)
-            try:
-                init_df = pd.read_excel(excel_file, sheet_name='Init')
-                init_rules = self._process_init_sheet(init_df, powersource_gin, powersource_name)
-                rules.extend(init_rules)
-                logger.info(f"      Init sheet: {len(init_rules)} rules")
-            except Exception as e:
-                logger.warning(f"      Could not process Init sheet: {e}")
-            
-            # Process other compatibility sheets
+            # Init sheet (PowerSource -> Feeder/Cooler rules) first, then the other compatibility sheets
             sheet_processors = {
+                'Init': self._process_init_sheet,
                 'Interconn': self._process_interconn_sheet,
                 'Torches': self._process_torch_sheet,
                 'Powersource Accessories': self._process_power_accessory_sheet,
@@ -781,10 +897,16 @@ class PowerSourceMasterExtractor:
                 'Connectivity': self._process_connectivity_sheet
             }
             
+            # Open the workbook once and parse only the sheets we have processors for
+            with pd.ExcelFile(excel_file, engine=EXCEL_ENGINE) as workbook:
+                sheet_names = [name for name in workbook.sheet_names if name in sheet_processors]
+                sheets = workbook.parse(sheet_name=sheet_names)
+            
             for sheet_name, processor in sheet_processors.items():
                 try:
-                    df = pd.read_excel(excel_file, sheet_name=sheet_name)
-                    sheet_rules = processor(df, powersource_gin, powersource_name)
+                    if sheet_name not in sheets:
+                        raise ValueError(f"Worksheet named '{sheet_name}' not found")
+                    sheet_rules = processor(sheets[sheet_name], powersource_gin, powersource_name)
                     rules.extend(sheet_rules)
                     logger.info(f"      {sheet_name} sheet: {len(sheet_rules)} rules")
                 except Exception as e:
@@ -795,263 +917,260 @@ class PowerSourceMasterExtractor:
         
         return rules
     
+    def _sheet_gins(self, column: pd.Series) -> pd.Series:
+        """Padded GIN per sheet row; blank cells read 'nan' (any PowerSource / no component)"""
+        return self.pad_gin_series(column).mask(column.isna(), 'nan')
+    
+    def _valid_gin_mask(self, gins: pd.Series) -> pd.Series:
+        """Valid padded sheet GINs: not empty, blank ('nan') or 'none'"""
+        return (gins != '') & (gins != 'nan') & (gins.str.lower() != 'none')
+    
+    def _optional_gins(self, gins: pd.Series) -> pd.Series:
+        """Context GINs with invalid entries as None"""
+        return gins.astype(object).where(self._valid_gin_mask(gins), None)
+    
+    def _priorities(self, df: pd.DataFrame) -> pd.Series:
+        """Priorities column, defaulting to 1 when the sheet has none"""
+        return df['Priorities'] if 'Priorities' in df else pd.Series(1, index=df.index)
+    
     def _process_init_sheet(self, init_df: pd.DataFrame, powersource_gin: str, powersource_name: str) -> List[Dict]:
         """Process Init sheet - PowerSource DETERMINES Feeder/Cooler"""
         rules = []
         
-        for _, row in init_df.iterrows():
-            try:
-                power_gin = self.pad_gin(str(row['GIN Powersource']).strip())
-                feeder_gin = self.pad_gin(str(row['GIN Feeder']).strip())
-                cooler_gin = self.pad_gin(str(row['GIN Cooler']).strip())
-                
-                # Only include rules for our target PowerSource or if power_gin matches
-                if power_gin == powersource_gin or power_gin == 'nan':
-                    
-                    # PowerSource -> Feeder rule
-                    if self._is_valid_gin(feeder_gin):
-                        rules.append({
-                            "rule_id": f"{powersource_gin}_determines_feeder_{feeder_gin}",
-                            "rule_type": "DETERMINES",
-                            "source_gin": powersource_gin,
-                            "target_gin": feeder_gin,
-                            "source_category": "PowerSource", 
-                            "target_category": "Feeder",
-                            "relationship": "determines",
-                            "priority": 1,
-                            "confidence": 1.0,
-                            "source_file": powersource_name,
-                            "sheet_name": "Init"
-                        })
-                    
-                    # PowerSource -> Cooler rule  
-                    if self._is_valid_gin(cooler_gin):
-                        rules.append({
-                            "rule_id": f"{powersource_gin}_determines_cooler_{cooler_gin}",
-                            "rule_type": "DETERMINES",
-                            "source_gin": powersource_gin,
-                            "target_gin": cooler_gin,
-                            "source_category": "PowerSource",
-                            "target_category": "Cooler", 
-                            "relationship": "determines",
-                            "priority": 1,
-                            "confidence": 1.0,
-                            "source_file": powersource_name,
-                            "sheet_name": "Init"
-                        })
-                        
-            except Exception as e:
-                logger.warning(f"Error processing Init rule: {e}")
+        power = self._sheet_gins(init_df['GIN Powersource'])
+        feeder = self._sheet_gins(init_df['GIN Feeder'])
+        cooler = self._sheet_gins(init_df['GIN Cooler'])
+        
+        # Only include rules for our target PowerSource or if power_gin matches
+        applies = (power == powersource_gin) | (power == 'nan')
+        rows = pd.DataFrame({
+            'feeder': feeder, 'feeder_ok': self._valid_gin_mask(feeder),
+            'cooler': cooler, 'cooler_ok': self._valid_gin_mask(cooler)
+        })[applies]
+        
+        for feeder_gin, feeder_ok, cooler_gin, cooler_ok in rows.itertuples(index=False, name=None):
+            # PowerSource -> Feeder rule
+            if feeder_ok:
+                rules.append({
+                    "rule_id": f"{powersource_gin}_determines_feeder_{feeder_gin}",
+                    "rule_type": "DETERMINES",
+                    "source_gin": powersource_gin,
+                    "target_gin": feeder_gin,
+                    "source_category": "PowerSource", 
+                    "target_category": "Feeder",
+                    "relationship": "determines",
+                    "priority": 1,
+                    "confidence": 1.0,
+                    "source_file": powersource_name,
+                    "sheet_name": "Init"
+                })
+            
+            # PowerSource -> Cooler rule  
+            if cooler_ok:
+                rules.append({
+                    "rule_id": f"{powersource_gin}_determines_cooler_{cooler_gin}",
+                    "rule_type": "DETERMINES",
+                    "source_gin": powersource_gin,
+                    "target_gin": cooler_gin,
+                    "source_category": "PowerSource",
+                    "target_category": "Cooler", 
+                    "relationship": "determines",
+                    "priority": 1,
+                    "confidence": 1.0,
+                    "source_file": powersource_name,
+                    "sheet_name": "Init"
+                })
         
         return rules
     
     def _process_interconn_sheet(self, interconn_df: pd.DataFrame, powersource_gin: str, powersource_name: str) -> List[Dict]:
         """Process Interconn sheet - context-dependent interconnector compatibility"""
-        rules = []
-        
-        for _, row in interconn_df.iterrows():
-            try:
-                power_gin = self.pad_gin(str(row['GIN Powersource']).strip())
-                feeder_gin = self.pad_gin(str(row['GIN Feeder']).strip())
-                cooler_gin = self.pad_gin(str(row['GIN Cooler']).strip())
-                interconn_gin = self.pad_gin(str(row['GIN Interconn']).strip())
-                priority = row.get('Priorities', 1)
-                
-                # Only include rules for our target PowerSource
-                if power_gin == powersource_gin or power_gin == 'nan':
-                    if self._is_valid_gin(interconn_gin):
-                        rules.append({
-                            "rule_id": f"{powersource_gin}_interconn_{interconn_gin}",
-                            "rule_type": "COMPATIBLE_WITH",
-                            "source_gin": interconn_gin,
-                            "target_gin": powersource_gin,
-                            "source_category": "Interconnector",
-                            "target_category": "PowerSource",
-                            "relationship": "compatible_with",
-                            "priority": priority,
-                            "confidence": 0.9,
-                            "context": {
-                                "requires_feeder": feeder_gin if self._is_valid_gin(feeder_gin) else None,
-                                "requires_cooler": cooler_gin if self._is_valid_gin(cooler_gin) else None
-                            },
-                            "source_file": powersource_name,
-                            "sheet_name": "Interconn"
-                        })
-                        
-            except Exception as e:
-                logger.warning(f"Error processing Interconn rule: {e}")
-        
-        return rules
+        power = self._sheet_gins(interconn_df['GIN Powersource'])
+        feeder = self._sheet_gins(interconn_df['GIN Feeder'])
+        cooler = self._sheet_gins(interconn_df['GIN Cooler'])
+        interconn = self._sheet_gins(interconn_df['GIN Interconn'])
+        
+        # Only include rules for our target PowerSource
+        applies = ((power == powersource_gin) | (power == 'nan')) & self._valid_gin_mask(interconn)
+        rows = pd.DataFrame({
+            'interconn': interconn, 'priority': self._priorities(interconn_df),
+            'feeder': self._optional_gins(feeder),
+            'cooler': self._optional_gins(cooler)
+        }, dtype=object)[applies]
+        
+        return [
+            {
+                "rule_id": f"{powersource_gin}_interconn_{interconn_gin}",
+                "rule_type": "COMPATIBLE_WITH",
+                "source_gin": interconn_gin,
+                "target_gin": powersource_gin,
+                "source_category": "Interconnector",
+                "target_category": "PowerSource",
+                "relationship": "compatible_with",
+                "priority": priority,
+                "confidence": 0.9,
+                "context": {
+                    "requires_feeder": feeder_gin,
+                    "requires_cooler": cooler_gin
+                },
+                "source_file": powersource_name,
+                "sheet_name": "Interconn"
+            }
+            for interconn_gin, priority, feeder_gin, cooler_gin in rows.itertuples(index=False, name=None)
+        ]
     
     def _process_torch_sheet(self, torch_df: pd.DataFrame, powersource_gin: str, powersource_name: str) -> List[Dict]:
         """Process Torches sheet - torch compatibility"""
-        rules = []
-        
-        for _, row in torch_df.iterrows():
-            try:
-                feeder_gin = self.pad_gin(str(row['GIN Feeder']).strip())
-                cooler_gin = self.pad_gin(str(row['GIN Cooler']).strip()) 
-                torch_gin = self.pad_gin(str(row['GIN Torches']).strip())
-                priority = row.get('Priorities', 1)
-                
-                if self._is_valid_gin(torch_gin):
-                    rules.append({
-                        "rule_id": f"{powersource_gin}_torch_{torch_gin}",
-                        "rule_type": "COMPATIBLE_WITH",
-                        "source_gin": torch_gin,
-                        "target_gin": powersource_gin,
-                        "source_category": "Torch",
-                        "target_category": "PowerSource", 
-                        "relationship": "compatible_with",
-                        "priority": priority,
-                        "confidence": 0.8,
-                        "context": {
-                            "requires_feeder": feeder_gin if self._is_valid_gin(feeder_gin) else None,
-                            "requires_cooler": cooler_gin if self._is_valid_gin(cooler_gin) else None
-                        },
-                        "source_file": powersource_name,
-                        "sheet_name": "Torches"
-                    })
-                    
-            except Exception as e:
-                logger.warning(f"Error processing Torch rule: {e}")
-        
-        return rules
+        feeder = self._sheet_gins(torch_df['GIN Feeder'])
+        cooler = self._sheet_gins(torch_df['GIN Cooler'])
+        torch = self._sheet_gins(torch_df['GIN Torches'])
+        
+        rows = pd.DataFrame({
+            'torch': torch, 'priority': self._priorities(torch_df),
+            'feeder': self._optional_gins(feeder),
+            'cooler': self._optional_gins(cooler)
+        }, dtype=object)[self._valid_gin_mask(torch)]
+        
+        return [
+            {
+                "rule_id": f"{powersource_gin}_torch_{torch_gin}",
+                "rule_type": "COMPATIBLE_WITH",
+                "source_gin": torch_gin,
+                "target_gin": powersource_gin,
+                "source_category": "Torch",
+                "target_category": "PowerSource", 
+                "relationship": "compatible_with",
+                "priority": priority,
+                "confidence": 0.8,
+                "context": {
+                    "requires_feeder": feeder_gin,
+                    "requires_cooler": cooler_gin
+                },
+                "source_file": powersource_name,
+                "sheet_name": "Torches"
+            }
+            for torch_gin, priority, feeder_gin, cooler_gin in rows.itertuples(index=False, name=None)
+        ]
     
     def _process_power_accessory_sheet(self, df: pd.DataFrame, powersource_gin: str, powersource_name: str) -> List[Dict]:
         """Process Power Source Accessories sheet"""
-        rules = []
-        
-        for _, row in df.iterrows():
-            try:
-                power_gin = self.pad_gin(str(row['GIN Powersource']).strip())
-                accessory_gin = self.pad_gin(str(row['GIN Powersource Accessories']).strip())
-                priority = row.get('Priorities', 1)
-                
-                # Only include rules for our target PowerSource
-                if (power_gin == powersource_gin or power_gin == 'nan') and self._is_valid_gin(accessory_gin):
-                    rules.append({
-                        "rule_id": f"{powersource_gin}_power_accessory_{accessory_gin}",
-                        "rule_type": "COMPATIBLE_WITH",
-                        "source_gin": powersource_gin,
-                        "target_gin": accessory_gin,
-                        "source_category": "PowerSource",
-                        "target_category": "Power Accessory",
-                        "relationship": "compatible_with",
-                        "priority": priority,
-                        "confidence": 0.7,
-                        "source_file": powersource_name,
-                        "sheet_name": "Powersource Accessories"
-                    })
-                    
-            except Exception as e:
-                logger.warning(f"Error processing Power Accessory rule: {e}")
-        
-        return rules
+        power = self._sheet_gins(df['GIN Powersource'])
+        accessory = self._sheet_gins(df['GIN Powersource Accessories'])
+        
+        # Only include rules for our target PowerSource
+        applies = ((power == powersource_gin) | (power == 'nan')) & self._valid_gin_mask(accessory)
+        rows = pd.DataFrame({'accessory': accessory, 'priority': self._priorities(df)}, dtype=object)[applies]
+        
+        return [
+            {
+                "rule_id": f"{powersource_gin}_power_accessory_{accessory_gin}",
+                "rule_type": "COMPATIBLE_WITH",
+                "source_gin": powersource_gin,
+                "target_gin": accessory_gin,
+                "source_category": "PowerSource",
+                "target_category": "Power Accessory",
+                "relationship": "compatible_with",
+                "priority": priority,
+                "confidence": 0.7,
+                "source_file": powersource_name,
+                "sheet_name": "Powersource Accessories"
+            }
+            for accessory_gin, priority in rows.itertuples(index=False, name=None)
+        ]
     
     def _process_feeder_accessory_sheet(self, df: pd.DataFrame, powersource_gin: str, powersource_name: str) -> List[Dict]:
         """Process Feeder Accessories sheet"""
-        rules = []
-        
-        for _, row in df.iterrows():
-            try:
-                feeder_gin = self.pad_gin(str(row['GIN Feeder']).strip())
-                accessory_gin = self.pad_gin(str(row['GIN Feeder Accessories']).strip())
-                priority = row.get('Priorities', 1) if 'Priorities' in row else 1
-                
-                if self._is_valid_gin(feeder_gin) and self._is_valid_gin(accessory_gin):
-                    rules.append({
-                        "rule_id": f"{feeder_gin}_feeder_accessory_{accessory_gin}",
-                        "rule_type": "COMPATIBLE_WITH", 
-                        "source_gin": feeder_gin,
-                        "target_gin": accessory_gin,
-                        "source_category": "Feeder",
-                        "target_category": "Feeder Accessory",
-                        "relationship": "compatible_with",
-                        "priority": priority,
-                        "confidence": 0.7,
-                        "context": {"powersource_gin": powersource_gin},
-                        "source_file": powersource_name,
-                        "sheet_name": "Feeder Accessories"
-                    })
-                    
-            except Exception as e:
-                logger.warning(f"Error processing Feeder Accessory rule: {e}")
-        
-        return rules
+        feeder = self._sheet_gins(df['GIN Feeder'])
+        accessory = self._sheet_gins(df['GIN Feeder Accessories'])
+        
+        applies = self._valid_gin_mask(feeder) & self._valid_gin_mask(accessory)
+        rows = pd.DataFrame({
+            'feeder': feeder, 'accessory': accessory, 'priority': self._priorities(df)
+        }, dtype=object)[applies]
+        
+        return [
+            {
+                "rule_id": f"{feeder_gin}_feeder_accessory_{accessory_gin}",
+                "rule_type": "COMPATIBLE_WITH", 
+                "source_gin": feeder_gin,
+                "target_gin": accessory_gin,
+                "source_category": "Feeder",
+                "target_category": "Feeder Accessory",
+                "relationship": "compatible_with",
+                "priority": priority,
+                "confidence": 0.7,
+                "context": {"powersource_gin": powersource_gin},
+                "source_file": powersource_name,
+                "sheet_name": "Feeder Accessories"
+            }
+            for feeder_gin, accessory_gin, priority in rows.itertuples(index=False, name=None)
+        ]
     
     def _process_remote_sheet(self, df: pd.DataFrame, powersource_gin: str, powersource_name: str) -> List[Dict]:
         """Process Remotes sheet"""
-        rules = []
-        
-        for _, row in df.iterrows():
-            try:
-                power_gin = self.pad_gin(str(row['GIN Powersource']).strip())
-                feeder_gin = self.pad_gin(str(row['GIN Feeder']).strip())
-                remote_gin = self.pad_gin(str(row['GIN Remotes']).strip())
-                priority = row.get('Priorities', 1)
-                
-                # Only include rules for our target PowerSource
-                if (power_gin == powersource_gin or power_gin == 'nan') and self._is_valid_gin(remote_gin):
-                    rules.append({
-                        "rule_id": f"{powersource_gin}_remote_{remote_gin}",
-                        "rule_type": "COMPATIBLE_WITH",
-                        "source_gin": remote_gin,
-                        "target_gin": powersource_gin,
-                        "source_category": "Remote",
-                        "target_category": "PowerSource",
-                        "relationship": "compatible_with", 
-                        "priority": priority,
-                        "confidence": 0.7,
-                        "context": {
-                            "requires_feeder": feeder_gin if self._is_valid_gin(feeder_gin) else None
-                        },
-                        "source_file": powersource_name,
-                        "sheet_name": "Remotes"
-                    })
-                    
-            except Exception as e:
-                logger.warning(f"Error processing Remote rule: {e}")
-        
-        return rules
+        power = self._sheet_gins(df['GIN Powersource'])
+        feeder = self._sheet_gins(df['GIN Feeder'])
+        remote = self._sheet_gins(df['GIN Remotes'])
+        
+        # Only include rules for our target PowerSource
+        applies = ((power == powersource_gin) | (power == 'nan')) & self._valid_gin_mask(remote)
+        rows = pd.DataFrame({
+            'remote': remote, 'priority': self._priorities(df),
+            'feeder': self._optional_gins(feeder)
+        }, dtype=object)[applies]
+        
+        return [
+            {
+                "rule_id": f"{powersource_gin}_remote_{remote_gin}",
+                "rule_type": "COMPATIBLE_WITH",
+                "source_gin": remote_gin,
+                "target_gin": powersource_gin,
+                "source_category": "Remote",
+                "target_category": "PowerSource",
+                "relationship": "compatible_with", 
+                "priority": priority,
+                "confidence": 0.7,
+                "context": {
+                    "requires_feeder": feeder_gin
+                },
+                "source_file": powersource_name,
+                "sheet_name": "Remotes"
+            }
+            for remote_gin, priority, feeder_gin in rows.itertuples(index=False, name=None)
+        ]
     
     def _process_connectivity_sheet(self, df: pd.DataFrame, powersource_gin: str, powersource_name: str) -> List[Dict]:
         """Process Connectivity sheet"""
-        rules = []
-        
-        for _, row in df.iterrows():
-            try:
-                power_gin = self.pad_gin(str(row['GIN Powersource']).strip())
-                feeder_gin = self.pad_gin(str(row['GIN Feeder']).strip())
-                connectivity_gin = self.pad_gin(str(row['GIN Connectivity']).strip())
-                
-                # Only include rules for our target PowerSource
-                if (power_gin == powersource_gin or power_gin == 'nan') and self._is_valid_gin(connectivity_gin):
-                    rules.append({
-                        "rule_id": f"{powersource_gin}_connectivity_{connectivity_gin}",
-                        "rule_type": "COMPATIBLE_WITH",
-                        "source_gin": connectivity_gin,
-                        "target_gin": powersource_gin,
-                        "source_category": "Connectivity",
-                        "target_category": "PowerSource",
-                        "relationship": "compatible_with",
-                        "priority": 1,
-                        "confidence": 0.6,
-                        "context": {
-                            "requires_feeder": feeder_gin if self._is_valid_gin(feeder_gin) else None
-                        },
-                        "source_file": powersource_name,
-                        "sheet_name": "Connectivity"
-                    })
-                    
-            except Exception as e:
-                logger.warning(f"Error processing Connectivity rule: {e}")
-        
-        return rules
-    
-    def _is_valid_gin(self, gin: str) -> bool:
-        """Check if GIN is valid (not nan, empty, or null)"""
-        return gin and gin != 'nan' and gin.strip() != '' and gin.lower() != 'none'
+        power = self._sheet_gins(df['GIN Powersource'])
+        feeder = self._sheet_gins(df['GIN Feeder'])
+        connectivity = self._sheet_gins(df['GIN Connectivity'])
+        
+        # Only include rules for our target PowerSource
+        applies = ((power == powersource_gin) | (power == 'nan')) & self._valid_gin_mask(connectivity)
+        rows = pd.DataFrame({
+            'connectivity': connectivity,
+            'feeder': self._optional_gins(feeder)
+        }, dtype=object)[applies]
+        
+        return [
+            {
+                "rule_id": f"{powersource_gin}_connectivity_{connectivity_gin}",
+                "rule_type": "COMPATIBLE_WITH",
+                "source_gin": connectivity_gin,
+                "target_gin": powersource_gin,
+                "source_category": "Connectivity",
+                "target_category": "PowerSource",
+                "relationship": "compatible_with",
+                "priority": 1,
+                "confidence": 0.6,
+                "context": {
+                    "requires_feeder": feeder_gin
+                },
+                "source_file": powersource_name,
+                "sheet_name": "Connectivity"
+            }
+            for connectivity_gin, feeder_gin in rows.itertuples(index=False, name=None)
+        ]
     
     def generate_master_datasets(self) -> Dict[str, Any]:
         """Generate all 4 master datasets"""
@@ -1093,8 +1212,15 @@ class PowerSourceMasterExtractor:
         
         for filename, data in datasets.items():
             file_path = output_dir / filename
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                # orjson writes UTF-8 bytes directly and serializes numpy scalars
+                # (e.g. sheet priorities) without a custom encoder
+                file_path.write_bytes(orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                ))
+            else:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
             logger.info(f"💾 Saved: {file_path}")
         
         # Summary
@@ -524,7 +524,7 @@ class DatabaseLoader:
                     # Run migration for all products
                     result = await migration_service.migrate_products(
                         skip_existing=True,  # Don't regenerate existing embeddings
-                        batch_size=20       # Process in batches for efficiency
+                        batch_size=500      # Rows per server-side write transaction
                     )
                     
                     # Log results
@@ -468,7 +468,8 @@ class ProductLoader(BaseLoader):
             "CREATE INDEX product_gin_index IF NOT EXISTS FOR (p:Product) ON (p.gin)",
             "CREATE INDEX product_category_index IF NOT EXISTS FOR (p:Product) ON (p.category)",
             "CREATE INDEX product_name_index IF NOT EXISTS FOR (p:Product) ON (p.name)",
-            "CREATE INDEX product_available_index IF NOT EXISTS FOR (p:Product) ON (p.is_available)"
+            "CREATE INDEX product_available_index IF NOT EXISTS FOR (p:Product) ON (p.is_available)",
+            "CREATE FULLTEXT INDEX product_name_fulltext IF NOT EXISTS FOR (p:Product) ON EACH [p.name]"
         ]
         
         with self.neo4j_driver.session(database=self.neo4j_database) as session:
@@ -478,6 +479,12 @@ class ProductLoader(BaseLoader):
                     self.logger.info(f"Created index: {index_query}")
                 except Exception as e:
                     self.logger.warning(f"Index creation failed: {e}")
+            
+            # Search queries the full-text index directly; don't finish loading while it is still POPULATING
+            try:
+                session.run("CALL db.awaitIndex('product_name_fulltext', 300)")
+            except Exception as e:
+                self.logger.warning(f"Full-text index did not come online: {e}")
     
     def cleanup_old_data(self, backup_first: bool = True):
         """